@@ -0,0 +1,190 @@
+// Generated by `python -m i18n_sync compile` from i18n/locales/en/translation.json. Do not edit.
+
+import type { TranslationKey } from './keys';
+
+const en: Readonly<Record<TranslationKey, string>> = Object.freeze({
+  "access_denied": "Access Denied",
+  "add_delivery_address": "Add delivery address",
+  "add_dish": "Add dish",
+  "added_to_cart": "{{name}} added to cart!",
+  "address_correct_check": "Please ensure your address is correct. Delivery fee: {{fee}}",
+  "address_required": "Please enter your street address",
+  "address_saved": "Delivery address saved!",
+  "already_called": "Waiter already called. Please wait...",
+  "apartment_floor": "Apartment / Floor (Optional)",
+  "apartment_placeholder": "e.g., Apt 4B, 2nd Floor",
+  "apply": "Apply",
+  "back_to_menu": "Back to menu",
+  "broadcast": "Broadcast",
+  "browse_menu": "Browse Menu",
+  "cancel": "Cancel",
+  "cart": "Cart",
+  "cart_empty": "Your cart is empty",
+  "cart_empty_msg": "Add some delicious items from the menu to start your order!",
+  "cash_on_delivery": "Cash on Delivery",
+  "checkout": "Checkout",
+  "city": "City",
+  "city_placeholder": "Enter city",
+  "clear": "Clear",
+  "clear_cart": "Clear Cart",
+  "clear_cart_confirm": "Remove all items?",
+  "confirm_order": "Confirm Order",
+  "contact_phone": "Contact Phone",
+  "coupon_applied": "Coupon \"{{coupon}}\" applied! Discount: {{discount}}",
+  "currency": "",
+  "current_orders": "Current Orders",
+  "customer_feedback": "Customer Feedback",
+  "delivery": "Delivery",
+  "delivery_address": "Delivery Address",
+  "delivery_fee": "Delivery Fee",
+  "delivery_instructions": "Delivery Instructions (Optional)",
+  "developed_by": "Developed by Nhiquela Servicos e Consultoria, LDA",
+  "dine_in": "Dine-in",
+  "discount": "Discount",
+  "dish_name": "Dish name",
+  "emola": "e-Mola",
+  "emotion_angry": "Angry",
+  "emotion_happy": "Happy",
+  "emotion_love": "Love it",
+  "emotion_neutral": "Okay",
+  "emotion_sad": "Sad",
+  "empty_cart": "Empty Cart",
+  "error": "Error",
+  "error_add_item": "Error adding item",
+  "error_checkout_generic": "Something went wrong. Please try again.",
+  "error_loading_order": "Error loading order.",
+  "error_remove_item": "Error removing item",
+  "error_validating_code": "Error validating code",
+  "estimated_ready": "Estimated Ready",
+  "experience_question": "How was your experience?",
+  "failed_action": "Action failed",
+  "failed_feedback": "Failed to submit feedback",
+  "failed_place_order": "Failed to place order. Please try again.",
+  "failed_to_load": "Failed to load",
+  "feedback_help_msg": "It helps us improve our service.",
+  "feedback_placeholder": "Leave a comment (optional)...",
+  "feedback_sent": "Feedback sent! Thank you.",
+  "feedback_submitted": "Your feedback has been submitted",
+  "feedback_thanks": "Thanks for your feedback!",
+  "feedback_title": "Feedback",
+  "fill_name_price": "Fill in name and price!",
+  "filter_all": "All",
+  "have_coupon": "Have a coupon?",
+  "hours_ago": "{{count}}h {{minutes}}m ago",
+  "how_was_experience": "How was your experience?",
+  "in_progress": "In progress",
+  "incomplete": "Incomplete",
+  "incomplete_feedback_msg": "Please select emotions and rating",
+  "instructions_placeholder": "e.g., Ring doorbell, Leave at gate, etc.",
+  "invalid_phone": "Invalid Phone",
+  "invalid_phone_msg": "Please enter a valid Mozambican phone number (e.g., +258841234567)",
+  "invalid_qr": "Invalid QR Code",
+  "invalid_table_code": "Invalid table code",
+  "items": "Items",
+  "items_count": "{{count}} items",
+  "items_count_one": "1 item",
+  "just_now": "just now",
+  "last_menu_update": "Last menu update",
+  "loading_data": "Loading data...",
+  "loading_menu": "Loading menu...",
+  "loading_order_msg": "Loading order...",
+  "make_first_order": "Make your first order to see it here!",
+  "menu": "Menu",
+  "menu_editor": "Menu Editor",
+  "minutes_ago": "{{count}} min ago",
+  "mpesa": "M-Pesa",
+  "my_orders": "My Orders",
+  "name_placeholder": "How should we call you?",
+  "no_items_found": "No items found",
+  "no_orders_yet": "No orders yet",
+  "no_past_orders": "You don't have any past orders.",
+  "no_phone_found": "No phone number found",
+  "not_assigned": "Not assigned",
+  "not_found": "Not Found",
+  "open_orders": "Open orders: {{count}}",
+  "order_cancelled_msg": "Contact the waiter for more information.",
+  "order_details": "Order Details",
+  "order_for": "Order for {{name}}",
+  "order_history_desc": "Your past and current orders",
+  "order_history_title": "Order History",
+  "order_not_found": "Order not found.",
+  "order_number": "Order #{{id}}",
+  "order_placed": "Order Placed!",
+  "order_ready_title": "Your order is ready!",
+  "order_sent_desc": "We will notify you of every status change.",
+  "order_sent_msg": "Your order has been sent to the kitchen.",
+  "order_sent_title": "Order Sent!",
+  "order_status_cancelled": "Cancelled",
+  "order_status_completed": "Completed",
+  "order_status_completed_desc": "Thank you for your visit!",
+  "order_status_confirmed": "Confirmed",
+  "order_status_confirmed_desc": "The kitchen has confirmed your order.",
+  "order_status_preparing": "Preparing",
+  "order_status_preparing_desc": "Your order is being prepared right now.",
+  "order_status_ready": "Ready to Serve",
+  "order_status_ready_desc": "Your order is ready! The waiter is coming.",
+  "order_status_received": "Order Received",
+  "order_status_received_desc": "Your order has been received by the kitchen.",
+  "order_status_served": "Served",
+  "order_status_served_desc": "Enjoy your meal! 🍽️",
+  "order_summary": "Order Summary",
+  "order_tracking": "Order Tracking",
+  "order_type": "Order Type",
+  "overall_rating": "Overall Rating",
+  "payment_method": "Payment Method",
+  "payment_method_label": "Payment Method",
+  "phone_format_hint": "Format: +258XXXXXXXXX",
+  "phone_label": "Phone Number",
+  "phone_placeholder": "For order tracking",
+  "phone_required": "Please enter your contact phone number",
+  "place_first_order_msg": "Place an order to start tracking your history.",
+  "place_order": "Place Order",
+  "please_wait": "Please wait...",
+  "price": "Price",
+  "proceed_checkout": "Proceed to Checkout",
+  "processing": "Processing...",
+  "processing_request": "Please wait while we process your request.",
+  "remove": "Remove",
+  "required": "Required",
+  "restaurant_dashboard": "Restaurant Dashboard",
+  "sales_today": "Sales today: {{total}}",
+  "save_address": "Save Address",
+  "scan_again": "Scan Again",
+  "scan_qr": "Scan QR",
+  "scanning": "Processing...",
+  "search_placeholder": "Search for items...",
+  "send_feedback_btn": "Send Feedback",
+  "service_charge": "Service Charge",
+  "status": "Status",
+  "status_updated": "Status updated: {{status}}",
+  "street_address": "Street Address",
+  "street_placeholder": "Enter street name and number",
+  "submit_feedback": "Submit Feedback",
+  "subtotal": "Subtotal",
+  "success": "Success",
+  "summary": "Summary",
+  "table": "Table",
+  "table_selected": "Table {{tableId}} selected!",
+  "table_status": "Status",
+  "table_status_available": "Available",
+  "table_status_occupied": "Occupied",
+  "table_status_reserved": "Reserved",
+  "tables": "Tables",
+  "takeaway": "Takeaway",
+  "tap_to_close": "Tap to close",
+  "tax": "Tax",
+  "thank_you": "Thank you!",
+  "total": "Total",
+  "track_order": "Track Order",
+  "try_changing_search": "Try changing your search or category",
+  "updating_automatically": "Updating automatically",
+  "validating_table": "Validating table...",
+  "waiter": "Waiter",
+  "waiter_coming": "The waiter is coming to your table.",
+  "waiter_on_way": "The waiter is on their way!",
+  "waiting_updates": "Waiting for updates...",
+  "where_deliver": "Where should we deliver your order?",
+  "your_name_label": "Your Name",
+});
+
+export default en;
@@ -0,0 +1,190 @@
+// Generated by `python -m i18n_sync compile` from i18n/locales/es/translation.json. Do not edit.
+
+import type { TranslationKey } from './keys';
+
+const es: Readonly<Record<TranslationKey, string>> = Object.freeze({
+  "access_denied": "Acceso Denegado",
+  "add_delivery_address": "Añadir dirección de entrega",
+  "add_dish": "Añadir plato",
+  "added_to_cart": "¡{{name}} agregado al carrito!",
+  "address_correct_check": "Por favor, asegúrese de que su dirección sea correcta. Cargo por envío: {{fee}}",
+  "address_required": "Por favor, ingrese su dirección",
+  "address_saved": "¡Dirección de entrega guardada!",
+  "already_called": "Camarero ya llamado. Por favor espere...",
+  "apartment_floor": "Apartamento / Piso (Opcional)",
+  "apartment_placeholder": "ej: Apt 4B, 2º Piso",
+  "apply": "Aplicar",
+  "back_to_menu": "Voltar al menú",
+  "broadcast": "Mensaje a Todos",
+  "browse_menu": "Ver Menú",
+  "cancel": "Cancelar",
+  "cart": "Carrito",
+  "cart_empty": "Su carrito está vacío",
+  "cart_empty_msg": "¡Añada algunos artículos deliciosos del menú para comenzar su pedido!",
+  "cash_on_delivery": "Efectivo contra Entrega",
+  "checkout": "Finalizar",
+  "city": "Ciudad",
+  "city_placeholder": "Ingrese la ciudad",
+  "clear": "Vaciar",
+  "clear_cart": "Vaciar Carrito",
+  "clear_cart_confirm": "¿Eliminar todos los artículos?",
+  "confirm_order": "Confirmar Pedido",
+  "contact_phone": "Teléfono de Contacto",
+  "coupon_applied": "¡Cupón \"{{coupon}}\" aplicado! Descuento: {{discount}}",
+  "currency": "",
+  "current_orders": "Pedidos Actuales",
+  "customer_feedback": "Comentarios de los Clientes",
+  "delivery": "Entrega",
+  "delivery_address": "Dirección de Entrega",
+  "delivery_fee": "Costo de Envío",
+  "delivery_instructions": "Instrucciones de Entrega (Opcional)",
+  "developed_by": "Desarrollado por Nhiquela Servicos e Consultoria, LDA",
+  "dine_in": "En el Local",
+  "discount": "Descuento",
+  "dish_name": "Nombre del plato",
+  "emola": "e-Mola",
+  "emotion_angry": "Enojado",
+  "emotion_happy": "Feliz",
+  "emotion_love": "Me encantó",
+  "emotion_neutral": "Neutral",
+  "emotion_sad": "Triste",
+  "empty_cart": "Carrito Vacío",
+  "error": "Error",
+  "error_add_item": "Error al añadir artículo",
+  "error_checkout_generic": "Algo salió mal. Por favor, inténtelo de nuevo.",
+  "error_loading_order": "Error al cargar el pedido.",
+  "error_remove_item": "Error al eliminar artículo",
+  "error_validating_code": "Error al validar el código",
+  "estimated_ready": "Listo Estimado",
+  "experience_question": "¿Cómo fue su experiencia?",
+  "failed_action": "Acción fallida",
+  "failed_feedback": "Error al enviar comentarios",
+  "failed_place_order": "Error al realizar el pedido. Por favor, inténtelo de nuevo.",
+  "failed_to_load": "Error al cargar",
+  "feedback_help_msg": "Nos ayuda a mejorar nuestro servicio.",
+  "feedback_placeholder": "Deje un comentario (opcional)...",
+  "feedback_sent": "¡Comentarios enviados! Gracias.",
+  "feedback_submitted": "Sus comentarios han sido enviados",
+  "feedback_thanks": "¡Gracias por sus comentarios!",
+  "feedback_title": "Evaluación",
+  "fill_name_price": "¡Complete nombre y precio!",
+  "filter_all": "Todos",
+  "have_coupon": "¿Tiene un cupón?",
+  "hours_ago": "hace {{count}}h {{minutes}}m",
+  "how_was_experience": "¿Cómo fue su experiencia?",
+  "in_progress": "En progreso",
+  "incomplete": "Incompleto",
+  "incomplete_feedback_msg": "Por favor seleccione emociones y calificación",
+  "instructions_placeholder": "ej: Tocar timbre, Dejar en la puerta, etc.",
+  "invalid_phone": "Teléfono Inválido",
+  "invalid_phone_msg": "Por favor Ingrese un número de teléfono mozambiqueño válido (ej: +258841234567)",
+  "invalid_qr": "Código QR Inválido",
+  "invalid_table_code": "Código de mesa inválido",
+  "items": "Artículos",
+  "items_count": "{{count}} artículos",
+  "items_count_one": "1 artículo",
+  "just_now": "ahora mismo",
+  "last_menu_update": "Última actualización",
+  "loading_data": "Cargando datos...",
+  "loading_menu": "Cargando menú...",
+  "loading_order_msg": "Cargando pedido...",
+  "make_first_order": "¡Haga su primer pedido para verlo aquí!",
+  "menu": "Menú",
+  "menu_editor": "Editor de Menú",
+  "minutes_ago": "hace {{count}} min",
+  "mpesa": "M-Pesa",
+  "my_orders": "Mis Pedidos",
+  "name_placeholder": "¿Cómo debemos llamarle?",
+  "no_items_found": "No se encontraron artículos",
+  "no_orders_yet": "Aún no hay pedidos",
+  "no_past_orders": "No tiene pedidos anteriores.",
+  "no_phone_found": "No se encontró ningún teléfono",
+  "not_assigned": "No asignado",
+  "not_found": "No Encontrado",
+  "open_orders": "Pedidos abiertos: {{count}}",
+  "order_cancelled_msg": "Contacte con el camarero para más información.",
+  "order_details": "Detalles del Pedido",
+  "order_for": "Pedido para {{name}}",
+  "order_history_desc": "Sus pedidos anteriores y actuales",
+  "order_history_title": "Historial de Pedidos",
+  "order_not_found": "Pedido no encontrado.",
+  "order_number": "Pedido #{{id}}",
+  "order_placed": "¡Pedido Realizado!",
+  "order_ready_title": "¡Su pedido está listo!",
+  "order_sent_desc": "Le notificaremos cada cambio de estado.",
+  "order_sent_msg": "Su pedido ha sido enviado a la cocina.",
+  "order_sent_title": "¡Pedido Enviado!",
+  "order_status_cancelled": "Cancelado",
+  "order_status_completed": "Completado",
+  "order_status_completed_desc": "¡Gracias por su visita!",
+  "order_status_confirmed": "Confirmado",
+  "order_status_confirmed_desc": "La cocina ha confirmado su pedido.",
+  "order_status_preparing": "En Preparación",
+  "order_status_preparing_desc": "Su pedido se está preparando ahora mismo.",
+  "order_status_ready": "Listo para Servir",
+  "order_status_ready_desc": "¡Su pedido está listo! El camarero ya viene.",
+  "order_status_received": "Pedido Recibido",
+  "order_status_received_desc": "Su pedido ha sido recibido por la cocina.",
+  "order_status_served": "Servido",
+  "order_status_served_desc": "¡Buen provecho! 🍽️",
+  "order_summary": "Resumen del Pedido",
+  "order_tracking": "Seguimiento del Pedido",
+  "order_type": "Tipo de Pedido",
+  "overall_rating": "Calificación General",
+  "payment_method": "Método de Pago",
+  "payment_method_label": "Método de Pago",
+  "phone_format_hint": "Formato: +258XXXXXXXXX",
+  "phone_label": "Número de Teléfono",
+  "phone_placeholder": "Para el seguimiento del pedido",
+  "phone_required": "Por favor, ingrese su número de teléfono de contacto",
+  "place_first_order_msg": "Haga un pedido para comenzar a ver su historial.",
+  "place_order": "Hacer Pedido",
+  "please_wait": "Por favor, espere...",
+  "price": "Precio",
+  "proceed_checkout": "Proceder al Pago",
+  "processing": "Procesando...",
+  "processing_request": "Por favor, espere enquanto procesamos su solicitud.",
+  "remove": "Eliminar",
+  "required": "Obligatorio",
+  "restaurant_dashboard": "Panel del Restaurante",
+  "sales_today": "Ventas hoy: {{total}}",
+  "save_address": "Guardar Dirección",
+  "scan_again": "Escanear de Nuevo",
+  "scan_qr": "Escanear QR",
+  "scanning": "Procesando...",
+  "search_placeholder": "Buscar artículos...",
+  "send_feedback_btn": "Enviar Evaluación",
+  "service_charge": "Cargo por Servicio",
+  "status": "Estado",
+  "status_updated": "Estado actualizado: {{status}}",
+  "street_address": "Dirección",
+  "street_placeholder": "Ingrese el nombre y número de la calle",
+  "submit_feedback": "Enviar Comentarios",
+  "subtotal": "Subtotal",
+  "success": "Éxito",
+  "summary": "Resumen",
+  "table": "Mesa",
+  "table_selected": "¡Mesa {{tableId}} seleccionada!",
+  "table_status": "Estado",
+  "table_status_available": "Disponible",
+  "table_status_occupied": "Ocupado",
+  "table_status_reserved": "Reservado",
+  "tables": "Mesas",
+  "takeaway": "Para Llevar",
+  "tap_to_close": "Toque para cerrar",
+  "tax": "Impuesto",
+  "thank_you": "¡Gracias!",
+  "total": "Total",
+  "track_order": "Seguir Pedido",
+  "try_changing_search": "Intente cambiar su búsqueda o categoría",
+  "updating_automatically": "Actualizando automáticamente",
+  "validating_table": "Validando mesa...",
+  "waiter": "Camarero",
+  "waiter_coming": "El camarero está en camino a su mesa.",
+  "waiter_on_way": "¡El camarero está en camino!",
+  "waiting_updates": "Esperando actualizaciones...",
+  "where_deliver": "¿A dónde debemos enviar su pedido?",
+  "your_name_label": "Su Nombre",
+});
+
+export default es;
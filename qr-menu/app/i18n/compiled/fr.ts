@@ -0,0 +1,190 @@
+// Generated by `python -m i18n_sync compile` from i18n/locales/fr/translation.json. Do not edit.
+
+import type { TranslationKey } from './keys';
+
+const fr: Readonly<Record<TranslationKey, string>> = Object.freeze({
+  "access_denied": "Accès Refusé",
+  "add_delivery_address": "Ajouter une adresse de livraison",
+  "add_dish": "Ajouter un plat",
+  "added_to_cart": "{{name}} ajouté au panier !",
+  "address_correct_check": "Veuillez vous assurer que votre adresse est correcte. Frais de livraison : {{fee}}",
+  "address_required": "Veuillez entrer votre adresse",
+  "address_saved": "Adresse de livraison enregistrée !",
+  "already_called": "Serveur déjà appelé. Veuillez patienter...",
+  "apartment_floor": "Appartement / Étage (Optionnel)",
+  "apartment_placeholder": "ex: Apt 4B, 2ème étage",
+  "apply": "Appliquer",
+  "back_to_menu": "Retour au menu",
+  "broadcast": "Diffusion",
+  "browse_menu": "Voir le Menu",
+  "cancel": "Annuler",
+  "cart": "Panier",
+  "cart_empty": "Votre panier est vide",
+  "cart_empty_msg": "Ajoutez des plats délicieux du menu pour commencer votre commande !",
+  "cash_on_delivery": "Paiement à la Livraison",
+  "checkout": "Payer",
+  "city": "Ville",
+  "city_placeholder": "Entrez la ville",
+  "clear": "Vider",
+  "clear_cart": "Vider le Panier",
+  "clear_cart_confirm": "Supprimer tous les articles ?",
+  "confirm_order": "Confirmer la Commande",
+  "contact_phone": "Téléphone de Contact",
+  "coupon_applied": "Coupon \"{{coupon}}\" appliqué ! Remise : {{discount}}",
+  "currency": "",
+  "current_orders": "Commandes Actuelles",
+  "customer_feedback": "Avis des Clients",
+  "delivery": "Livraison",
+  "delivery_address": "Adresse de Livraison",
+  "delivery_fee": "Frais de Livraison",
+  "delivery_instructions": "Instructions de Livraison (Optionnel)",
+  "developed_by": "Développé par Nhiquela Servicos e Consultoria, LDA",
+  "dine_in": "Sur Place",
+  "discount": "Remise",
+  "dish_name": "Nom du plat",
+  "emola": "e-Mola",
+  "emotion_angry": "En colère",
+  "emotion_happy": "Heureux",
+  "emotion_love": "J'ai adoré",
+  "emotion_neutral": "Neutre",
+  "emotion_sad": "Triste",
+  "empty_cart": "Panier Vide",
+  "error": "Erreur",
+  "error_add_item": "Erreur lors de l'ajout de l'article",
+  "error_checkout_generic": "Quelque chose s'est mal passé. Veuillez réessayer.",
+  "error_loading_order": "Erreur lors du chargement de la commande.",
+  "error_remove_item": "Erreur lors de la suppression de l'article",
+  "error_validating_code": "Erreur lors de la validation du code",
+  "estimated_ready": "Prêt Estimé",
+  "experience_question": "Comment s'est passée votre expérience ?",
+  "failed_action": "Échec de l'action",
+  "failed_feedback": "Échec de l'envoi de l'avis",
+  "failed_place_order": "Échec de la commande. Veuillez réessayer.",
+  "failed_to_load": "Échec du chargementTag",
+  "feedback_help_msg": "Cela nous aide à améliorer notre service.",
+  "feedback_placeholder": "Laissez un commentaire (optionnel)...",
+  "feedback_sent": "Commentaire envoyé ! Merci.",
+  "feedback_submitted": "Votre avis a été envoyé",
+  "feedback_thanks": "Merci pour vos commentaires !",
+  "feedback_title": "Évaluation",
+  "fill_name_price": "Remplissez le nom et le prix !",
+  "filter_all": "Tout",
+  "have_coupon": "Avez-vous un coupon ?",
+  "hours_ago": "il y a {{count}}h {{minutes}}m",
+  "how_was_experience": "Comment s'est passée votre expérience ?",
+  "in_progress": "En cours",
+  "incomplete": "Incomplet",
+  "incomplete_feedback_msg": "Veuillez sélectionner les émotions et l'évaluation",
+  "instructions_placeholder": "ex: Sonner à la porte, Laisser au portail, etc.",
+  "invalid_phone": "Téléphone Invalide",
+  "invalid_phone_msg": "Veuillez entrer un numéro de téléphone mozambicain valide (ex: +258841234567)",
+  "invalid_qr": "Code QR Invalide",
+  "invalid_table_code": "Code de table invalide",
+  "items": "Articles",
+  "items_count": "{{count}} articles",
+  "items_count_one": "1 article",
+  "just_now": "à l'instant",
+  "last_menu_update": "Dernière mise à jour",
+  "loading_data": "Chargement des données...",
+  "loading_menu": "Chargement du menu...",
+  "loading_order_msg": "Chargement de la commande...",
+  "make_first_order": "Faites votre première commande pour la voir ici !",
+  "menu": "Menu",
+  "menu_editor": "Éditeur de Menu",
+  "minutes_ago": "il y a {{count}} min",
+  "mpesa": "M-Pesa",
+  "my_orders": "Mes Commandes",
+  "name_placeholder": "Comment devons-nous vous appeler ?",
+  "no_items_found": "Aucun article trouvé",
+  "no_orders_yet": "Aucune commande pour le moment",
+  "no_past_orders": "Vous n'avez pas de commandes passées.",
+  "no_phone_found": "Aucun téléphone trouvé",
+  "not_assigned": "Non assigné",
+  "not_found": "Non Trouvé",
+  "open_orders": "Commandes en cours : {{count}}",
+  "order_cancelled_msg": "Contactez le serveur pour plus d'informations.",
+  "order_details": "Détails de la Commande",
+  "order_for": "Commande pour {{name}}",
+  "order_history_desc": "Vos commandes passées et actuelles",
+  "order_history_title": "Historique des Commandes",
+  "order_not_found": "Commande non trouvée.",
+  "order_number": "Commande #{{id}}",
+  "order_placed": "Commande Passée !",
+  "order_ready_title": "Votre commande est prête !",
+  "order_sent_desc": "Nous vous informerons à chaque changement d'état.",
+  "order_sent_msg": "Votre commande a été envoyée en cuisine.",
+  "order_sent_title": "Commande Envoyée !",
+  "order_status_cancelled": "Annulé",
+  "order_status_completed": "Terminé",
+  "order_status_completed_desc": "Merci de votre visite !",
+  "order_status_confirmed": "Confirmée",
+  "order_status_confirmed_desc": "La cuisine a confirmé votre commande.",
+  "order_status_preparing": "En Préparation",
+  "order_status_preparing_desc": "Votre commande est en cours de préparation.",
+  "order_status_ready": "Prêt à Servir",
+  "order_status_ready_desc": "Votre commande est prête ! Le serveur arrive.",
+  "order_status_received": "Commande Reçue",
+  "order_status_received_desc": "Votre commande a été reçue par la cuisine.",
+  "order_status_served": "Servi",
+  "order_status_served_desc": "Bon appétit ! 🍽️",
+  "order_summary": "Résumé de la Commande",
+  "order_tracking": "Suivi de Commande",
+  "order_type": "Type de Commande",
+  "overall_rating": "Évaluation Globale",
+  "payment_method": "Mode de Paiement",
+  "payment_method_label": "Mode de Paiement",
+  "phone_format_hint": "Format : +258XXXXXXXXX",
+  "phone_label": "Numéro de Téléphone",
+  "phone_placeholder": "Pour le suivi de la commande",
+  "phone_required": "Veuillez entrer votre numéro de téléphone",
+  "place_first_order_msg": "Passez une commande pour commencer à voir votre historique.",
+  "place_order": "Passer la Commande",
+  "please_wait": "Veuillez patienter...",
+  "price": "Prix",
+  "proceed_checkout": "Procéder au Paiement",
+  "processing": "Traitement...",
+  "processing_request": "Veuillez patienter pendant que nous traitons votre demande.",
+  "remove": "Supprimer",
+  "required": "Obligatoire",
+  "restaurant_dashboard": "Tableau de Bord du Restaurant",
+  "sales_today": "Ventes du jour : {{total}}",
+  "save_address": "Enregistrer l'Adresse",
+  "scan_again": "Scanner à Nouveau",
+  "scan_qr": "Scanner QR",
+  "scanning": "Traitement...",
+  "search_placeholder": "Rechercher des articles...",
+  "send_feedback_btn": "Envoyer l'Avis",
+  "service_charge": "Frais de Service",
+  "status": "Statut",
+  "status_updated": "Statut mis à jour : {{status}}",
+  "street_address": "Adresse",
+  "street_placeholder": "Entrez le nom et le numéro de la rue",
+  "submit_feedback": "Envoyer l'Avis",
+  "subtotal": "Sous-total",
+  "success": "Succès",
+  "summary": "Résumé",
+  "table": "Table",
+  "table_selected": "Table {{tableId}} sélectionnée !",
+  "table_status": "État",
+  "table_status_available": "Disponible",
+  "table_status_occupied": "Occupé",
+  "table_status_reserved": "Réservé",
+  "tables": "Tables",
+  "takeaway": "À Emporter",
+  "tap_to_close": "Appuyez pour fermer",
+  "tax": "Taxe",
+  "thank_you": "Merci !",
+  "total": "Total",
+  "track_order": "Suivre la Commande",
+  "try_changing_search": "Essayez de modifier votre recherche ou votre catégorie",
+  "updating_automatically": "Mise à jour automatique",
+  "validating_table": "Validation de la table...",
+  "waiter": "Serveur",
+  "waiter_coming": "Le serveur est en route vers votre table.",
+  "waiter_on_way": "Le serveur est en route !",
+  "waiting_updates": "En attente de mises à jour...",
+  "where_deliver": "Où devons-nous livrer votre commande ?",
+  "your_name_label": "Votre Nom",
+});
+
+export default fr;
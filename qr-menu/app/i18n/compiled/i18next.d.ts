@@ -0,0 +1,11 @@
+// Generated by `python -m i18n_sync compile` from the locale catalogs. Do not edit.
+
+import 'i18next';
+import type { TranslationKey } from './keys';
+
+declare module 'i18next' {
+  interface CustomTypeOptions {
+    defaultNS: 'translation';
+    resources: { translation: Record<TranslationKey, string> };
+  }
+}
@@ -0,0 +1,18 @@
+// Generated by `python -m i18n_sync compile` from the locale catalogs. Do not edit.
+
+import type { Language, TranslationKey } from './keys';
+
+export { LANGUAGES } from './keys';
+export type { Language, TranslationKey } from './keys';
+
+export type Catalog = Readonly<Record<TranslationKey, string>>;
+
+export const FALLBACK_LANGUAGE: Language = 'en';
+
+// require() inside each loader: Metro only evaluates a catalog the first time it is loaded.
+export const loaders: Record<Language, () => Catalog> = {
+  pt: () => require('./pt').default,
+  en: () => require('./en').default,
+  es: () => require('./es').default,
+  fr: () => require('./fr').default,
+};
@@ -0,0 +1,188 @@
+// Generated by `python -m i18n_sync compile` from the locale catalogs. Do not edit.
+
+export const LANGUAGES = ['pt', 'en', 'es', 'fr'] as const;
+export type Language = (typeof LANGUAGES)[number];
+
+export type TranslationKey =
+  | "access_denied"
+  | "add_delivery_address"
+  | "add_dish"
+  | "added_to_cart"
+  | "address_correct_check"
+  | "address_required"
+  | "address_saved"
+  | "already_called"
+  | "apartment_floor"
+  | "apartment_placeholder"
+  | "apply"
+  | "back_to_menu"
+  | "broadcast"
+  | "browse_menu"
+  | "cancel"
+  | "cart"
+  | "cart_empty"
+  | "cart_empty_msg"
+  | "cash_on_delivery"
+  | "checkout"
+  | "city"
+  | "city_placeholder"
+  | "clear"
+  | "clear_cart"
+  | "clear_cart_confirm"
+  | "confirm_order"
+  | "contact_phone"
+  | "coupon_applied"
+  | "currency"
+  | "current_orders"
+  | "customer_feedback"
+  | "delivery"
+  | "delivery_address"
+  | "delivery_fee"
+  | "delivery_instructions"
+  | "developed_by"
+  | "dine_in"
+  | "discount"
+  | "dish_name"
+  | "emola"
+  | "emotion_angry"
+  | "emotion_happy"
+  | "emotion_love"
+  | "emotion_neutral"
+  | "emotion_sad"
+  | "empty_cart"
+  | "error"
+  | "error_add_item"
+  | "error_checkout_generic"
+  | "error_loading_order"
+  | "error_remove_item"
+  | "error_validating_code"
+  | "estimated_ready"
+  | "experience_question"
+  | "failed_action"
+  | "failed_feedback"
+  | "failed_place_order"
+  | "failed_to_load"
+  | "feedback_help_msg"
+  | "feedback_placeholder"
+  | "feedback_sent"
+  | "feedback_submitted"
+  | "feedback_thanks"
+  | "feedback_title"
+  | "fill_name_price"
+  | "filter_all"
+  | "have_coupon"
+  | "hours_ago"
+  | "how_was_experience"
+  | "in_progress"
+  | "incomplete"
+  | "incomplete_feedback_msg"
+  | "instructions_placeholder"
+  | "invalid_phone"
+  | "invalid_phone_msg"
+  | "invalid_qr"
+  | "invalid_table_code"
+  | "items"
+  | "items_count"
+  | "items_count_one"
+  | "just_now"
+  | "last_menu_update"
+  | "loading_data"
+  | "loading_menu"
+  | "loading_order_msg"
+  | "make_first_order"
+  | "menu"
+  | "menu_editor"
+  | "minutes_ago"
+  | "mpesa"
+  | "my_orders"
+  | "name_placeholder"
+  | "no_items_found"
+  | "no_orders_yet"
+  | "no_past_orders"
+  | "no_phone_found"
+  | "not_assigned"
+  | "not_found"
+  | "open_orders"
+  | "order_cancelled_msg"
+  | "order_details"
+  | "order_for"
+  | "order_history_desc"
+  | "order_history_title"
+  | "order_not_found"
+  | "order_number"
+  | "order_placed"
+  | "order_ready_title"
+  | "order_sent_desc"
+  | "order_sent_msg"
+  | "order_sent_title"
+  | "order_status_cancelled"
+  | "order_status_completed"
+  | "order_status_completed_desc"
+  | "order_status_confirmed"
+  | "order_status_confirmed_desc"
+  | "order_status_preparing"
+  | "order_status_preparing_desc"
+  | "order_status_ready"
+  | "order_status_ready_desc"
+  | "order_status_received"
+  | "order_status_received_desc"
+  | "order_status_served"
+  | "order_status_served_desc"
+  | "order_summary"
+  | "order_tracking"
+  | "order_type"
+  | "overall_rating"
+  | "payment_method"
+  | "payment_method_label"
+  | "phone_format_hint"
+  | "phone_label"
+  | "phone_placeholder"
+  | "phone_required"
+  | "place_first_order_msg"
+  | "place_order"
+  | "please_wait"
+  | "price"
+  | "proceed_checkout"
+  | "processing"
+  | "processing_request"
+  | "remove"
+  | "required"
+  | "restaurant_dashboard"
+  | "sales_today"
+  | "save_address"
+  | "scan_again"
+  | "scan_qr"
+  | "scanning"
+  | "search_placeholder"
+  | "send_feedback_btn"
+  | "service_charge"
+  | "status"
+  | "status_updated"
+  | "street_address"
+  | "street_placeholder"
+  | "submit_feedback"
+  | "subtotal"
+  | "success"
+  | "summary"
+  | "table"
+  | "table_selected"
+  | "table_status"
+  | "table_status_available"
+  | "table_status_occupied"
+  | "table_status_reserved"
+  | "tables"
+  | "takeaway"
+  | "tap_to_close"
+  | "tax"
+  | "thank_you"
+  | "total"
+  | "track_order"
+  | "try_changing_search"
+  | "updating_automatically"
+  | "validating_table"
+  | "waiter"
+  | "waiter_coming"
+  | "waiter_on_way"
+  | "waiting_updates"
+  | "where_deliver"
+  | "your_name_label";
@@ -0,0 +1,190 @@
+// Generated by `python -m i18n_sync compile` from i18n/locales/pt/translation.json. Do not edit.
+
+import type { TranslationKey } from './keys';
+
+const pt: Readonly<Record<TranslationKey, string>> = Object.freeze({
+  "access_denied": "Acesso Negado",
+  "add_delivery_address": "Adicionar endereço de entrega",
+  "add_dish": "Adicionar prato",
+  "added_to_cart": "{{name}} adicionado ao carrinho!",
+  "address_correct_check": "Por favor, certifique-se de que seu endereço esteja correto. Taxa de entrega: {{fee}}",
+  "address_required": "Por favor, insira seu endereço",
+  "address_saved": "Endereço de entrega salvo!",
+  "already_called": "Garçom já chamado. Por favor aguarde...",
+  "apartment_floor": "Apartamento / Andar (Opcional)",
+  "apartment_placeholder": "ex: Apt 4B, 2º Andar",
+  "apply": "Aplicar",
+  "back_to_menu": "Voltar ao menu",
+  "broadcast": "Mensagem a Todos",
+  "browse_menu": "Ver Menu",
+  "cancel": "Cancelar",
+  "cart": "Carrinho",
+  "cart_empty": "Seu carrinho está vazio",
+  "cart_empty_msg": "Adicione itens deliciosos do menu para começar seu pedido!",
+  "cash_on_delivery": "Dinheiro na Entrega",
+  "checkout": "Finalizar",
+  "city": "Cidade",
+  "city_placeholder": "Digite a cidade",
+  "clear": "Limpar",
+  "clear_cart": "Limpar Carrinho",
+  "clear_cart_confirm": "Remover todos os itens?",
+  "confirm_order": "Confirmar Pedido",
+  "contact_phone": "Telefone de Contacto",
+  "coupon_applied": "Cupom \"{{coupon}}\" aplicado! Desconto: {{discount}}",
+  "currency": "",
+  "current_orders": "Pedidos Atuais",
+  "customer_feedback": "Feedback dos Clientes",
+  "delivery": "Entrega",
+  "delivery_address": "Endereço de Entrega",
+  "delivery_fee": "Taxa de Entrega",
+  "delivery_instructions": "Instruções de Entrega (Opcional)",
+  "developed_by": "Desenvolvido por Nhiquela Servicos e Consultoria, LDA",
+  "dine_in": "No Local",
+  "discount": "Desconto",
+  "dish_name": "Nome do prato",
+  "emola": "e-Mola",
+  "emotion_angry": "Irritado",
+  "emotion_happy": "Feliz",
+  "emotion_love": "Amei",
+  "emotion_neutral": "Neutro",
+  "emotion_sad": "Triste",
+  "empty_cart": "Carrinho Vazio",
+  "error": "Erro",
+  "error_add_item": "Erro ao adicionar item",
+  "error_checkout_generic": "Algo correu mal. Por favor, tente novamente.",
+  "error_loading_order": "Erro ao carregar pedido.",
+  "error_remove_item": "Erro ao remover item",
+  "error_validating_code": "Erro ao validar código",
+  "estimated_ready": "Previsão de Entrega",
+  "experience_question": "Como foi sua experiência?",
+  "failed_action": "Falha na ação",
+  "failed_feedback": "Falha ao enviar feedback",
+  "failed_place_order": "Falha ao fazer pedido. Por favor, tente novamente.",
+  "failed_to_load": "Falha ao carregar",
+  "feedback_help_msg": "Ajuda-nos a melhorar o serviço.",
+  "feedback_placeholder": "Deixe um comentário (opcional)...",
+  "feedback_sent": "Feedback enviado! Obrigado.",
+  "feedback_submitted": "Seu feedback foi enviado",
+  "feedback_thanks": "Obrigado pelo seu feedback!",
+  "feedback_title": "Avaliação",
+  "fill_name_price": "Preencha nome e preço!",
+  "filter_all": "Todos",
+  "have_coupon": "Tem um cupom?",
+  "hours_ago": "há {{count}}h {{minutes}}m",
+  "how_was_experience": "Como foi a sua experiência?",
+  "in_progress": "Em progresso",
+  "incomplete": "Incompleto",
+  "incomplete_feedback_msg": "Por favor, selecione emoções e avaliação",
+  "instructions_placeholder": "ex: Tocar campainha, Deixar no portão, etc.",
+  "invalid_phone": "Telefone Inválido",
+  "invalid_phone_msg": "Por favor, insira um número de telefone moçambicano válido (ex: +258841234567)",
+  "invalid_qr": "QR Code Inválido",
+  "invalid_table_code": "Código da mesa inválido",
+  "items": "Itens",
+  "items_count": "{{count}} itens",
+  "items_count_one": "1 item",
+  "just_now": "agora mesmo",
+  "last_menu_update": "Última atualização",
+  "loading_data": "Carregando dados...",
+  "loading_menu": "Carregando menu...",
+  "loading_order_msg": "Carregando pedido...",
+  "make_first_order": "Faça seu primeiro pedido para vê-lo aqui!",
+  "menu": "Menu",
+  "menu_editor": "Editor de Menu",
+  "minutes_ago": "há {{count}} min",
+  "mpesa": "M-Pesa",
+  "my_orders": "Meus Pedidos",
+  "name_placeholder": "Como devemos chamar você?",
+  "no_items_found": "Nenhum item encontrado",
+  "no_orders_yet": "Nenhum pedido ainda",
+  "no_past_orders": "Você não tem pedidos anteriores.",
+  "no_phone_found": "Nenhum telefone encontrado",
+  "not_assigned": "Não atribuído",
+  "not_found": "Não Encontrado",
+  "open_orders": "Pedidos em aberto: {{count}}",
+  "order_cancelled_msg": "Contacte o garçom para mais informações.",
+  "order_details": "Detalhes do Pedido",
+  "order_for": "Pedido de {{name}}",
+  "order_history_desc": "Seus pedidos anteriores e atuais",
+  "order_history_title": "Histórico de Pedidos",
+  "order_not_found": "Pedido não encontrado.",
+  "order_number": "Pedido #{{id}}",
+  "order_placed": "Pedido Realizado!",
+  "order_ready_title": "O seu pedido está pronto!",
+  "order_sent_desc": "Vamos notificá-lo a cada mudança de estado.",
+  "order_sent_msg": "O seu pedido foi enviado para a cozinha.",
+  "order_sent_title": "Pedido Enviado!",
+  "order_status_cancelled": "Cancelado",
+  "order_status_completed": "Concluído",
+  "order_status_completed_desc": "Obrigado pela sua visita!",
+  "order_status_confirmed": "Confirmado",
+  "order_status_confirmed_desc": "A cozinha confirmou o seu pedido.",
+  "order_status_preparing": "Em Preparação",
+  "order_status_preparing_desc": "O seu pedido está a ser preparado agora.",
+  "order_status_ready": "Pronto para Servir",
+  "order_status_ready_desc": "O seu pedido está pronto! O garçom já vem.",
+  "order_status_received": "Pedido Recebido",
+  "order_status_received_desc": "O seu pedido foi recebido pela cozinha.",
+  "order_status_served": "Servido",
+  "order_status_served_desc": "Bom apetite! 🍽️",
+  "order_summary": "Resumo do Pedido",
+  "order_tracking": "Acompanhamento do Pedido",
+  "order_type": "Tipo de Pedido",
+  "overall_rating": "Avaliação Geral",
+  "payment_method": "Método de Pagamento",
+  "payment_method_label": "Método de Pagamento",
+  "phone_format_hint": "Formato: +258XXXXXXXXX",
+  "phone_label": "Número de Telefone",
+  "phone_placeholder": "Para acompanhamento do pedido",
+  "phone_required": "Por favor, insira seu número de telefone",
+  "place_first_order_msg": "Faça um pedido para começar a ver o seu histórico.",
+  "place_order": "Fazer Pedido",
+  "please_wait": "Por favor, aguarde...",
+  "price": "Preço",
+  "proceed_checkout": "Prosseguir para o Pagamento",
+  "processing": "A processar...",
+  "processing_request": "Por favor, aguarde enquanto processamos sua solicitação.",
+  "remove": "Remover",
+  "required": "Obrigatório",
+  "restaurant_dashboard": "Dashboard do Restaurante",
+  "sales_today": "Vendas do dia: {{total}}",
+  "save_address": "Salvar Endereço",
+  "scan_again": "Escanear Novamente",
+  "scan_qr": "Escanear QR",
+  "scanning": "Processando...",
+  "search_placeholder": "Pesquisar itens...",
+  "send_feedback_btn": "Enviar Avaliação",
+  "service_charge": "Taxa de Serviço",
+  "status": "Estado",
+  "status_updated": "Status atualizado: {{status}}",
+  "street_address": "Endereço",
+  "street_placeholder": "Digite o nome e número da rua",
+  "submit_feedback": "Enviar Feedback",
+  "subtotal": "Subtotal",
+  "success": "Sucesso",
+  "summary": "Resumo",
+  "table": "Mesa",
+  "table_selected": "Mesa {{tableId}} selecionada!",
+  "table_status": "Estado",
+  "table_status_available": "Disponível",
+  "table_status_occupied": "Ocupado",
+  "table_status_reserved": "Reservado",
+  "tables": "Mesas",
+  "takeaway": "Para Levar",
+  "tap_to_close": "Toque para fechar",
+  "tax": "IVA",
+  "thank_you": "Obrigado!",
+  "total": "Total",
+  "track_order": "Acompanhar Pedido",
+  "try_changing_search": "Tente mudar a sua pesquisa ou categoria",
+  "updating_automatically": "A actualizar automaticamente",
+  "validating_table": "Validando mesa...",
+  "waiter": "Garçom",
+  "waiter_coming": "O garçom está a caminho da sua mesa.",
+  "waiter_on_way": "O garçom está a caminho!",
+  "waiting_updates": "Aguardando atualizações...",
+  "where_deliver": "Onde devemos entregar seu pedido?",
+  "your_name_label": "Seu Nome",
+});
+
+export default pt;
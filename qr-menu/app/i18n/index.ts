@@ -1,21 +1,30 @@
-import i18n from 'i18next';
+import i18n, { BackendModule } from 'i18next';
 import { initReactI18next } from 'react-i18next';
-import pt from './locales/pt/translation.json';
-import en from './locales/en/translation.json';
-import es from './locales/es/translation.json';
-import fr from './locales/fr/translation.json';
+import { Language, loaders } from './compiled';
+
+// Catalogs are generated by `python -m i18n_sync compile`; only the languages
+// i18next actually asks for (current + fallback) are ever evaluated.
+const compiledBackend: BackendModule = {
+  type: 'backend',
+  init() {},
+  read(language, _namespace, callback) {
+    const load = loaders[language as Language];
+    if (!load) {
+      callback(new Error(`No compiled catalog for "${language}"`), false);
+      return;
+    }
+    callback(null, load());
+  },
+};
 
 i18n
+  .use(compiledBackend)
   .use(initReactI18next)
   .init({
-    resources: {
-      pt: { translation: pt },
-      en: { translation: en },
-      es: { translation: es },
-      fr: { translation: fr },
-    },
     lng: 'pt', // Initial language
+    // A literal: `i18n_sync` reads it (delta builds keep this language whole).
     fallbackLng: 'en',
+    initAsync: false,
     interpolation: {
       escapeValue: false,
     },
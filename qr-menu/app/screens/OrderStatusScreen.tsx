@@ -9,6 +9,7 @@ import {
 import { orderAPI } from '../services/api';
 import { useTranslation } from 'react-i18next';
 import { useCurrency } from '../contexts/CurrencyContext';
+import type { TranslationKey } from '../i18n/compiled';
 
 export default function OrderStatusScreen({ route }: any) {
     const { t } = useTranslation();
@@ -64,7 +65,7 @@ export default function OrderStatusScreen({ route }: any) {
         <SafeAreaView style={styles.container}>
             <View style={styles.header}>
                 <Text style={styles.title}>{t('order_number', { id: orderId.slice(-6).toUpperCase() })}</Text>
-                <Text style={styles.orderType}>{t(order.orderType)}</Text>
+                <Text style={styles.orderType}>{t(order.orderType as TranslationKey)}</Text>
             </View>
 
             <View style={styles.statusContainer}>
@@ -0,0 +1,24 @@
+"""
+Document generation for the technical manuals (``generate_technical_doc.py``).
+
+Content lives in structured files under ``docgen/content`` (see
+``docgen.content``), is expanded per edition (bilingual or one language)
+and rendered to DOCX (``docgen.docx_render``), Markdown
+(``docgen.markdown_render``) and HTML (``docgen.html_render``) by
+``docgen.build``.
+"""
+
+from .build import EDITIONS, FORMATS, build
+from .content import LANGS, Block, Content, ContentError, load_content, parse_content
+
+__all__ = [
+    'Block',
+    'Content',
+    'ContentError',
+    'EDITIONS',
+    'FORMATS',
+    'LANGS',
+    'build',
+    'load_content',
+    'parse_content',
+]
@@ -0,0 +1,316 @@
+"""
+Render one content file to every format and edition in one run, incrementally.
+
+The content file is split into sections at each ``h1`` block (the blocks
+before the first one are the cover). A section's fingerprint covers its
+blocks as written in the content file and its inputs: the files matched by
+the ``inputs`` globs of any of its blocks (e.g. the locale catalogs a
+section lists keys from), the images of its ``image`` blocks and, for
+``api_reference`` blocks, the content hashes of the scanned API sources
+(through the ``docgen.routes`` cache).
+
+Each (edition, format) pair is an independent job writing
+``<output stem>[.<lang>].<ext>``. A job whose section fingerprints all
+match the last build of an output that is still on disk is skipped without
+writing anything. Otherwise every section is taken from its cached
+fragment (``.docgen-cache/fragments``: WordprocessingML, Markdown or HTML
+body and the prepared images it shows, keyed by fingerprint, edition and
+format) or, if it changed, expanded and rendered, and the output is
+assembled from the fragments. Markdown and HTML outputs get their images
+copied to an ``images`` folder next to them. Large runs render in a
+process pool, the jobs being cheap to pickle.
+"""
+
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import instrument
+from filecache import write_json
+
+from .content import IMAGE, LANGS, expand, localize, read_content
+from .routes import CACHE_DIR, DEFAULT_CACHE, RouteCache, source_files
+
+FORMATS = ('docx', 'md', 'html')
+EDITIONS = (None,) + LANGS
+DEFAULT_STATE = os.path.join(CACHE_DIR, 'build.json')
+FRAGMENT_DIR = os.path.join(CACHE_DIR, 'fragments')
+IMAGE_DIR = 'images'
+# Part of every fingerprint: bump when a renderer's output changes.
+RENDER_VERSION = 2
+# Stale content-file blocks over all jobs below which a process pool costs more than it saves.
+PARALLEL_THRESHOLD = 1000
+
+
+def output_name(output, lang, fmt):
+    stem = os.path.splitext(output)[0]
+    return f'{stem}.{lang}.{fmt}' if lang else f'{stem}.{fmt}'
+
+
+def _digest(*parts):
+    data = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _hash_file(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    instrument.count_read(len(raw))
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def split_sections(specs):
+    """Content-file blocks grouped into sections, each starting at an ``h1``; ``[(index, spec)]`` lists."""
+    sections = [[]]
+    for i, spec in enumerate(specs):
+        if isinstance(spec, dict) and spec and next(iter(spec)) == 'h1' and sections[-1]:
+            sections.append([])
+        sections[-1].append((i, spec))
+    return [section for section in sections if section]
+
+
+def section_inputs(section, base, route_cache):
+    """``[(path, content hash)]`` of the files ``section`` depends on besides its own blocks."""
+    inputs = []
+    for _, spec in section:
+        if not isinstance(spec, dict):
+            continue
+        for pattern in spec.get('inputs') or ():
+            matches = sorted(glob.glob(os.path.join(base, pattern)))
+            # An unmatched pattern is recorded too: a file appearing later changes the fingerprint.
+            inputs.extend((os.path.relpath(path, base), _hash_file(path)) for path in matches)
+            inputs.extend([(pattern, None)] if not matches else [])
+        if next(iter(spec)) == 'image':
+            path = os.path.normpath(os.path.join(base, str(spec['image'])))
+            inputs.append((os.path.relpath(path, base), _hash_file(path) if os.path.isfile(path) else None))
+        if next(iter(spec)) == 'api_reference':
+            api_dir = os.path.normpath(os.path.join(base, str(spec['api_reference'])))
+            entries = route_cache.scan(source_files(api_dir))
+            inputs.extend((os.path.relpath(path, base), entry['hash']) for path, entry in entries.items())
+    return inputs
+
+
+class BuildState:
+    """Section fingerprints and size of every output as last written, keyed by path."""
+
+    def __init__(self, path=DEFAULT_STATE, outputs=None):
+        self.path = path
+        self.outputs = outputs or {}
+
+    @classmethod
+    def load(cls, path=DEFAULT_STATE):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        if data.get('version') != RENDER_VERSION:
+            return cls(path)
+        return cls(path, data.get('outputs', {}))
+
+    def save(self):
+        write_json(self.path, {'version': RENDER_VERSION, 'outputs': self.outputs}, indent=2, sort_keys=True)
+
+    def unchanged(self, path, sections):
+        entry = self.outputs.get(path)
+        return (entry is not None and entry['sections'] == sections
+                and os.path.exists(path) and os.path.getsize(path) == entry['size'])
+
+
+@dataclass
+class OutputResult:
+    path: str
+    size: int
+    sections: int
+    rendered: int = 0
+    written: bool = True
+
+
+def _render_fragment(fmt, blocks, docx_target):
+    if fmt == 'docx':
+        from .docx_render import fragment_xml
+
+        return fragment_xml(blocks, *docx_target[1:])
+    if fmt == 'md':
+        from .markdown_render import render_markdown
+
+        return render_markdown(blocks, IMAGE_DIR) if blocks else ''
+    from .html_render import html_body
+
+    return html_body(blocks, IMAGE_DIR)
+
+
+def _copy_images(images, out_dir):
+    """Copy prepared ``images`` into the ``IMAGE_DIR`` next to a Markdown/HTML output."""
+    target_dir = os.path.join(out_dir, IMAGE_DIR)
+    for image in images:
+        target = os.path.join(target_dir, os.path.basename(image))
+        if not os.path.exists(target) or os.path.getsize(target) != os.path.getsize(image):
+            os.makedirs(target_dir, exist_ok=True)
+            shutil.copyfile(image, target)
+            instrument.count_written(os.path.getsize(target))
+
+
+def _write_output(fmt, fragments, images, path, title, lang, docx_target):
+    if fmt == 'docx':
+        from .docx_render import splice
+
+        splice(docx_target[0], fragments).save(path)
+        return
+    _copy_images(images, os.path.dirname(path))
+    if fmt == 'md':
+        text = '\n'.join(fragment for fragment in fragments if fragment)
+    else:
+        from .html_render import html_page
+
+        text = html_page(''.join(fragments), title, lang)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+
+
+def _cached_fragment(path):
+    """A cached fragment, unless missing or one of its images has gone."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+            instrument.count_read(os.fstat(f.fileno()).st_size)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not all(os.path.exists(image) for image in cached['images']):
+        return None
+    return cached
+
+
+def render_output(job):
+    """
+    Assemble one output from its sections, rendering those without a cached
+    fragment; return an ``OutputResult``.
+    """
+    fmt, lang, path, title, sections, base, route_cache, fragment_dir, where = job
+    docx_target = None
+    if fmt == 'docx':
+        from .docx_render import new_document
+
+        docx_target = new_document()
+    os.makedirs(fragment_dir, exist_ok=True)
+    fragments = []
+    images = []
+    rendered = 0
+    with instrument.phase('render'):
+        for key, section in sections:
+            fragment_path = os.path.join(fragment_dir, f'{key}.{fmt}')
+            cached = _cached_fragment(fragment_path)
+            if cached is None:
+                blocks = []
+                for i, spec in section:
+                    blocks.extend(expand(spec, f'{where}: block {i + 1}', base, lang, route_cache))
+                cached = {'text': _render_fragment(fmt, blocks, docx_target),
+                          'images': [block.image for block in blocks if block.kind == IMAGE]}
+                write_json(fragment_path, cached, ensure_ascii=False)
+                rendered += 1
+            fragments.append(cached['text'])
+            images.extend(cached['images'])
+    with instrument.phase('save'):
+        _write_output(fmt, fragments, images, path, title, lang, docx_target)
+        size = os.path.getsize(path)
+        instrument.count_written(size)
+    return OutputResult(path, size, len(sections), rendered)
+
+
+def _title(sections, lang, where):
+    for section in sections:
+        for _, spec in section:
+            if isinstance(spec, dict) and spec and next(iter(spec)) == 'title':
+                return localize(spec['title'], lang, where) or ''
+    return ''
+
+
+def build(content_path, out_dir, formats=FORMATS, editions=EDITIONS, jobs=None, force=False,
+          state=None, fragment_dir=FRAGMENT_DIR):
+    """
+    Write every ``formats`` x ``editions`` output of ``content_path`` that
+    changed since the build recorded in ``state`` (a ``BuildState``, loaded
+    from and saved to the default path if None); return ``[OutputResult]``.
+    """
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        raise ValueError(f'unknown format {unknown[0]!r} (expected one of {", ".join(FORMATS)})')
+    unknown = [lang for lang in editions if lang is not None and lang not in LANGS]
+    if unknown:
+        raise ValueError(f'unknown language {unknown[0]!r} (expected one of {", ".join(LANGS)})')
+    save_state = state is None
+    state = state if state is not None else BuildState.load()
+
+    with instrument.phase('load'):
+        data = read_content(content_path)
+    if not isinstance(data, dict) or not isinstance(data.get('blocks'), list):
+        raise ValueError(f'{content_path}: expected a mapping with a "blocks" list')
+    base = os.path.dirname(os.path.abspath(content_path))
+    with instrument.phase('discover'):
+        route_cache = RouteCache.load(DEFAULT_CACHE)
+        sections = split_sections(data['blocks'])
+        # Images are only downscaled when Pillow is there: installing it must re-render them.
+        encoder = importlib.util.find_spec('PIL') is not None
+        fingerprints = [_digest(section, section_inputs(section, base, route_cache), encoder)
+                        for section in sections]
+        route_cache.save()
+
+    os.makedirs(out_dir, exist_ok=True)
+    order = []
+    results = []
+    work = []
+    stale = 0
+    for lang in editions:
+        title = _title(sections, lang, content_path)
+        for fmt in formats:
+            path = os.path.abspath(os.path.join(out_dir, output_name(data.get('output', ''), lang, fmt)))
+            keys = [_digest(RENDER_VERSION, fingerprint, lang, fmt) for fingerprint in fingerprints]
+            order.append(path)
+            if not force and state.unchanged(path, keys):
+                results.append(OutputResult(path, os.path.getsize(path), len(keys), written=False))
+                continue
+            if force:
+                for key in keys:
+                    try:
+                        os.remove(os.path.join(fragment_dir, f'{key}.{fmt}'))
+                    except FileNotFoundError:
+                        pass
+            stale += sum(len(section) for key, section in zip(keys, sections)
+                         if not os.path.exists(os.path.join(fragment_dir, f'{key}.{fmt}')))
+            work.append(((fmt, lang, path, title, list(zip(keys, sections)), base, route_cache,
+                          fragment_dir, content_path), keys))
+
+    jobs_args = [job for job, _ in work]
+    # A profiled run renders in-process: work done in a pool would not show in it.
+    if len(work) > 1 and jobs != 1 and (jobs or stale >= PARALLEL_THRESHOLD) and not instrument.active():
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            written = list(pool.map(render_output, jobs_args))
+    else:
+        written = [render_output(job) for job in jobs_args]
+    for result, (_, keys) in zip(written, work):
+        state.outputs[result.path] = {'sections': keys, 'size': result.size}
+    results.extend(written)
+    results.sort(key=lambda result: order.index(result.path))
+
+    with instrument.phase('save'):
+        if save_state:
+            state.save()
+        prune_fragments(state, fragment_dir)
+    return results
+
+
+def prune_fragments(state, fragment_dir=FRAGMENT_DIR):
+    """Remove cached fragments no recorded output is made of any more."""
+    live = {key for entry in state.outputs.values() for key in entry['sections']}
+    try:
+        names = os.listdir(fragment_dir)
+    except FileNotFoundError:
+        return
+    for name in names:
+        if name.split('.', 1)[0] not in live:
+            os.remove(os.path.join(fragment_dir, name))
@@ -0,0 +1,329 @@
+"""
+Structured content model of a generated document.
+
+A content file (YAML or JSON) holds an ``output`` file name and a list of
+``blocks``; each block is one mapping whose first key is its kind:
+
+* ``title: text``: document title (centered),
+* ``h1: text`` / ``h2: text``: section headings (left aligned),
+* ``h3: text``: run-in label in the ``Heading 3`` style,
+* ``p: text``: paragraph; optional ``style``, ``align``, ``size`` (pt) and ``italic``,
+* ``lines: [text, ...]`` / ``bullets: [text, ...]``: one paragraph per item,
+  plain or in the ``List Bullet`` style,
+* ``flag_lines`` / ``flag_bullets: [[pt, en], ...]``: the same, one 🇵🇹 and
+  one 🇬🇧 paragraph per pair,
+* ``code: text``: code block (``Intense Quote``),
+* ``table: [[cell, ...], ...]``: table, first row as header; optional ``style``,
+* ``api_reference: dir``: endpoint reference scanned from the Express app in
+  ``dir`` (relative to the content file, see ``docgen/routes.py``); optional
+  ``number`` (section number) and ``details``, hand-written blocks keyed by
+  ``METHOD /path``, each rendered under its own heading with the scanned
+  middleware chain and handler,
+* ``image: path``: picture (relative to the content file), downscaled and
+  recompressed for print by ``docgen.images``; optional ``width`` (cm,
+  default its on-screen size up to the text width), ``caption`` and
+  ``align`` (default ``center``),
+* ``blank`` and ``page_break``, written as bare strings.
+
+Any block may also list ``inputs``, globs of files its text is drawn from
+(relative to the content file), so that ``docgen.build`` re-renders its
+section when they change.
+
+Any text may be a ``{pt: ..., en: ...}`` mapping, joined by ``join`` in the
+bilingual edition (optional ``sep``, default ``' / '``); a paragraph whose text starts with ``PT: `` or ``EN: `` belongs
+to that language only. ``load_content`` expands the file for one edition:
+the bilingual document (``lang=None``) or a single language from ``LANGS``,
+which keeps only that language's text.
+
+The result is a flat list of ``Block`` records, the only thing the
+renderers see.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+
+import instrument
+
+BULLET_STYLE = 'List Bullet'
+CODE_STYLE = 'Intense Quote'
+LABEL_STYLE = 'Heading 3'
+LANGS = ('pt', 'en')
+FLAGS = ('🇵🇹', '🇬🇧')
+TAGS = ('PT: ', 'EN: ')
+REFERENCE_STYLE = 'Light Grid Accent 1'
+REFERENCE_HEADER = (
+    {'pt': 'Método', 'en': 'Method'},
+    {'pt': 'Rota', 'en': 'Path'},
+    'Middleware',
+    'Handler',
+)
+
+PARAGRAPH = 'paragraph'
+HEADING = 'heading'
+TABLE = 'table'
+IMAGE = 'image'
+PAGE_BREAK = 'page_break'
+
+
+class ContentError(ValueError):
+    """A content file does not follow the content model."""
+
+
+@dataclass(frozen=True)
+class Block:
+    kind: str
+    text: str = ''
+    style: str = None
+    align: str = None
+    size: float = None
+    italic: bool = False
+    level: int = 0
+    rows: tuple = ()
+    # IMAGE: the prepared file and its printed size in cm.
+    image: str = None
+    width: float = None
+    height: float = None
+
+
+@dataclass
+class Content:
+    output: str
+    blocks: list
+    lang: str = None
+
+
+def join(pt, en, sep=' / '):
+    """
+    Both languages in one string, with a shared label (up to ``': '``) or
+    numbering and anything from a shared colon on written once:
+    ``'• status: Estado / State'``, ``'3. Dados / Data'``, ``'Teste / Test:'``.
+    """
+    if pt == en:
+        return pt
+    head = os.path.commonprefix([pt, en])
+    head = head[:head.rfind(' ') + 1]
+    if ': ' in head:
+        head = head[:head.rfind(': ') + 2]
+    elif any(char.isalpha() for char in head.split(' ', 1)[0]):
+        head = ''
+    else:
+        head = head.split(' ', 1)[0] + ' ' if head else ''
+    tail = os.path.commonprefix([pt[::-1], en[::-1]])[::-1]
+    tail = tail[tail.find(':'):] if ':' in tail else ''
+    if tail.count('(') != tail.count(')'):
+        tail = ''
+    return head + pt[len(head):len(pt) - len(tail)] + sep + en[len(head):len(en) - len(tail)] + tail
+
+
+def localize(value, lang, where):
+    """The text of ``value`` in the ``lang`` edition, or None if it is not part of it."""
+    if isinstance(value, dict):
+        if any(code not in value for code in LANGS):
+            raise ContentError(f'{where}: localized text needs {", ".join(LANGS)}, got {value!r}')
+        if lang is None:
+            return join(*(str(value[code]) for code in LANGS), sep=value.get('sep', ' / '))
+        return str(value[lang])
+    text = str(value)
+    if lang is not None:
+        for code, tag in zip(LANGS, TAGS):
+            if text.startswith(tag):
+                return text[len(tag):] if code == lang else None
+    return text
+
+
+def outline(block):
+    """
+    ``(role, level)`` of a block for renderers without Word styles: the role
+    is ``'heading'`` (also for paragraphs in a ``Heading n`` style, level n),
+    ``'code'``, ``'bullet'``, ``'paragraph'``, ``TABLE``, ``IMAGE`` or
+    ``PAGE_BREAK``.
+    """
+    if block.kind == HEADING:
+        return 'heading', block.level
+    if block.kind != PARAGRAPH:
+        return block.kind, 0
+    if block.style == CODE_STYLE:
+        return 'code', 0
+    if block.style == BULLET_STYLE:
+        return 'bullet', 0
+    if block.style and block.style.startswith('Heading ') and block.style[8:].isdigit():
+        return 'heading', int(block.style[8:])
+    return 'paragraph', 0
+
+
+def _chain(middleware):
+    return ' → '.join(middleware) or '-'
+
+
+class _Expander:
+    """Expands content-file blocks for one edition."""
+
+    def __init__(self, lang=None, base='.', route_cache=None):
+        self.lang = lang
+        self.base = base
+        self.route_cache = route_cache
+
+    def paragraphs(self, texts, where, style=None, spec=None):
+        spec = spec or {}
+        blocks = []
+        for value in texts:
+            text = localize(value, self.lang, where)
+            if text is not None:
+                blocks.append(Block(PARAGRAPH, text, spec.get('style', style), spec.get('align'),
+                                    spec.get('size'), bool(spec.get('italic', False))))
+        return blocks
+
+    def pairs(self, pairs, where, style):
+        blocks = []
+        for pair in pairs:
+            if not isinstance(pair, (list, tuple)) or len(pair) != len(LANGS):
+                raise ContentError(f'{where}: expected [pt, en] pairs, got {pair!r}')
+            for code, flag, text in zip(LANGS, FLAGS, pair):
+                if self.lang is None:
+                    blocks.append(Block(PARAGRAPH, f'{flag} {text}', style))
+                elif code == self.lang:
+                    blocks.append(Block(PARAGRAPH, str(text), style))
+        return blocks
+
+    def heading(self, value, level, where, align='left'):
+        text = localize(value, self.lang, where)
+        return [Block(HEADING, text, level=level, align=align)] if text is not None else []
+
+    def table(self, rows, where, style):
+        rows = tuple(tuple(localize(cell, self.lang, where) or '' for cell in row) for row in rows)
+        if not rows or len({len(row) for row in rows}) != 1:
+            raise ContentError(f'{where}: table rows must all have the same number of cells')
+        return [Block(TABLE, style=style, rows=rows)]
+
+    def image(self, spec, where):
+        from .images import natural_width, prepare
+
+        source = os.path.normpath(os.path.join(self.base, str(spec['image'])))
+        if not os.path.isfile(source):
+            raise ContentError(f'{where}: image {spec["image"]!r} not found')
+        try:
+            width = float(spec['width']) if 'width' in spec else natural_width(source)
+            prepared = prepare(source, width)
+        except ValueError as e:
+            raise ContentError(f'{where}: {e}') from None
+        caption = localize(spec.get('caption', ''), self.lang, where) or ''
+        return [Block(IMAGE, caption, align=spec.get('align', 'center'), image=prepared.path,
+                      width=width, height=round(width * prepared.height / prepared.width, 3))]
+
+    def api_reference(self, spec, where):
+        from .routes import DEFAULT_CACHE, RouteCache, build_reference
+
+        cache = self.route_cache if self.route_cache is not None else RouteCache.load(DEFAULT_CACHE)
+        reference = build_reference(os.path.normpath(os.path.join(self.base, str(spec['api_reference']))),
+                                    cache=cache)
+        if self.route_cache is None:
+            cache.save()
+        if not reference.endpoints:
+            raise ContentError(f'{where}: no endpoints found under {spec["api_reference"]!r}')
+
+        number = spec.get('number')
+        prefix = f'{number}.' if number is not None else ''
+        blocks = []
+        details = spec.get('details') or {}
+        for k, (key, detail) in enumerate(details.items(), 1):
+            method, _, path = str(key).partition(' ')
+            endpoint = reference.find(method, path.strip())
+            if endpoint is None:
+                raise ContentError(f'{where}: {key!r} is not an endpoint of the API any more')
+            blocks += self.heading(f'{prefix}{k} {endpoint.method} {endpoint.path}', 2, where)
+            blocks += self.paragraphs([f'Middleware: {_chain(endpoint.middleware)}',
+                                       f'Handler: {endpoint.handler} ({endpoint.file}:{endpoint.line})'], where)
+            for i, sub in enumerate(detail or []):
+                blocks += self.expand(sub, f'{where}: {key}: block {i + 1}')
+
+        count = len(reference.endpoints)
+        blocks += self.heading({'pt': f'{prefix}{len(details) + 1} Referência Completa',
+                                'en': f'{prefix}{len(details) + 1} Full Reference'}, 2, where)
+        blocks += self.paragraphs([f'PT: {count} endpoints, gerados a partir do código da API.',
+                                   f'EN: {count} endpoints, generated from the API source code.'], where)
+        if reference.global_middleware:
+            blocks += self.paragraphs([{'pt': 'Middleware global:', 'en': 'Global middleware:'}], where,
+                                      LABEL_STYLE)
+            blocks += self.paragraphs([f'• {name}' for name in reference.global_middleware], where, BULLET_STYLE)
+        for mount in reference.mounts:
+            blocks += self.paragraphs([f'{mount.prefix} ({mount.file})'], where, LABEL_STYLE)
+            rows = [REFERENCE_HEADER]
+            rows.extend((e.method, e.path, _chain(e.middleware), e.handler) for e in mount.endpoints)
+            blocks += self.table(rows, where, spec.get('style', REFERENCE_STYLE))
+        return blocks
+
+    def expand(self, spec, where='block'):
+        if spec == 'blank':
+            return [Block(PARAGRAPH)]
+        if spec == 'page_break':
+            return [Block(PAGE_BREAK)]
+        if not isinstance(spec, dict) or not spec:
+            raise ContentError(f'{where}: expected a mapping, "blank" or "page_break", got {spec!r}')
+        kind, value = next(iter(spec.items()))
+        if kind == 'title':
+            return self.heading(value, 0, where, align='center')
+        if kind in ('h1', 'h2'):
+            return self.heading(value, int(kind[1]), where)
+        if kind == 'h3':
+            return self.paragraphs([value], where, LABEL_STYLE)
+        if kind == 'p':
+            return self.paragraphs([value], where, spec=spec)
+        if kind == 'lines':
+            return self.paragraphs(value, where)
+        if kind == 'bullets':
+            return self.paragraphs(value, where, BULLET_STYLE)
+        if kind == 'flag_lines':
+            return self.pairs(value, where, None)
+        if kind == 'flag_bullets':
+            return self.pairs(value, where, BULLET_STYLE)
+        if kind == 'code':
+            # Blank line above and below the code, as in the hand-written document.
+            return [Block(PARAGRAPH, '\n' + str(value).strip('\n') + '\n', CODE_STYLE)]
+        if kind == 'table':
+            return self.table(value, where, spec.get('style'))
+        if kind == 'image':
+            return self.image(spec, where)
+        if kind == 'api_reference':
+            return self.api_reference(spec, where)
+        raise ContentError(f'{where}: unknown block kind {kind!r}')
+
+
+def expand(spec, where='block', base='.', lang=None, route_cache=None):
+    """
+    The ``Block`` records of one content-file block; paths are relative to
+    ``base``. ``api_reference`` scans through ``route_cache`` if given (the
+    caller saves it), else through the default cache file.
+    """
+    return _Expander(lang, base, route_cache).expand(spec, where)
+
+
+def parse_content(data, where='content', base='.', lang=None, route_cache=None):
+    if lang is not None and lang not in LANGS:
+        raise ContentError(f'{where}: unknown language {lang!r} (expected one of {", ".join(LANGS)})')
+    if not isinstance(data, dict) or not isinstance(data.get('blocks'), list):
+        raise ContentError(f'{where}: expected a mapping with a "blocks" list')
+    expander = _Expander(lang, base, route_cache)
+    blocks = []
+    for i, spec in enumerate(data['blocks']):
+        blocks.extend(expander.expand(spec, f'{where}: block {i + 1}'))
+    return Content(data.get('output', ''), blocks, lang)
+
+
+def read_content(path):
+    """The raw data of a ``.yaml``/``.yml`` (needs PyYAML) or ``.json`` content file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+        instrument.count_read(os.fstat(f.fileno()).st_size)
+    if os.path.splitext(path)[1] in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ContentError(f'{path}: reading YAML content needs PyYAML (pip install pyyaml)') from None
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+
+def load_content(path, lang=None, route_cache=None):
+    """Read and expand a content file for the ``lang`` edition (None: bilingual)."""
+    return parse_content(read_content(path), path, os.path.dirname(os.path.abspath(path)), lang, route_cache)
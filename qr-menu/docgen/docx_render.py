@@ -0,0 +1,187 @@
+"""
+Bulk DOCX rendering of ``Block`` records.
+
+python-docx builds a document one element at a time: every
+``add_paragraph`` resolves its style name against the styles part, creates
+and attaches lxml elements one by one, and a table is filled cell by cell
+through ``table.rows[i].cells[j]``, which rebuilds the cell grid on every
+access. This renderer resolves each style once, writes the WordprocessingML
+of the whole body as one string, parses it in a single ``parse_xml`` call
+and splices the result into the document body before its section
+properties.
+
+The markup is what python-docx itself writes for the same calls
+(``add_heading``, ``add_paragraph``, ``add_page_break``, ``add_table``,
+``add_picture``, run font size and italics), so the output looks the same.
+Pictures are written with a placeholder relationship id naming the image
+file, so that body XML can be cached; ``splice`` adds the image parts to
+the document it is spliced into.
+"""
+
+import itertools
+import os
+import re
+from xml.sax.saxutils import escape, unescape
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Cm, Emu
+
+from .content import HEADING, IMAGE, PAGE_BREAK, PARAGRAPH, TABLE
+
+CAPTION_STYLE = 'Caption'
+_QUOTE = {'"': '&quot;'}
+_IMAGE_REF = re.compile(r'r:embed="@([^"]*)"')
+_PENDING_ID = re.compile(r'<wp:docPr id="0"')
+
+# Table properties python-docx writes for ``add_table`` (auto width, default look).
+_TBL_PROPS = ('<w:tblW w:type="auto" w:w="0"/>'
+              '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+              'w:noHBand="0" w:noVBand="1" w:val="04A0"/>')
+
+
+class StyleIds:
+    """Paragraph/table style names resolved to style ids, once per name."""
+
+    def __init__(self, doc):
+        self._styles = doc.styles
+        self._ids = {}
+
+    def __getitem__(self, name):
+        found = self._ids.get(name)
+        if found is None:
+            found = self._ids[name] = self._styles[name].style_id
+        return found
+
+
+def _t(text):
+    preserve = ' xml:space="preserve"' if text.strip() != text else ''
+    return f'<w:t{preserve}>{escape(text)}</w:t>'
+
+
+def run_content(text):
+    """Run children for ``text``, with tabs and line breaks as python-docx writes them."""
+    parts = []
+    start = 0
+    for i, char in enumerate(text):
+        if char in '\t\n\r':
+            if i > start:
+                parts.append(_t(text[start:i]))
+            parts.append('<w:tab/>' if char == '\t' else '<w:br/>')
+            start = i + 1
+    if start < len(text):
+        parts.append(_t(text[start:]))
+    return ''.join(parts)
+
+
+def paragraph_xml(text='', style_id=None, align=None, size=None, italic=False):
+    props = ''
+    if style_id:
+        props += f'<w:pStyle w:val="{style_id}"/>'
+    if align:
+        props += f'<w:jc w:val="{align}"/>'
+    ppr = f'<w:pPr>{props}</w:pPr>' if props else ''
+    if not text:
+        return f'<w:p>{ppr}</w:p>' if ppr else '<w:p/>'
+    rpr = ('<w:i/>' if italic else '') + (f'<w:sz w:val="{round(size * 2)}"/>' if size else '')
+    rpr = f'<w:rPr>{rpr}</w:rPr>' if rpr else ''
+    return f'<w:p>{ppr}<w:r>{rpr}{run_content(text)}</w:r></w:p>'
+
+
+PAGE_BREAK_XML = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+
+def table_xml(rows, style_id, col_width):
+    """``rows`` of cell texts; ``col_width`` in twips."""
+    style = f'<w:tblStyle w:val="{style_id}"/>' if style_id else ''
+    grid = f'<w:gridCol w:w="{col_width}"/>' * len(rows[0])
+    tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/></w:tcPr>'
+    body = ''.join(
+        '<w:tr>' + ''.join(f'<w:tc>{tc_pr}{paragraph_xml(cell)}</w:tc>' for cell in row) + '</w:tr>'
+        for row in rows
+    )
+    return f'<w:tbl><w:tblPr>{style}{_TBL_PROPS}</w:tblPr><w:tblGrid>{grid}</w:tblGrid>{body}</w:tbl>'
+
+
+def image_xml(path, width_cm, height_cm):
+    """An inline picture of ``path``, as ``add_picture`` writes it but with a placeholder id."""
+    cx, cy = Cm(width_cm), Cm(height_cm)
+    name = escape(os.path.basename(path), _QUOTE)
+    return (
+        '<w:r><w:drawing><wp:inline distT="0" distB="0" distL="0" distR="0">'
+        f'<wp:extent cx="{cx}" cy="{cy}"/><wp:docPr id="0" name="{name}"/>'
+        '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture"><pic:pic>'
+        f'<pic:nvPicPr><pic:cNvPr id="0" name="{name}"/><pic:cNvPicPr/></pic:nvPicPr>'
+        f'<pic:blipFill><a:blip r:embed="@{escape(path, _QUOTE)}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+        f'<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"/></pic:spPr>'
+        '</pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing></w:r>'
+    )
+
+
+def body_xml(blocks, styles, block_width):
+    """WordprocessingML of ``blocks``, as a list of strings."""
+    parts = []
+    for block in blocks:
+        if block.kind == PARAGRAPH:
+            style_id = styles[block.style] if block.style else None
+            parts.append(paragraph_xml(block.text, style_id, block.align, block.size, block.italic))
+        elif block.kind == HEADING:
+            style_id = styles['Title' if block.level == 0 else f'Heading {block.level}']
+            parts.append(paragraph_xml(block.text, style_id, block.align))
+        elif block.kind == PAGE_BREAK:
+            parts.append(PAGE_BREAK_XML)
+        elif block.kind == TABLE:
+            style_id = styles[block.style] if block.style else None
+            parts.append(table_xml(block.rows, style_id, Emu(block_width // len(block.rows[0])).twips))
+        elif block.kind == IMAGE:
+            jc = f'<w:pPr><w:jc w:val="{block.align}"/></w:pPr>' if block.align else ''
+            parts.append(f'<w:p>{jc}{image_xml(block.image, block.width, block.height)}</w:p>')
+            if block.text:
+                parts.append(paragraph_xml(block.text, styles[CAPTION_STYLE], block.align))
+        else:
+            raise ValueError(f'cannot render block kind {block.kind!r}')
+    return parts
+
+
+def new_document():
+    """The document the bodies are rendered into, with its style ids and text width."""
+    doc = Document()
+    section = doc.sections[-1]
+    return doc, StyleIds(doc), section.page_width - section.left_margin - section.right_margin
+
+
+def fragment_xml(blocks, styles, block_width):
+    """The WordprocessingML of ``blocks`` as one string, to be cached and spliced later."""
+    return ''.join(body_xml(blocks, styles, block_width))
+
+
+def _add_images(doc, xml):
+    """``xml`` with picture placeholders resolved against ``doc``, adding each image part once."""
+    xml = _IMAGE_REF.sub(lambda m: f'r:embed="{doc.part.get_or_add_image(unescape(m.group(1), _QUOTE))[0]}"', xml)
+    taken = [int(shape_id) for shape_id in doc.element.body.xpath('//wp:docPr/@id')]
+    ids = itertools.count(max(taken, default=0) + 1)
+    return _PENDING_ID.sub(lambda m: f'<wp:docPr id="{next(ids)}"', xml)
+
+
+def splice(doc, fragments):
+    """Append the body ``fragments`` (WordprocessingML strings) to ``doc`` in one parse."""
+    xml = ''.join(fragments)
+    if 'r:embed="@' in xml:
+        xml = _add_images(doc, xml)
+    fragment = parse_xml(f'<w:body {nsdecls("w", "wp", "a", "pic", "r")}>{xml}</w:body>')
+    body = doc.element.body
+    sect_pr = body.sectPr
+    at = body.index(sect_pr) if sect_pr is not None else len(body)
+    body[at:at] = list(fragment)
+    return doc
+
+
+def render_docx(blocks, doc=None):
+    """Append ``blocks`` to ``doc`` (a new default document if None) and return it."""
+    doc = doc if doc is not None else Document()
+    section = doc.sections[-1]
+    block_width = section.page_width - section.left_margin - section.right_margin
+    return splice(doc, body_xml(blocks, StyleIds(doc), block_width))
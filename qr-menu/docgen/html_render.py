@@ -0,0 +1,104 @@
+"""
+Static HTML rendering of ``Block`` records: one page with a small inline
+stylesheet. Page breaks become print page breaks; images are ``<figure>``
+elements linking into ``image_dir`` (the caller copies the files there).
+"""
+
+import re
+from html import escape
+
+from .content import HEADING, IMAGE, PAGE_BREAK, TABLE, outline
+from .markdown_render import image_link
+
+_BULLET = re.compile(r'^[•·-]\s*')
+
+STYLESHEET = """
+body { font-family: Calibri, Arial, sans-serif; max-width: 52rem; margin: 2rem auto; padding: 0 1rem;
+       line-height: 1.5; color: #222; }
+h1 { text-align: center; }
+h2 { border-bottom: 1px solid #ccc; padding-bottom: .2rem; }
+pre { background: #f4f6fa; border-left: 3px solid #4f81bd; padding: .8rem 1rem; overflow-x: auto; }
+table { border-collapse: collapse; width: 100%; margin: 1rem 0; }
+th, td { border: 1px solid #b8cce4; padding: .3rem .5rem; text-align: left; vertical-align: top; }
+th { background: #dbe5f1; }
+hr.page-break { border: 0; margin: 2rem 0; break-after: page; }
+figure { margin: 1rem 0; }
+figure img { max-width: 100%; height: auto; }
+figcaption { font-size: .9em; color: #555; font-style: italic; }
+"""
+
+
+def _text(text):
+    return escape(text).replace('\n', '<br>')
+
+
+def _paragraph(block):
+    style = []
+    if block.align:
+        style.append(f'text-align: {block.align}')
+    if block.size:
+        style.append(f'font-size: {block.size}pt')
+    if block.italic:
+        style.append('font-style: italic')
+    attr = f' style="{"; ".join(style)}"' if style else ''
+    return f'<p{attr}>{_text(block.text)}</p>'
+
+
+def _figure(block, image_dir):
+    align = f' style="text-align: {block.align}"' if block.align else ''
+    caption = f'<figcaption>{_text(block.text)}</figcaption>' if block.text else ''
+    return (f'<figure{align}><img src="{escape(image_link(block.image, image_dir))}" '
+            f'alt="{escape(block.text)}" style="width: {block.width}cm">{caption}</figure>')
+
+
+def html_body(blocks, image_dir='images'):
+    """The ``<body>`` markup of ``blocks``; a list never runs past the last block."""
+    body = []
+    in_list = False
+    for block in blocks:
+        role, level = outline(block)
+        if in_list and role != 'bullet':
+            body.append('</ul>')
+            in_list = False
+        if role == 'heading':
+            tag = f'h{min(level + 1, 6)}'
+            body.append(f'<{tag}>{_text(block.text)}</{tag}>')
+        elif role == 'code':
+            body.append(f'<pre><code>{escape(block.text.strip(chr(10)))}</code></pre>')
+        elif role == 'bullet':
+            if not in_list:
+                body.append('<ul>')
+                in_list = True
+            body.append(f'<li>{_text(_BULLET.sub("", block.text))}</li>')
+        elif role == TABLE:
+            header, *rows = block.rows
+            body.append('<table><thead><tr>' + ''.join(f'<th>{_text(cell)}</th>' for cell in header)
+                        + '</tr></thead><tbody>')
+            body.extend('<tr>' + ''.join(f'<td>{_text(cell)}</td>' for cell in row) + '</tr>' for row in rows)
+            body.append('</tbody></table>')
+        elif role == IMAGE:
+            body.append(_figure(block, image_dir))
+        elif role == PAGE_BREAK:
+            body.append('<hr class="page-break">')
+        elif block.text:
+            body.append(_paragraph(block))
+    if in_list:
+        body.append('</ul>')
+    return ''.join(line + '\n' for line in body)
+
+
+def html_page(body, title='', lang=None):
+    """A complete HTML page around ``body`` markup."""
+    lang_attr = f' lang="{lang}"' if lang else ''
+    return (f'<!DOCTYPE html>\n<html{lang_attr}>\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{escape(title)}</title>\n<style>{STYLESHEET}</style>\n</head>\n<body>\n'
+            + body + '</body>\n</html>\n')
+
+
+def document_title(blocks):
+    return next((block.text for block in blocks if block.kind == HEADING and block.level == 0), '')
+
+
+def render_html(blocks, title='', lang=None, image_dir='images'):
+    """A complete HTML page of ``blocks``; ``title`` defaults to the document title block."""
+    return html_page(html_body(blocks, image_dir), title or document_title(blocks), lang)
@@ -0,0 +1,162 @@
+"""
+Images prepared for embedding: downscaled to their print width and
+recompressed, through a persistent cache.
+
+A screenshot is usually far wider, in pixels, than its printed width needs
+at ``PRINT_DPI``; embedding it as is makes documents large and slow to open
+and send. ``prepare`` resizes it to the target width, encodes it as PNG and
+(when it has no transparency) as JPEG, and keeps whichever is smallest,
+the untouched source included. The result is stored in
+``.docgen-cache/images`` under a key made of the source's content hash, the
+target width and the encoder settings, so a rebuild never re-encodes an
+image that did not change.
+
+Resizing needs Pillow (``pip install pillow``). Without it the source is
+used unchanged, with a warning; image sizes are then read from the file
+headers (PNG, JPEG, GIF).
+"""
+
+import hashlib
+import io
+import os
+import struct
+import warnings
+from dataclasses import dataclass
+
+import instrument
+from filecache import write_atomic
+
+from .routes import CACHE_DIR as DOCGEN_CACHE_DIR
+
+CACHE_DIR = os.path.join(DOCGEN_CACHE_DIR, 'images')
+CACHE_VERSION = 1
+PRINT_DPI = 150
+# Pixel density screenshots are taken at, for their default printed size.
+SCREEN_DPI = 96
+JPEG_QUALITY = 85
+# Text width of the default python-docx page: 8.5in less two 1.25in margins.
+TEXT_WIDTH_CM = 15.24
+FORMATS = {b'\x89PNG': 'png', b'\xff\xd8': 'jpg', b'GIF8': 'gif'}
+
+
+@dataclass
+class PreparedImage:
+    path: str
+    width: int
+    height: int
+    source_bytes: int
+    bytes: int
+
+
+def image_format(data):
+    for magic, ext in FORMATS.items():
+        if data.startswith(magic):
+            return ext
+    return None
+
+
+def image_size(data):
+    """``(width, height)`` in pixels from the header of PNG, JPEG or GIF ``data``."""
+    ext = image_format(data)
+    if ext == 'png':
+        return struct.unpack('>II', data[16:24])
+    if ext == 'gif':
+        return struct.unpack('<HH', data[6:10])
+    if ext == 'jpg':
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                i += 2
+                continue
+            length = struct.unpack('>H', data[i + 2:i + 4])[0]
+            # Start-of-frame markers (all but DHT, JPG, DAC) carry the size.
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return width, height
+            i += 2 + length
+    raise ValueError('not a PNG, JPEG or GIF image (or a truncated one)')
+
+
+def natural_width(source, max_cm=TEXT_WIDTH_CM):
+    """Printed width (cm) of ``source`` at its on-screen size, at most ``max_cm``."""
+    with open(source, 'rb') as f:
+        header = f.read(65536)
+    return min(max_cm, round(image_size(header)[0] / SCREEN_DPI * 2.54, 2))
+
+
+def target_width(width_cm, dpi=PRINT_DPI):
+    return max(1, round(width_cm / 2.54 * dpi))
+
+
+def _encode(data, width):
+    """Candidate encodings of ``data`` downscaled to at most ``width`` pixels, as ``[(ext, bytes)]``."""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as opened:
+        image = ImageOps.exif_transpose(opened)
+        if image.width > width:
+            image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+        alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+        if alpha and image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        elif not alpha and image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        if alpha and image.getchannel('A').getextrema() == (255, 255):
+            # Screenshots are often saved as RGBA without using the transparency.
+            image, alpha = image.convert('RGB'), False
+        candidates = []
+        out = io.BytesIO()
+        image.save(out, 'PNG', optimize=True)
+        candidates.append(('png', out.getvalue()))
+        if not alpha:
+            out = io.BytesIO()
+            image.save(out, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+            candidates.append(('jpg', out.getvalue()))
+        return candidates, image.width
+
+
+_warned = False
+
+
+def prepare(source, width_cm=TEXT_WIDTH_CM, dpi=PRINT_DPI, cache_dir=CACHE_DIR):
+    """The image at ``source`` ready to print ``width_cm`` wide, from the cache when possible."""
+    global _warned
+    with open(source, 'rb') as f:
+        data = f.read()
+    instrument.count_read(len(data))
+    ext = image_format(data)
+    if ext is None:
+        raise ValueError(f'{source}: not a PNG, JPEG or GIF image')
+    width = target_width(width_cm, dpi)
+    key = hashlib.blake2b(data, digest_size=16)
+    key.update(f'{width}:{JPEG_QUALITY}:{CACHE_VERSION}'.encode())
+    key = key.hexdigest()
+    for cached_ext in ('png', 'jpg', ext):
+        cached = os.path.join(cache_dir, f'{key}.{cached_ext}')
+        if os.path.exists(cached):
+            with open(cached, 'rb') as f:
+                prepared = f.read()
+            instrument.count_read(len(prepared))
+            return PreparedImage(cached, *image_size(prepared), len(data), len(prepared))
+
+    try:
+        candidates, encoded_width = _encode(data, width)
+    except ImportError:
+        if not _warned:
+            warnings.warn('Pillow is not installed: images are embedded at full size (pip install pillow)')
+            _warned = True
+        return PreparedImage(source, *image_size(data), len(data), len(data))
+    if encoded_width == image_size(data)[0]:
+        # Not downscaled: the source itself may already be the smallest encoding.
+        candidates.append((ext, data))
+    best_ext, best = min(candidates, key=lambda candidate: len(candidate[1]))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    cached = os.path.join(cache_dir, f'{key}.{best_ext}')
+    # Parallel renderers may prepare the same image: each writes aside, then renames.
+    write_atomic(cached, best)
+    return PreparedImage(cached, *image_size(best), len(data), len(best))
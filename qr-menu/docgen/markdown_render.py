@@ -0,0 +1,66 @@
+"""
+Markdown rendering of ``Block`` records.
+
+Headings map to ``#`` levels (the title is ``#``, ``h1`` is ``##``, labels
+in ``Heading 3`` are ``####``), ``List Bullet`` paragraphs to list items,
+``Intense Quote`` to fenced code, tables to pipe tables and images to
+links into ``image_dir`` (the caller copies the files there). Alignment
+and font sizes have no Markdown form and are dropped.
+"""
+
+import os
+import re
+from urllib.parse import quote
+
+from .content import IMAGE, PAGE_BREAK, TABLE, outline
+
+_SPECIAL = re.compile(r'([\\`*_\[\]<])')
+_BULLET = re.compile(r'^[•·-]\s*')
+
+
+def escape(text):
+    return _SPECIAL.sub(r'\\\1', text)
+
+
+def _cell(text):
+    return escape(text).replace('|', '\\|').replace('\n', '<br>')
+
+
+def image_link(path, image_dir='images'):
+    return quote(f'{image_dir}/{os.path.basename(path)}')
+
+
+def render_markdown(blocks, image_dir='images'):
+    """The Markdown text of ``blocks``, ending in a newline."""
+    out = []
+    previous = None
+    for block in blocks:
+        role, level = outline(block)
+        if role == 'paragraph' and not block.text:
+            previous = None
+            continue
+        # Consecutive list items stay in one list; everything else is a paragraph.
+        if out and not (role == previous == 'bullet'):
+            out.append('')
+        if role == 'heading':
+            out.append('#' * (level + 1) + ' ' + escape(block.text))
+        elif role == 'code':
+            out.extend(['```', block.text.strip('\n'), '```'])
+        elif role == 'bullet':
+            out.append('- ' + escape(_BULLET.sub('', block.text)))
+        elif role == TABLE:
+            header, *rows = block.rows
+            out.append('| ' + ' | '.join(_cell(cell) for cell in header) + ' |')
+            out.append('|' + ' --- |' * len(header))
+            out.extend('| ' + ' | '.join(_cell(cell) for cell in row) + ' |' for row in rows)
+        elif role == IMAGE:
+            out.append(f'![{escape(block.text)}]({image_link(block.image, image_dir)})')
+            if block.text:
+                out.extend(['', f'*{escape(block.text)}*'])
+        elif role == PAGE_BREAK:
+            out.append('---')
+        else:
+            text = escape(block.text).replace('\n', '  \n')
+            out.append(f'*{text}*' if block.italic else text)
+        previous = role
+    return '\n'.join(out) + '\n'
@@ -0,0 +1,311 @@
+"""
+Endpoint reference scanned from the Express sources in ``api/``.
+
+Every JS file is lexed just enough to blank out comments, strings,
+template literals and regex literals, then searched for Express routers
+(``express()``, ``express.Router()``), their local imports and their
+``<router>.get/post/put/patch/delete/all/use(...)`` calls, with each call's
+top-level arguments: path, middleware chain, handler.
+
+Parse results are cached per file in ``.docgen-cache/routes.json`` by
+``filecache.FileCache``: a file whose mtime and size did not change is not
+read, and one whose content hash did not change is not parsed again.
+``resolve`` then follows ``use('/prefix', importedRouter)`` mounts from the
+app entry point into full endpoint paths.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+
+from filecache import FileCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API_DIR = os.path.join(ROOT, 'api')
+ENTRY_POINT = 'index.js'
+CACHE_DIR = os.path.join(ROOT, '.docgen-cache')
+DEFAULT_CACHE = os.path.join(CACHE_DIR, 'routes.json')
+CACHE_VERSION = 1
+
+SKIP_DIRS = {'node_modules', 'tests', 'scripts', 'uploads', 'coverage'}
+
+METHODS = ('get', 'post', 'put', 'patch', 'delete', 'all', 'use')
+ROUTER_DECL = re.compile(r'\b(?:const|let|var)\s+(\w+)\s*=\s*(?:express\s*\.\s*Router|Router|express)\s*\(\s*\)')
+IMPORT = re.compile(r'''\bimport\s+(\w+)\s+from\s+(['"])(\.[^'"]*)\2''')
+REQUIRE = re.compile(r'''\b(?:const|let|var)\s+(\w+)\s*=\s*require\(\s*(['"])(\.[^'"]*)\2\s*\)''')
+EXPORT_DEFAULT = re.compile(r'\bexport\s+default\s+(\w+)|\bmodule\.exports\s*=\s*(\w+)')
+# A "/" after one of these starts a regex literal, not a division.
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^') | {''}
+_SPACES = re.compile(r'\s+')
+
+
+def mask(text):
+    """
+    ``text`` with the contents of comments, strings, template literals and
+    regex literals replaced by spaces (newlines kept), so brackets and
+    commas can be matched on the result at the same offsets.
+    """
+    out = list(text)
+    i, n = 0, len(text)
+    last = ''  # last significant character, to tell regexes from divisions
+
+    def blank(start, end):
+        for k in range(start, end):
+            if out[k] != '\n':
+                out[k] = ' '
+
+    while i < n:
+        c = text[i]
+        nxt = text[i + 1] if i + 1 < n else ''
+        if c == '/' and nxt == '/':
+            end = text.find('\n', i)
+            end = n if end < 0 else end
+            blank(i, end)
+            i = end
+        elif c == '/' and nxt == '*':
+            end = text.find('*/', i + 2)
+            end = n if end < 0 else end + 2
+            blank(i, end)
+            i = end
+        elif c in '\'"`':
+            j = i + 1
+            depth = 0
+            while j < n:
+                d = text[j]
+                if d == '\\':
+                    j += 2
+                    continue
+                if c == '`' and d == '$' and text[j + 1:j + 2] == '{':
+                    depth += 1
+                elif c == '`' and d == '}' and depth:
+                    depth -= 1
+                elif d == c and not depth:
+                    break
+                elif d == '\n' and c != '`':
+                    break
+                j += 1
+            blank(i + 1, min(j, n))
+            i = j + 1
+            last = c
+        elif c == '/' and last in _REGEX_PRECEDERS:
+            j = i + 1
+            in_class = False
+            while j < n and text[j] != '\n':
+                d = text[j]
+                if d == '\\':
+                    j += 2
+                    continue
+                if d == '[':
+                    in_class = True
+                elif d == ']':
+                    in_class = False
+                elif d == '/' and not in_class:
+                    break
+                j += 1
+            blank(i + 1, min(j, n))
+            i = j + 1
+            last = '/'
+        else:
+            if not c.isspace():
+                last = c if not (c.isalnum() or c in '_$') else 'a'
+            i += 1
+    return ''.join(out)
+
+
+def _closing(masked, start):
+    """Offset of the bracket closing the one at ``start``."""
+    depth = 0
+    for i in range(start, len(masked)):
+        c = masked[i]
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _split_args(text, masked, start, end):
+    """Top-level arguments between ``start`` and ``end``, with their offsets."""
+    args = []
+    depth = 0
+    begin = start
+    for i in range(start, end):
+        c = masked[i]
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            args.append((begin, i))
+            begin = i + 1
+    args.append((begin, end))
+    return [(text[a:b].strip(), a + len(text[a:b]) - len(text[a:b].lstrip()))
+            for a, b in args if text[a:b].strip()]
+
+
+def _literal(arg):
+    """The value of a plain string literal argument, or None."""
+    if len(arg) >= 2 and arg[0] == arg[-1] and arg[0] in '\'"`' and '${' not in arg:
+        return arg[1:-1]
+    return None
+
+
+def describe(arg):
+    """Short label of a middleware or handler argument."""
+    if re.match(r'^(?:async\s+)?(?:function\b|\(?[\w\s,{}]*\)?\s*=>)', arg):
+        return 'inline'
+    label = _SPACES.sub(' ', arg)
+    call = re.match(r'^([\w.$]+)\(', label)
+    if len(label) > 60 and call:
+        return call.group(1) + '(...)'
+    return label if len(label) <= 60 else label[:57] + '...'
+
+
+def parse_source(text):
+    """Routers, local imports and router calls of one JS file (JSON-serializable)."""
+    masked = mask(text)
+    routers = [m.group(1) for m in ROUTER_DECL.finditer(masked)]
+    imports = {m.group(1): m.group(3) for m in IMPORT.finditer(text) if masked[m.start():m.start() + 6] == 'import'}
+    imports.update((m.group(1), m.group(3)) for m in REQUIRE.finditer(text))
+    exported = [m.group(1) or m.group(2) for m in EXPORT_DEFAULT.finditer(masked)]
+    calls = []
+    if routers:
+        call = re.compile(r'\b(%s)\s*\.\s*(%s)\s*\(' % ('|'.join(map(re.escape, routers)), '|'.join(METHODS)))
+        for m in call.finditer(masked):
+            open_at = m.end() - 1
+            close_at = _closing(masked, open_at)
+            if close_at < 0:
+                continue
+            args = _split_args(text, masked, open_at + 1, close_at)
+            path = _literal(args[0][0]) if args else None
+            rest = args[1:] if path is not None else args
+            calls.append({
+                'router': m.group(1),
+                'method': m.group(2),
+                'path': path,
+                'args': [arg for arg, _ in rest],
+                'line': text.count('\n', 0, m.start()) + 1,
+            })
+    return {
+        'routers': routers,
+        'imports': imports,
+        'export': exported[-1] if exported else None,
+        'calls': calls,
+    }
+
+
+def source_files(api_dir=API_DIR):
+    found = []
+    for dirpath, dirnames, filenames in os.walk(api_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.'))
+        found.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(('.js', '.mjs', '.cjs')))
+    return sorted(found)
+
+
+class RouteCache(FileCache):
+    """Per-file parse results keyed by path (``filecache.FileCache``)."""
+
+    def __init__(self, path=DEFAULT_CACHE, files=None):
+        super().__init__(path, parse_source, files, CACHE_VERSION)
+
+
+@dataclass
+class Endpoint:
+    method: str
+    path: str
+    middleware: list
+    handler: str
+    file: str
+    line: int
+
+
+@dataclass
+class Mount:
+    """A router file mounted under ``prefix``, with its endpoints in source order."""
+
+    prefix: str
+    file: str
+    endpoints: list = field(default_factory=list)
+
+
+@dataclass
+class Reference:
+    # Middleware the entry point applies to every request (or to a path prefix).
+    global_middleware: list = field(default_factory=list)
+    mounts: list = field(default_factory=list)
+
+    @property
+    def endpoints(self):
+        return [endpoint for mount in self.mounts for endpoint in mount.endpoints]
+
+    def find(self, method, path):
+        for endpoint in self.endpoints:
+            if endpoint.method == method.upper() and endpoint.path == path:
+                return endpoint
+        return None
+
+
+def join_path(prefix, path):
+    joined = '/' + '/'.join(part for part in (prefix + '/' + path).split('/') if part)
+    return joined
+
+
+def _resolve_import(file, spec):
+    path = os.path.normpath(os.path.join(os.path.dirname(file), spec))
+    if not os.path.splitext(path)[1]:
+        path += '.js'
+    return path
+
+
+def resolve(entries, entry_point, api_dir=API_DIR):
+    """Walk the mounts from ``entry_point`` and return a ``Reference``."""
+    reference = Reference()
+
+    def walk(file, prefix, inherited, router=None, seen=()):
+        entry = entries.get(file)
+        if entry is None or file in seen:
+            return
+        router = router or entry['export'] or (entry['routers'][0] if entry['routers'] else None)
+        mount = Mount(prefix or '/', os.path.relpath(file, api_dir))
+        reference.mounts.append(mount)
+        stack = list(inherited)
+        for call in entry['calls']:
+            if call['router'] != router:
+                continue
+            if call['method'] == 'use':
+                sub = [arg for arg in call['args'] if arg in entry['imports']]
+                if sub:
+                    target = _resolve_import(file, entry['imports'][sub[0]])
+                    own = [describe(arg) for arg in call['args'] if arg not in sub]
+                    walk(target, join_path(prefix, call['path'] or ''), stack + own, seen=seen + (file,))
+                elif not inherited and not seen:
+                    # Entry point middleware applies to every request: listed once.
+                    scope = f" ({call['path']})" if call['path'] else ''
+                    reference.global_middleware.extend(describe(arg) + scope for arg in call['args'])
+                elif call['path'] is None:
+                    stack.extend(describe(arg) for arg in call['args'])
+                continue
+            if call['path'] is None or not call['args']:
+                continue
+            *middleware, handler = call['args']
+            mount.endpoints.append(Endpoint(
+                call['method'].upper(),
+                join_path(prefix, call['path']),
+                stack + [describe(arg) for arg in middleware],
+                describe(handler),
+                mount.file,
+                call['line'],
+            ))
+
+    walk(os.path.join(api_dir, entry_point), '', [])
+    reference.mounts = [mount for mount in reference.mounts if mount.endpoints]
+    return reference
+
+
+def build_reference(api_dir=API_DIR, entry_point=ENTRY_POINT, cache=None, jobs=None):
+    """Scan ``api_dir`` (through ``cache``, updated but not saved) and resolve its endpoints."""
+    cache = cache if cache is not None else RouteCache(os.devnull)
+    entries = cache.scan(source_files(api_dir), jobs=jobs)
+    return resolve(entries, entry_point, api_dir)
@@ -0,0 +1,74 @@
+import importlib
+import json
+import os
+
+import pytest
+
+from docgen.build import BuildState, build
+
+# ``docgen.build`` is also the name of the function the package exports.
+build_module = importlib.import_module('docgen.build')
+
+CONTENT = {
+    'output': 'manual.docx',
+    'blocks': [
+        {'title': {'pt': 'Manual', 'en': 'Manual'}},
+        {'h1': 'Menu'},
+        {'p': {'pt': 'Texto do menu.', 'en': 'Menu text.'}},
+        {'h1': 'Keys'},
+        {'p': 'Keys come from the catalog.', 'inputs': ['catalog.json']},
+    ],
+}
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_module, 'DEFAULT_CACHE', str(tmp_path / 'cache' / 'routes.json'))
+    (tmp_path / 'catalog.json').write_text('{"a": "A"}', encoding='utf-8')
+    content = tmp_path / 'manual.json'
+    content.write_text(json.dumps(CONTENT), encoding='utf-8')
+    return tmp_path
+
+
+def run(site, state, editions=(None, 'en')):
+    return build(str(site / 'manual.json'), str(site / 'out'), formats=('md',), editions=editions, jobs=1,
+                 state=state, fragment_dir=str(site / 'cache' / 'fragments'))
+
+
+@pytest.fixture
+def state(site):
+    return BuildState(str(site / 'cache' / 'build.json'))
+
+
+def test_first_build_renders_every_section(site, state):
+    results = run(site, state)
+    assert [os.path.basename(result.path) for result in results] == ['manual.md', 'manual.en.md']
+    assert [(result.written, result.rendered, result.sections) for result in results] == [(True, 3, 3)] * 2
+    with open(site / 'out' / 'manual.en.md', encoding='utf-8') as f:
+        text = f.read()
+    assert 'Menu text.' in text and 'Texto do menu.' not in text
+
+
+def test_unchanged_build_writes_nothing(site, state):
+    [first] = run(site, state, editions=(None,))
+    mtime = os.path.getmtime(first.path)
+    state.save()
+    [again] = run(site, BuildState.load(state.path), editions=(None,))
+    assert (again.written, again.rendered) == (False, 0)
+    assert os.path.getmtime(again.path) == mtime
+
+
+def test_changed_input_renders_its_section_only(site, state):
+    run(site, state)
+    (site / 'catalog.json').write_text('{"a": "B"}', encoding='utf-8')
+    results = run(site, state)
+    assert [(result.written, result.rendered) for result in results] == [(True, 1)] * 2
+
+
+def test_missing_output_is_written_again(site, state):
+    run(site, state)
+    os.remove(site / 'out' / 'manual.md')
+    results = run(site, state)
+    # Rebuilt from the cached fragments without rendering anything.
+    assert [(result.written, result.rendered) for result in results] == [(True, 0), (False, 0)]
+    assert os.path.exists(site / 'out' / 'manual.md')
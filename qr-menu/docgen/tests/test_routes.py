@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from docgen.routes import RouteCache, build_reference, parse_source
+
+INDEX = """\
+import express from 'express';
+import cors from 'cors';
+import menuRoutes from './routes/menu.js';
+const orderRoutes = require('./routes/orders');
+
+const app = express();
+app.use(cors());
+app.use('/api/menu', menuRoutes);
+app.use('/api/orders', protect, orderRoutes);
+"""
+MENU = """\
+import express from 'express';
+const router = express.Router();
+
+// router.get('/commented', nope);
+const help = "router.get('/in-a-string', nope)";
+router.get('/', listItems);
+router.post('/:id', protect, authorize('admin', 'manager'), async (req, res) => {
+  res.json({ ok: /\\)/.test(req.body) });
+});
+
+export default router;
+"""
+ORDERS = """\
+const express = require('express');
+const router = express.Router();
+router.use(logRequest);
+router.get('/:id', getOrder);
+module.exports = router;
+"""
+
+
+@pytest.fixture
+def api_dir(tmp_path):
+    (tmp_path / 'routes').mkdir()
+    (tmp_path / 'index.js').write_text(INDEX, encoding='utf-8')
+    (tmp_path / 'routes' / 'menu.js').write_text(MENU, encoding='utf-8')
+    (tmp_path / 'routes' / 'orders.js').write_text(ORDERS, encoding='utf-8')
+    return str(tmp_path)
+
+
+def test_parse_source_ignores_comments_and_strings():
+    entry = parse_source(MENU)
+    assert entry['routers'] == ['router']
+    assert entry['export'] == 'router'
+    assert [(call['method'], call['path'], call['line']) for call in entry['calls']] == [
+        ('get', '/', 6), ('post', '/:id', 7)]
+    assert entry['calls'][1]['args'][:2] == ['protect', "authorize('admin', 'manager')"]
+
+
+def test_build_reference_resolves_mounts(api_dir):
+    reference = build_reference(api_dir, 'index.js')
+    assert reference.global_middleware == ['cors()']
+    assert [(e.method, e.path, e.file) for e in reference.endpoints] == [
+        ('GET', '/api/menu', os.path.join('routes', 'menu.js')),
+        ('POST', '/api/menu/:id', os.path.join('routes', 'menu.js')),
+        ('GET', '/api/orders/:id', os.path.join('routes', 'orders.js')),
+    ]
+    update = reference.find('post', '/api/menu/:id')
+    assert update.middleware == ['protect', "authorize('admin', 'manager')"]
+    assert reference.find('GET', '/api/orders/:id').middleware == ['protect', 'logRequest']
+
+
+def test_route_cache_parses_changed_files_only(api_dir, tmp_path):
+    path = str(tmp_path / 'routes.json')
+    cache = RouteCache(path)
+    build_reference(api_dir, 'index.js', cache)
+    assert cache.parsed == 3
+    cache.save()
+
+    cache = RouteCache.load(path)
+    build_reference(api_dir, 'index.js', cache)
+    assert cache.parsed == 0
+
+    with open(os.path.join(api_dir, 'routes', 'orders.js'), 'a', encoding='utf-8') as f:
+        f.write("router.delete('/:id', cancelOrder);\n")
+    cache = RouteCache.load(path)
+    reference = build_reference(api_dir, 'index.js', cache)
+    assert cache.parsed == 1
+    assert reference.find('DELETE', '/api/orders/:id').handler == 'cancelOrder'
@@ -0,0 +1,16 @@
+"""
+Per-file parse cache shared by the Python tooling (``i18n_sync`` usage
+scans and ``docgen`` route parsing): results keyed by path, validated by
+mtime and size, then by content hash. Also the atomic writes every cache,
+state file and catalog of the tooling goes through.
+"""
+
+from .atomic import write_atomic, write_json
+from .scan import PARALLEL_THRESHOLD, FileCache
+
+__all__ = [
+    'PARALLEL_THRESHOLD',
+    'FileCache',
+    'write_atomic',
+    'write_json',
+]
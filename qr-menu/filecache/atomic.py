@@ -0,0 +1,41 @@
+"""
+Atomic file writes for the tooling's caches, state and outputs.
+
+The bytes go to a temporary file in the target's folder, are flushed to
+disk and then replace the target with ``os.replace``: a reader, or the
+next run after an interrupted one, sees the old content or the new, never
+a truncated file.
+"""
+
+import json
+import os
+import tempfile
+
+import instrument
+
+
+def write_atomic(path, raw):
+    """Replace ``path`` with the bytes ``raw``, keeping its permissions (0644 for a new file)."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        instrument.count_written(len(raw))
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json(path, data, **options):
+    """``write_atomic`` of ``json.dumps(data, **options)``."""
+    write_atomic(path, json.dumps(data, **options).encode('utf-8'))
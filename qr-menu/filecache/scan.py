@@ -0,0 +1,106 @@
+"""
+Cache of one parse result per source file.
+
+``FileCache.scan`` stats every file: one whose mtime and size did not
+change is not read. A changed one is hashed, and parsed again only when
+its content hash changed too, so files touched but left identical
+(checkouts, formatters) only cost a hash. Files still to parse go through a
+process pool when there are enough of them.
+
+``parse`` receives the decoded text of a file and returns a JSON
+serializable ``dict``; the cache adds the file's ``hash`` and ``stat``.
+It has to be a module-level function for the process pool to pickle it.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import instrument
+
+from .atomic import write_json
+
+# Below this many files to (re)parse, a process pool costs more than it saves.
+PARALLEL_THRESHOLD = 32
+
+
+def _parse_path(parse, path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    instrument.count_read(len(raw))
+    entry = parse(raw.decode('utf-8', 'replace'))
+    entry['hash'] = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return entry
+
+
+def _hash_path(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    instrument.count_read(len(raw))
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class FileCache:
+    """``parse`` results keyed by path, validated by mtime/size then hash."""
+
+    def __init__(self, path, parse, files=None, version=1):
+        self.path = path
+        self.parse = parse
+        self.files = files or {}
+        self.version = version
+        self.parsed = 0
+
+    @classmethod
+    def load(cls, path, *args, **kwargs):
+        """The cache saved at ``path``; an empty one if missing, unreadable or of another version."""
+        cache = cls(path, *args, **kwargs)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cache
+        if data.get('version') == cache.version:
+            cache.files = data.get('files', {})
+        return cache
+
+    def save(self):
+        write_json(self.path, {'version': self.version, 'files': self.files}, sort_keys=True)
+
+    def scan(self, paths, jobs=None):
+        """Return ``{path: entry}`` for ``paths``, parsing only what changed."""
+        stale = []
+        stats = {}
+        for path in paths:
+            st = os.stat(path)
+            stats[path] = [st.st_mtime_ns, st.st_size]
+            entry = self.files.get(path)
+            if entry is None or entry.get('stat') != stats[path]:
+                stale.append(path)
+
+        reparse = []
+        for path in stale:
+            entry = self.files.get(path)
+            if entry is not None and entry['hash'] == _hash_path(path):
+                entry['stat'] = stats[path]
+            else:
+                reparse.append(path)
+
+        parse = partial(_parse_path, self.parse)
+        # A profiled run parses in-process: work done in a pool would not show in it.
+        if len(reparse) >= PARALLEL_THRESHOLD and jobs != 1 and not instrument.active():
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                parsed = list(pool.map(parse, reparse, chunksize=8))
+        else:
+            parsed = [parse(path) for path in reparse]
+        for path, entry in zip(reparse, parsed):
+            entry['stat'] = stats[path]
+            self.files[path] = entry
+
+        wanted = set(paths)
+        for path in list(self.files):
+            if path not in wanted and not os.path.exists(path):
+                del self.files[path]
+        self.parsed += len(reparse)
+        return {path: self.files[path] for path in paths}
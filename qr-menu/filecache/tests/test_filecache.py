@@ -0,0 +1,60 @@
+import json
+import os
+
+import pytest
+
+from filecache import FileCache, write_atomic, write_json
+
+
+def count_lines(text):
+    return {'lines': text.count('\n')}
+
+
+def test_scan_parses_changed_content_only(tmp_path):
+    source = tmp_path / 'a.txt'
+    source.write_text('one\ntwo\n', encoding='utf-8')
+    cache = FileCache(str(tmp_path / 'cache.json'), count_lines)
+    assert cache.scan([str(source)])[str(source)]['lines'] == 2
+    assert cache.parsed == 1
+
+    # Touched but identical: hashed, not parsed.
+    os.utime(source, ns=(0, 0))
+    cache.scan([str(source)])
+    assert cache.parsed == 1
+
+    source.write_text('one\n', encoding='utf-8')
+    assert cache.scan([str(source)])[str(source)]['lines'] == 1
+    assert cache.parsed == 2
+
+
+def test_load_discards_another_version(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    source = tmp_path / 'a.txt'
+    source.write_text('x\n', encoding='utf-8')
+    cache = FileCache(path, count_lines)
+    cache.scan([str(source)])
+    cache.save()
+    assert str(source) in FileCache.load(path, count_lines).files
+    assert FileCache.load(path, count_lines, version=2).files == {}
+
+
+def test_write_atomic_keeps_mode(tmp_path):
+    path = tmp_path / 'state.json'
+    write_json(str(path), {'a': 1})
+    assert json.loads(path.read_text(encoding='utf-8')) == {'a': 1}
+    assert path.stat().st_mode & 0o777 == 0o644
+    os.chmod(path, 0o600)
+    write_atomic(str(path), b'{}')
+    assert path.read_bytes() == b'{}'
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_failed_write_leaves_the_old_file(tmp_path):
+    path = tmp_path / 'state.json'
+    write_json(str(path), {'a': 1})
+    with pytest.raises(TypeError):
+        write_json(str(path), {'a': object()})
+    with pytest.raises(TypeError):
+        write_atomic(str(path), 'not bytes')
+    assert json.loads(path.read_text(encoding='utf-8')) == {'a': 1}
+    assert os.listdir(tmp_path) == ['state.json']
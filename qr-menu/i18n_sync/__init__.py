@@ -0,0 +1,25 @@
+"""
+Translation sync tooling shared by the mobile app, the admin dashboard and
+the client menu.
+
+Run ``python -m i18n_sync --help`` from the ``qr-menu`` directory.
+"""
+
+from .apps import App, discover_apps, LANGUAGES, FALLBACK_LANGUAGE
+from .catalog import CatalogError
+from .columns import ColumnarCatalog
+from .engine import merge_app, merge_table, sync
+from .memory import TranslationMemory
+
+__all__ = [
+    'App',
+    'CatalogError',
+    'ColumnarCatalog',
+    'FALLBACK_LANGUAGE',
+    'LANGUAGES',
+    'TranslationMemory',
+    'discover_apps',
+    'merge_app',
+    'merge_table',
+    'sync',
+]
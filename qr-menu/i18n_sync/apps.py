@@ -0,0 +1,92 @@
+"""Discovery of the locale trees maintained by the sync engine."""
+
+import os
+from dataclasses import dataclass
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LANGUAGES = ('pt', 'en', 'es', 'fr')
+FALLBACK_LANGUAGE = 'en'
+# Language new strings are written in first.
+SOURCE_LANGUAGE = 'pt'
+
+# Where each app keeps its catalogs, relative to the app directory.
+LOCALE_LAYOUTS = (
+    os.path.join('i18n', 'locales'),
+    os.path.join('public', 'locales'),
+)
+CATALOG_NAME = 'translation.json'
+NEW_KEYS_NAME = 'new_keys.json'
+
+SKIP_DIRS = {'node_modules', 'dist', 'build'}
+# Folders never scanned for t('...') calls.
+SOURCE_SKIP_DIRS = SKIP_DIRS | {'public', 'i18n', 'assets', 'android', 'ios', '.expo', 'tests'}
+SOURCE_EXTENSIONS = ('.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs')
+
+
+@dataclass(frozen=True)
+class App:
+    """One app (mobile app, admin dashboard, client menu) and its locale tree."""
+
+    name: str
+    root: str
+    locale_dir: str
+    languages: tuple = LANGUAGES
+
+    @property
+    def new_keys_path(self):
+        return os.path.join(self.root, NEW_KEYS_NAME)
+
+    def catalog_path(self, lang):
+        return os.path.join(self.locale_dir, lang, CATALOG_NAME)
+
+    @property
+    def is_web(self):
+        """Catalogs served over HTTP from ``public/locales`` (not bundled into the mobile app)."""
+        return os.path.basename(os.path.dirname(self.locale_dir)) == 'public'
+
+    @property
+    def source_dir(self):
+        """Web apps keep their code in ``src/``; the mobile app at its root."""
+        src = os.path.join(self.root, 'src')
+        return src if os.path.isdir(src) else self.root
+
+    def source_files(self):
+        """Every JS/TS source file of the app, sorted."""
+        found = []
+        for dirpath, dirnames, filenames in os.walk(self.source_dir):
+            dirnames[:] = sorted(d for d in dirnames if d not in SOURCE_SKIP_DIRS and not d.startswith('.'))
+            found.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(SOURCE_EXTENSIONS))
+        return sorted(found)
+
+
+def _languages(locale_dir):
+    """Default languages plus any extra language folder found on disk."""
+    extra = sorted(
+        name for name in os.listdir(locale_dir)
+        if name not in LANGUAGES
+        and os.path.isfile(os.path.join(locale_dir, name, CATALOG_NAME))
+    )
+    return LANGUAGES + tuple(extra)
+
+
+def discover_apps(root=ROOT, only=None):
+    """Find every app under ``root`` that has a locale tree."""
+    apps = []
+    for name in sorted(os.listdir(root)):
+        app_root = os.path.join(root, name)
+        if name.startswith('.') or name in SKIP_DIRS or not os.path.isdir(app_root):
+            continue
+        for layout in LOCALE_LAYOUTS:
+            locale_dir = os.path.join(app_root, layout)
+            if os.path.isdir(locale_dir):
+                apps.append(App(name, app_root, locale_dir, _languages(locale_dir)))
+                break
+
+    if only:
+        known = {app.name for app in apps}
+        unknown = sorted(set(only) - known)
+        if unknown:
+            raise ValueError(f"Unknown app(s): {', '.join(unknown)} (found: {', '.join(sorted(known))})")
+        apps = [app for app in apps if app.name in only]
+    return apps
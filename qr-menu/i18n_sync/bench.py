@@ -0,0 +1,261 @@
+"""
+Benchmarks for the sync pipeline on synthetic catalogs.
+
+``generate`` builds catalogs that look like ours (``section_word_word``
+keys, value lengths spread like the admin catalog's, a few ``{{count}}``
+placeholders, brand strings shared by every language, gaps that the
+fallback fills and a handful of new keys), so results at 1k keys are
+comparable with the real apps and the larger sizes show how the pipeline
+scales.
+
+Each size is run through the same stages ``sync`` uses, timed separately:
+
+* ``load``: read and parse every language file,
+* ``merge``: build the columns, apply new keys and fill missing keys,
+* ``sort``: sort the key union into the shared key index,
+* ``serialize``: dump and encode every language.
+
+Timings are the best of ``repeat`` runs; peak memory per stage comes from a
+separate ``tracemalloc`` run so tracing does not skew the timings. Results
+can be saved as a baseline and later compared against it. Everything runs
+offline with the standard library only.
+"""
+
+import json
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from .apps import FALLBACK_LANGUAGE, LANGUAGES
+from .catalog import dump_catalog, parse_catalog, read_bytes
+from .columns import KeyIndex
+from .engine import merge_table
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 500_000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'bench_baseline.json')
+STAGES = ('load', 'merge', 'sort', 'serialize')
+# A stage counts as a regression when it is this much slower than the baseline.
+REGRESSION_RATIO = 1.25
+EXTRA_LANGUAGES = ('de', 'it', 'nl', 'sw', 'zu', 'ar', 'zh', 'hi', 'ru', 'ja', 'ko', 'tr')
+
+_SECTIONS = ('order', 'menu', 'table', 'payment', 'report', 'staff', 'stock', 'client', 'delivery',
+             'settings', 'kitchen', 'cash', 'subscription', 'notification', 'loyalty', 'tax')
+_WORDS = ('status', 'total', 'pending', 'paid', 'title', 'desc', 'label', 'button', 'error', 'success',
+          'confirm', 'cancel', 'new', 'edit', 'delete', 'list', 'filter', 'date', 'amount', 'method',
+          'name', 'price', 'item', 'category', 'open', 'closed', 'daily', 'monthly', 'summary', 'export')
+_TEXT = {
+    'pt': ('pedido', 'mesa', 'pagamento', 'relatório', 'não', 'você', 'ação', 'gestão', 'cliente', 'dia'),
+    'en': ('order', 'table', 'payment', 'report', 'not', 'you', 'action', 'manage', 'customer', 'day'),
+    'es': ('pedido', 'mesa', 'pago', 'informe', 'no', 'usted', 'acción', 'gestión', 'cliente', 'día'),
+    'fr': ('commande', 'table', 'paiement', 'rapport', 'pas', 'vous', 'action', 'gestion', 'client', 'jour'),
+}
+_BRANDS = ('M-Pesa', 'e-Mola', 'QR Menu', 'WhatsApp', 'Visa', 'PDF', 'Excel')
+
+
+def languages_for(count):
+    """The first ``count`` language codes: ours, then made-up extras."""
+    pool = list(LANGUAGES) + list(EXTRA_LANGUAGES)
+    pool += [f'x{i}' for i in range(max(0, count - len(pool)))]
+    return pool[:count]
+
+
+def _value_length(rng):
+    # Skewed like the real catalogs: mostly short labels, a tail of sentences.
+    return max(2, min(400, int(rng.lognormvariate(3.0, 0.8))))
+
+
+def _text(rng, lang, length):
+    words = _TEXT.get(lang) or _TEXT['en']
+    parts = []
+    size = 0
+    while size < length:
+        word = rng.choice(words)
+        parts.append(word)
+        size += len(word) + 1
+    text = ' '.join(parts).capitalize()
+    if rng.random() < 0.05:
+        text += ' {{count}}'
+    return text
+
+
+def generate(key_count, languages, seed=0, missing=0.02, shared=0.03, new_keys=0.01):
+    """
+    Return ``(catalogs, new_keys)`` with ``key_count`` keys in ``languages``.
+
+    ``missing`` is the share of keys absent from each language but the
+    fallback, ``shared`` the share of brand-like values identical in every
+    language and ``new_keys`` the share of keys only defined in
+    ``new_keys.json``.
+    """
+    rng = random.Random(seed)
+    keys = []
+    seen = set()
+    while len(keys) < key_count:
+        key = f'{rng.choice(_SECTIONS)}_{rng.choice(_WORDS)}_{rng.choice(_WORDS)}'
+        if key in seen:
+            key = f'{key}_{len(keys)}'
+        seen.add(key)
+        keys.append(key)
+
+    catalogs = {lang: {} for lang in languages}
+    definitions = {}
+    for key in keys:
+        length = _value_length(rng)
+        brand = rng.choice(_BRANDS) if rng.random() < shared else None
+        if rng.random() < new_keys:
+            definitions[key] = {lang: brand or _text(rng, lang, length) for lang in languages}
+            continue
+        for lang in languages:
+            if lang != FALLBACK_LANGUAGE and rng.random() < missing:
+                continue
+            catalogs[lang][key] = brand or _text(rng, lang, length)
+    # Keep insertion order unsorted, like files edited by hand.
+    for lang in languages:
+        items = list(catalogs[lang].items())
+        rng.shuffle(items)
+        catalogs[lang] = dict(items)
+    return catalogs, definitions
+
+
+def _stages(paths, definitions, languages, fallback, indent):
+    """One pass of the pipeline as ``(stage, callable)`` steps, so callers can measure each."""
+    state = {}
+
+    def load():
+        state['data'] = {lang: parse_catalog(path, read_bytes(path)).data for lang, path in paths.items()}
+
+    def union():
+        keys = set(definitions)
+        for data in state['data'].values():
+            keys.update(data)
+        state['keys'] = keys
+
+    def sort():
+        state['index'] = KeyIndex(state['keys'])
+
+    def merge():
+        state['table'] = merge_table(state['data'], definitions, languages, fallback, index=state['index'])
+
+    def serialize():
+        table = state['table']
+        state['out'] = {lang: table.dump(lang, indent).encode('utf-8') for lang in languages}
+
+    # The key union is part of merge; the sort is what building the index costs.
+    return [('load', load), ('merge', union), ('sort', sort), ('merge', merge), ('serialize', serialize)]
+
+
+def _write_inputs(directory, catalogs, indent):
+    paths = {}
+    for lang, data in catalogs.items():
+        path = os.path.join(directory, lang, 'translation.json')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(dump_catalog(data, indent).encode('utf-8'))
+        paths[lang] = path
+    return paths
+
+
+def run_size(key_count, language_count=len(LANGUAGES), repeat=3, seed=0, indent=4):
+    """Benchmark one catalog size; return a result dict for the report."""
+    languages = languages_for(language_count)
+    fallback = FALLBACK_LANGUAGE if FALLBACK_LANGUAGE in languages else languages[0]
+    catalogs, definitions = generate(key_count, languages, seed=seed)
+    directory = tempfile.mkdtemp(prefix='i18n-bench-')
+    try:
+        paths = _write_inputs(directory, catalogs, indent)
+        input_bytes = sum(os.path.getsize(path) for path in paths.values())
+        del catalogs
+
+        seconds = dict.fromkeys(STAGES, float('inf'))
+        for _ in range(repeat):
+            elapsed = dict.fromkeys(STAGES, 0.0)
+            for stage, fn in _stages(paths, definitions, languages, fallback, indent):
+                start = time.perf_counter()
+                fn()
+                elapsed[stage] += time.perf_counter() - start
+            for stage in STAGES:
+                seconds[stage] = min(seconds[stage], elapsed[stage])
+
+        peak = dict.fromkeys(STAGES, 0)
+        tracemalloc.start()
+        try:
+            for stage, fn in _stages(paths, definitions, languages, fallback, indent):
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+                fn()
+                peak[stage] = max(peak[stage], tracemalloc.get_traced_memory()[1] - base)
+            total_peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return {
+        'keys': key_count,
+        'languages': len(languages),
+        'input_bytes': input_bytes,
+        'seconds': {stage: round(seconds[stage], 6) for stage in STAGES},
+        'total_seconds': round(sum(seconds.values()), 6),
+        'peak_bytes': peak,
+        'total_peak_bytes': total_peak,
+    }
+
+
+def run(sizes=DEFAULT_SIZES, language_count=len(LANGUAGES), repeat=3, seed=0, on_result=None):
+    results = []
+    for size in sizes:
+        result = run_size(size, language_count, repeat=repeat, seed=seed)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return {
+        'python': platform.python_version(),
+        'machine': f'{platform.system()} {platform.machine()}',
+        'repeat': repeat,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def load_baseline(path=DEFAULT_BASELINE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(report, path=DEFAULT_BASELINE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(report, baseline, ratio=REGRESSION_RATIO):
+    """
+    Return ``(keys, languages, stage, baseline_seconds, seconds)`` for every stage
+    that got more than ``ratio`` times slower than in ``baseline``.
+    """
+    before = {(r['keys'], r['languages']): r for r in baseline.get('results', ())}
+    regressions = []
+    for result in report['results']:
+        old = before.get((result['keys'], result['languages']))
+        if old is None:
+            continue
+        for stage in STAGES:
+            was, now = old['seconds'].get(stage), result['seconds'][stage]
+            # Sub-millisecond stages are noise, not regressions.
+            if was and now > was * ratio and now - was > 0.001:
+                regressions.append((result['keys'], result['languages'], stage, was, now))
+    return regressions
+
+
+def format_result(result):
+    stages = '  '.join(f"{stage} {result['seconds'][stage] * 1000:9.1f} ms" for stage in STAGES)
+    peak = result['total_peak_bytes'] / (1024 * 1024)
+    return (f"{result['keys']:>8} keys x {result['languages']} langs  {stages}  "
+            f"total {result['total_seconds'] * 1000:9.1f} ms  peak {peak:7.1f} MiB")
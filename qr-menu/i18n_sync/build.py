@@ -0,0 +1,131 @@
+"""
+Production locale build: minified, precompressed, content-hashed files.
+
+For every language the pretty-printed ``translation.json`` (still the file
+people edit) is minified into ``<lng>/translation.<hash>.json`` with
+``.gz`` and ``.br`` siblings, and a ``manifest.json`` maps each language to
+its hashed URL. Because a URL never changes content, nginx can serve these
+with ``Cache-Control: immutable`` and ``gzip_static``/``brotli_static``.
+
+With ``delta=True`` every language but the app's runtime fallback only
+keeps the entries that differ from it (see ``delta``); i18next fills the
+rest through ``fallbackLng``.
+
+Brotli needs the optional ``brotli`` (or ``brotlicffi``) package; without
+it only ``.gz`` siblings are written.
+"""
+
+import gzip
+import json
+import os
+import re
+from dataclasses import dataclass, field
+
+from .catalog import dump_compact, load_catalog, write_catalog, write_if_changed
+from .delta import delta_catalogs, runtime_fallback
+from .manifest import content_hash
+from .namespaces import namespace_chunks
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+MANIFEST_NAME = 'manifest.json'
+HASH_LENGTH = 10
+HASHED_NAME = re.compile(r'^(?P<stem>.+)\.(?P<hash>[0-9a-f]{%d})\.json(?:\.gz|\.br)?$' % HASH_LENGTH)
+
+
+@dataclass
+class BuildResult:
+    app: object
+    manifest: dict = field(default_factory=dict)
+    written: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    raw_bytes: int = 0
+    gzip_bytes: int = 0
+    brotli_bytes: int = 0
+    fallback: str = ''
+    deltas: list = field(default_factory=list)  # DeltaSize per non-fallback language
+
+
+def hashed_name(stem, raw):
+    return f'{stem}.{content_hash(raw)[:HASH_LENGTH]}.json'
+
+
+def _emit(result, lang_dir, stem, data, dry_run):
+    """Write one minified file and its compressed siblings; return its file name."""
+    raw = dump_compact(data).encode('utf-8')
+    name = hashed_name(stem, raw)
+    path = os.path.join(lang_dir, name)
+    gz = gzip.compress(raw, compresslevel=9, mtime=0)
+    br = brotli.compress(raw, quality=11) if brotli is not None else None
+    result.raw_bytes += len(raw)
+    result.gzip_bytes += len(gz)
+    result.brotli_bytes += len(br) if br is not None else 0
+
+    # Content-addressed: an existing file already holds these bytes. Each
+    # copy is checked on its own, so a lost .gz/.br (or one skipped while
+    # brotli was missing) is written again.
+    if not dry_run:
+        for target, data in ((path, raw), (path + '.gz', gz), (path + '.br', br)):
+            if data is not None and not os.path.exists(target):
+                write_catalog(target, data)
+                result.written.append(target)
+    return name
+
+
+def _remove_stale(result, lang_dir, keep, dry_run):
+    if not os.path.isdir(lang_dir):
+        return
+    for name in sorted(os.listdir(lang_dir)):
+        m = HASHED_NAME.match(name)
+        if m and name.rsplit('.json', 1)[0] + '.json' not in keep:
+            if not dry_run:
+                os.remove(os.path.join(lang_dir, name))
+            result.removed.append(os.path.join(lang_dir, name))
+
+
+def build_production(app, out_dir=None, base_url='/locales', split=None, delta=False, dry_run=False):
+    """
+    Build hashed production files for every language of ``app``.
+
+    ``split`` (a ``NamespaceSplit``) adds hashed namespace files to the
+    manifest as well, ``delta`` strips what the fallback language already
+    provides. Older hashed files no longer referenced are removed.
+    """
+    out_dir = out_dir or app.locale_dir
+    base_url = base_url.rstrip('/')
+    result = BuildResult(app)
+    catalogs = {lang: load_catalog(app.catalog_path(lang)).data for lang in app.languages}
+    if delta:
+        result.fallback = runtime_fallback(app)
+        catalogs, result.deltas = delta_catalogs(catalogs, app.languages, result.fallback)
+    translation = {}
+    namespaces = {}
+    for lang, data in catalogs.items():
+        lang_dir = os.path.join(out_dir, lang)
+        keep = {_emit(result, lang_dir, 'translation', data, dry_run)}
+        translation[lang] = f'{base_url}/{lang}/{next(iter(keep))}'
+        if split is not None:
+            namespaces[lang] = {}
+            for ns, chunk in namespace_chunks(split, data):
+                name = _emit(result, lang_dir, ns, chunk, dry_run)
+                keep.add(name)
+                namespaces[lang][ns] = f'{base_url}/{lang}/{name}'
+        _remove_stale(result, lang_dir, keep, dry_run)
+
+    result.manifest = {'translation': translation}
+    if delta:
+        result.manifest['fallbackLng'] = result.fallback
+    if split is not None:
+        result.manifest['namespaces'] = namespaces
+        result.manifest['pages'] = {rel.replace(os.sep, '/'): ns for rel, ns in split.pages.items()}
+    text = json.dumps(result.manifest, indent=2, sort_keys=True) + '\n'
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if not dry_run and write_if_changed(path, text.encode('utf-8')):
+        result.written.append(path)
+    return result
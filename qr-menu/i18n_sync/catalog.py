@@ -0,0 +1,117 @@
+"""Reading and writing ``translation.json`` catalogs."""
+
+import json
+from dataclasses import dataclass, field
+
+from filecache import write_atomic
+from instrument import count_read
+
+DEFAULT_INDENT = 4
+
+
+class CatalogError(ValueError):
+    """A catalog or key-definition file could not be parsed."""
+
+
+@dataclass
+class CatalogFile:
+    """A catalog as read from disk, with the formatting needed to write it back."""
+
+    path: str
+    data: dict = field(default_factory=dict)
+    indent: int = DEFAULT_INDENT
+    exists: bool = False
+    # Keys that appeared more than once; ``json`` silently keeps the last value.
+    duplicates: list = field(default_factory=list)
+    text: str = ''
+
+
+def _pairs_hook(duplicates):
+    def hook(pairs):
+        data = {}
+        for key, value in pairs:
+            if key in data:
+                duplicates.append(key)
+            data[key] = value
+        return data
+    return hook
+
+
+def detect_indent(text, default=DEFAULT_INDENT):
+    """Indentation used by an existing catalog (admin uses 2, the others 4)."""
+    for line in text.splitlines()[1:]:
+        stripped = line.lstrip(' ')
+        if stripped:
+            return (len(line) - len(stripped)) or default
+    return default
+
+
+def read_bytes(path):
+    """Raw file contents, or ``None`` when the file does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None
+    count_read(len(raw))
+    return raw
+
+
+def parse_catalog(path, raw):
+    """Build a ``CatalogFile`` from bytes returned by ``read_bytes``."""
+    if raw is None:
+        return CatalogFile(path)
+    text = raw.decode('utf-8')
+    duplicates = []
+    try:
+        data = json.loads(text, object_pairs_hook=_pairs_hook(duplicates)) if text.strip() else {}
+    except json.JSONDecodeError as e:
+        raise CatalogError(f'{path}: {e}') from e
+    if not isinstance(data, dict):
+        raise CatalogError(f'{path}: expected a JSON object')
+    return CatalogFile(path, data, detect_indent(text), True, duplicates, text)
+
+
+def load_catalog(path):
+    return parse_catalog(path, read_bytes(path))
+
+
+def parse_new_keys(path, raw):
+    """Parse an app's ``new_keys.json`` ({key: {lang: value}}); missing file means no new keys."""
+    data = parse_catalog(path, raw).data
+    for key, translations in data.items():
+        if not isinstance(translations, dict):
+            raise CatalogError(f'{path}: "{key}" must map languages to values')
+    return data
+
+
+def load_new_keys(path):
+    return parse_new_keys(path, read_bytes(path))
+
+
+def dump_catalog(data, indent=DEFAULT_INDENT):
+    return json.dumps(data, ensure_ascii=False, indent=indent)
+
+
+def dump_compact(data):
+    """Minified JSON for files served to browsers rather than edited."""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_if_changed(path, raw):
+    """``write_catalog`` unless the file already holds exactly ``raw``; return whether it wrote."""
+    if read_bytes(path) == raw:
+        return False
+    write_catalog(path, raw)
+    return True
+
+
+def write_catalog(path, raw):
+    """
+    Atomically write the UTF-8 encoded output of ``dump_catalog``.
+
+    The bytes go to a temporary file in the same folder which then replaces
+    the catalog (``filecache.write_atomic``), so a dev server never reads a
+    half-written JSON file.
+    """
+    write_atomic(path, raw)
@@ -0,0 +1,518 @@
+"""Command line entry point: ``python -m i18n_sync <command>``."""
+
+import argparse
+import json
+import os
+import sys
+
+from instrument import phase, profiling
+
+from .apps import ROOT, discover_apps
+from .engine import sync
+from .manifest import CACHE_DIR, DEFAULT_MANIFEST, Manifest
+
+DEFAULT_USAGE_CACHE = os.path.join(CACHE_DIR, 'usage.json')
+DEFAULT_BENCH_BASELINE = os.path.join(os.path.dirname(__file__), 'bench_baseline.json')
+DEFAULT_TENANT_STATE = os.path.join(CACHE_DIR, 'tenants.json')
+OVERRIDES_DIR = os.path.join(ROOT, 'locale-overrides')
+SHARED_KEYS_PATH = os.path.join(ROOT, 'shared_keys.json')
+
+
+def _add_common(parser):
+    parser.add_argument('--app', action='append', dest='apps', metavar='NAME',
+                        help='only process this app (repeatable; default: every app found)')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='worker threads (default: based on CPU count)')
+
+
+def _report(result, dry_run):
+    name = result.app.name
+    if result.skipped:
+        return f'{name}: up to date ({result.key_count} keys, inputs unchanged).'
+    if not result.written:
+        return f'{name}: {result.key_count} keys x {len(result.unchanged)} languages already in sync.'
+    action = 'would write' if dry_run else 'wrote'
+    return f"{name}: {result.key_count} keys, {action} {', '.join(result.written)}."
+
+
+def _warn_duplicates(result):
+    for lang, keys in result.duplicates.items():
+        print(f"  warning: {result.app.name}/{lang} defines {', '.join(sorted(set(keys)))} more than once; "
+              f"kept the last value (run 'validate' for line numbers)", file=sys.stderr)
+
+
+def _shared_slices(apps, path, jobs=None):
+    """Each app's slice of the shared catalog at ``path``, or None when nothing is shared."""
+    from .shared import load_shared, shared_slices
+    from .usage import UsageCache
+
+    shared = load_shared(path)
+    if not shared:
+        return None
+    cache = UsageCache.load(DEFAULT_USAGE_CACHE)
+    slices = shared_slices(apps, shared, cache=cache, jobs=jobs)
+    cache.save()
+    return slices
+
+
+def cmd_sync(args):
+    with phase('discover'):
+        apps = discover_apps(only=args.apps)
+        if not apps:
+            print('No locale trees found.')
+            return 1
+        manifest = Manifest.load(args.manifest) if args.incremental else None
+        slices = _shared_slices(apps, args.shared, args.jobs)
+    for result in sync(apps, jobs=args.jobs, dry_run=args.dry_run, manifest=manifest, shared=slices):
+        print(_report(result, args.dry_run))
+        _warn_duplicates(result)
+    if manifest is not None and not args.dry_run:
+        with phase('write'):
+            manifest.save()
+    return 0
+
+
+def cmd_watch(args):
+    from .watch import watch
+
+    apps = discover_apps(only=args.apps)
+    if not apps:
+        print('No locale trees found.')
+        return 1
+    manifest = Manifest.load(args.manifest)
+    slices = _shared_slices(apps, args.shared, args.jobs)
+    for result in sync(apps, jobs=args.jobs, manifest=manifest, shared=slices):
+        print(_report(result, False))
+        _warn_duplicates(result)
+    manifest.save()
+
+    print(f"Watching {', '.join(app.name for app in apps)} (Ctrl+C to stop)...")
+    try:
+        watch(apps, manifest, debounce=args.debounce, jobs=args.jobs, poll=args.poll,
+              on_result=lambda result: print(_report(result, False), flush=True),
+              shared=(args.shared, lambda: _shared_slices(apps, args.shared, args.jobs)))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_share(args):
+    from .shared import analyze, extract, load_shared, shared_slices
+    from .usage import UsageCache
+
+    apps = discover_apps()
+    shared = load_shared(args.shared)
+    report = analyze(apps, shared)
+    if args.extract:
+        written = extract(apps, shared, report.candidates, args.shared, dry_run=args.dry_run)
+        action = 'would move' if args.dry_run else 'moved'
+        print(f'{action} {len(report.candidates)} keys defined identically by several apps '
+              f'into {os.path.relpath(args.shared)} ({len(written)} files written).')
+        shared = {**shared, **report.candidates}
+        report.candidates = {}
+    cache = UsageCache.load(args.cache)
+    slices = shared_slices(apps, shared, cache=cache)
+    cache.save()
+    print(f'{len(shared)} shared keys.')
+    for app in apps:
+        print(f'  {app.name}: compiles in {len(slices.get(app.name, ()))}')
+    if report.candidates:
+        print(f"{len(report.candidates)} keys are defined identically by several apps (--extract shares them): "
+              f"{', '.join(report.candidates)}")
+    if report.drift:
+        print(f'{len(report.drift)} keys are defined differently by several apps'
+              + (':' if args.verbose else ' (-v lists them).'))
+    for key, names in report.drift.items() if args.verbose else ():
+        print(f"  drift: {key} differs between {', '.join(names)}")
+    for key, names in report.overridden.items():
+        print(f"  overridden: {key} in {', '.join(names)} (the next sync writes the shared value)")
+    return 0
+
+
+def cmd_validate(args):
+    from .validate import ERROR, format_json, format_text, validate
+
+    with phase('discover'):
+        apps = discover_apps(only=args.apps)
+    with phase('validate'):
+        issues = validate(apps, jobs=args.jobs)
+    if args.format == 'json':
+        print(format_json(issues))
+    elif issues:
+        print(format_text(issues))
+    errors = sum(1 for issue in issues if issue.severity == ERROR)
+    if args.format != 'json':
+        print(f'{len(apps)} apps checked: {errors} errors, {len(issues) - errors} warnings.', file=sys.stderr)
+    return 1 if errors or (args.strict and issues) else 0
+
+
+def _usage(args):
+    from .usage import UsageCache, build_usage
+
+    cache = UsageCache.load(args.cache)
+    results = build_usage(discover_apps(only=args.apps), cache=cache, jobs=args.jobs)
+    cache.save()
+    return results, cache
+
+
+def cmd_usage(args):
+    from .usage import DEAD, DYNAMIC, INDIRECT, USED
+
+    results, cache = _usage(args)
+    if args.format == 'json':
+        print(json.dumps({
+            usage.app.name: {
+                'counts': usage.counts(),
+                'dead': usage.keys(DEAD),
+                'indirect': usage.keys(INDIRECT),
+                'missing': usage.missing,
+            }
+            for usage in results
+        }, ensure_ascii=False, indent=2))
+        return 0
+    for usage in results:
+        counts = usage.counts()
+        print(f'{usage.app.name}: {len(usage.status)} keys, {counts[USED]} used, {counts[DYNAMIC]} via t(`prefix_${{...}}`), '
+              f'{counts[INDIRECT]} indirect, {counts[DEAD]} dead, {len(usage.missing)} missing from the catalog.')
+        for kind in args.list or ():
+            keys = usage.missing if kind == 'missing' else usage.keys(kind)
+            for key in keys:
+                print(f'  {kind}: {key}')
+    print(f'({cache.parsed} source files scanned, the rest from cache)', file=sys.stderr)
+    return 0
+
+
+def cmd_prune(args):
+    from .usage import prune
+
+    results, _ = _usage(args)
+    for usage in results:
+        removed = prune(usage, dry_run=args.dry_run)
+        action = 'would remove' if args.dry_run else 'removed'
+        print(f"{usage.app.name}: {action} {len(removed)} unreferenced keys"
+              + (f": {', '.join(removed)}" if removed and args.verbose else '.'))
+    return 0
+
+
+def cmd_split(args):
+    from .namespaces import build_namespaces, has_pages
+
+    results, _ = _usage(args)
+    for usage in results:
+        if not has_pages(usage.app):
+            continue
+        split = build_namespaces(usage, out_dir=_out_dir(args.out, usage.app), dry_run=args.dry_run)
+        common = len(split.namespaces['common'])
+        print(f'{usage.app.name}: {len(split.namespaces)} namespaces, {common} keys in common, '
+              f'{len(split.written)} files written.')
+        if args.verbose:
+            for ns, keys in split.namespaces.items():
+                print(f'  {ns}: {len(keys)} keys')
+    return 0
+
+
+def _report_deltas(deltas):
+    for size in deltas:
+        percent = 100 * size.saved / size.full_bytes if size.full_bytes else 0
+        print(f'  {size.lang}: {size.delta_keys}/{size.full_keys} keys kept, '
+              f'{size.full_bytes} -> {size.delta_bytes} B minified, saved {size.saved} B ({percent:.0f}%)')
+
+
+def _out_dir(out, app):
+    """``--out`` for one app: its own ``<out>/<app>`` folder, so apps never overwrite or prune each other's files."""
+    return os.path.join(out, app.name) if out else None
+
+
+def cmd_build(args):
+    from .build import brotli, build_production
+
+    apps = [app for app in discover_apps(only=args.apps) if app.is_web]
+    splits = {}
+    if args.namespaces:
+        from .namespaces import split_keys
+        from .usage import UsageCache, build_usage
+
+        cache = UsageCache.load(args.cache)
+        splits = {usage.app.name: split_keys(usage) for usage in build_usage(apps, cache=cache, jobs=args.jobs)}
+        cache.save()
+    if brotli is None:
+        print('note: brotli is not installed, skipping .br files (pip install brotli)', file=sys.stderr)
+    for app in apps:
+        result = build_production(app, out_dir=_out_dir(args.out, app), base_url=args.base_url,
+                                  split=splits.get(app.name), delta=args.delta, dry_run=args.dry_run)
+        sizes = f'{result.raw_bytes} B minified, {result.gzip_bytes} B gzip'
+        if brotli is not None:
+            sizes += f', {result.brotli_bytes} B brotli'
+        print(f'{app.name}: {sizes}; {len(result.written)} files written, {len(result.removed)} stale removed.')
+        _report_deltas(result.deltas)
+    return 0
+
+
+def cmd_compile(args):
+    from .typescript import compile_app
+
+    apps = [app for app in discover_apps(only=args.apps) if not app.is_web]
+    for app in apps:
+        result = compile_app(app, out_dir=args.out, delta=args.delta, dry_run=args.dry_run)
+        out = os.path.relpath(result.out_dir)
+        print(f'{app.name}: {result.key_count} keys x {len(app.languages)} languages compiled to {out} '
+              f'({len(result.written)} files written).')
+        _report_deltas(result.deltas)
+    return 0
+
+
+def cmd_tenants(args):
+    from .tenants import BundleCache, TenantState, build_tenants, load_layers
+
+    apps = [app for app in discover_apps(only=args.apps) if app.is_web]
+    countries, restaurants = load_layers(args.overrides)
+    if not countries and not restaurants:
+        print(f'No overrides in {os.path.relpath(args.overrides)}.')
+        return 0
+    state = TenantState.load(args.state)
+    cache = BundleCache(args.cache_mb * 1024 * 1024)
+    unknown = None
+    for app in apps:
+        result = build_tenants(app, countries, restaurants, state, cache, out_dir=_out_dir(args.out, app),
+                               base_url=args.base_url, force=args.force, dry_run=args.dry_run)
+        action = 'would rebuild' if args.dry_run else 'rebuilt'
+        print(f'{app.name}: {result.tenants} tenants, {action} {len(result.rebuilt)}, '
+              f'{result.tenants - len(result.rebuilt)} unchanged; {len(result.written)} files written, '
+              f'{len(result.removed)} stale removed.')
+        for tenant, lang, key, message in result.warnings:
+            print(f'  warning: {tenant}/{lang} "{key}": {message}', file=sys.stderr)
+        # A key another app knows is fine; one no app knows is most likely a typo.
+        keys = {(tenant, key) for tenant, found in result.unknown.items() for key in found}
+        unknown = keys if unknown is None else unknown & keys
+    for tenant, key in sorted(unknown or ()):
+        print(f'  warning: {tenant} overrides "{key}", which no app defines', file=sys.stderr)
+    if not args.dry_run:
+        state.save()
+    print(f'cache: {cache.hits} hits, {cache.misses} misses, {cache.evictions} evictions, '
+          f'{cache.size / 1024:.0f} KiB held', file=sys.stderr)
+    return 0
+
+
+def _print_suggestions(suggestions, indent='  '):
+    for lang, found in suggestions.items():
+        if not found:
+            print(f'{indent}{lang}: no match')
+        for s in found:
+            origin = s.origins[0] + (f' +{len(s.origins) - 1}' if len(s.origins) > 1 else '')
+            print(f'{indent}{lang}: {s.value!r}  {s.score:.2f}  from {s.source!r} ({origin})')
+
+
+def cmd_suggest(args):
+    import time
+
+    from .apps import SOURCE_LANGUAGE
+    from .catalog import dump_catalog, load_catalog, write_if_changed
+    from .memory import TranslationMemory
+
+    apps = discover_apps()
+    start = time.perf_counter()
+    memory = TranslationMemory.from_apps(apps)
+    print(f'{len(memory)} {SOURCE_LANGUAGE} strings indexed in {(time.perf_counter() - start) * 1000:.0f} ms.',
+          file=sys.stderr)
+    if args.text:
+        languages = [lang for lang in apps[0].languages if lang != SOURCE_LANGUAGE] if apps else []
+        _print_suggestions(memory.suggest(' '.join(args.text), languages, args.min_score, args.limit), '')
+        return 0
+
+    for app in discover_apps(only=args.apps):
+        definitions = load_catalog(app.new_keys_path)
+        applied = 0
+        for key, translations in definitions.data.items():
+            text = translations.get(SOURCE_LANGUAGE)
+            if not text:
+                continue
+            languages = [lang for lang in app.languages if lang != SOURCE_LANGUAGE
+                         and (args.all or not translations.get(lang))]
+            if not languages:
+                continue
+            suggestions = memory.suggest(text, languages, args.min_score, args.limit,
+                                         exclude={f'{app.name}:{key}'})
+            print(f'{app.name}: {key} ({text!r})')
+            _print_suggestions(suggestions)
+            if args.apply:
+                for lang, found in suggestions.items():
+                    if found and found[0].score >= args.apply_score and not translations.get(lang):
+                        translations[lang] = found[0].value
+                        applied += 1
+        if args.apply and applied:
+            raw = (dump_catalog(definitions.data, definitions.indent) + '\n').encode('utf-8')
+            write_if_changed(app.new_keys_path, raw)
+            print(f'{app.name}: filled {applied} values in {os.path.relpath(app.new_keys_path)} (run sync next).')
+    return 0
+
+
+def cmd_bench(args):
+    from . import bench
+
+    baseline = bench.load_baseline(args.baseline) if args.compare else None
+    if args.compare and baseline is None:
+        raise ValueError(f'no baseline at {args.baseline} (run with --save first)')
+    report = bench.run(args.sizes or bench.DEFAULT_SIZES, args.languages, repeat=args.repeat,
+                       seed=args.seed, on_result=lambda result: print(bench.format_result(result), flush=True))
+    if args.save:
+        bench.save_baseline(report, args.baseline)
+        print(f'Baseline saved to {os.path.relpath(args.baseline)}.')
+    if baseline is not None:
+        regressions = bench.compare(report, baseline, args.threshold)
+        for keys, languages, stage, was, now in regressions:
+            print(f'regression: {keys} keys x {languages} langs, {stage}: '
+                  f'{was * 1000:.1f} ms -> {now * 1000:.1f} ms ({now / was:.2f}x)')
+        print(f'{len(regressions)} regressions against {os.path.relpath(args.baseline)} '
+              f"(recorded on {baseline.get('machine', '?')}, Python {baseline.get('python', '?')}).")
+        return 1 if regressions else 0
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m i18n_sync',
+                                     description='Synchronize translation catalogs of every qr-menu app.')
+    commands = parser.add_subparsers(dest='command')
+
+    p = commands.add_parser('sync', help='merge new keys and align every language (default)')
+    _add_common(p)
+    p.add_argument('--dry-run', action='store_true', help='merge but do not write anything')
+    p.add_argument('--incremental', '-i', action='store_true',
+                   help='skip apps and languages whose inputs did not change since the last sync')
+    p.add_argument('--manifest', default=DEFAULT_MANIFEST,
+                   help='hash manifest used by --incremental (default: %(default)s)')
+    p.add_argument('--shared', default=SHARED_KEYS_PATH,
+                   help='catalog shared by every app (default: %(default)s)')
+    p.set_defaults(func=cmd_sync)
+
+    p = commands.add_parser('share', help='report keys several apps define and how they use the shared catalog')
+    p.add_argument('--shared', default=SHARED_KEYS_PATH,
+                   help='catalog shared by every app (default: %(default)s)')
+    p.add_argument('--extract', action='store_true',
+                   help='move keys every app defines identically into the shared catalog')
+    p.add_argument('--dry-run', action='store_true', help='with --extract, only report')
+    p.add_argument('--verbose', '-v', action='store_true', help='list the keys whose values drifted apart')
+    p.add_argument('--cache', default=DEFAULT_USAGE_CACHE, help='per-file scan cache (default: %(default)s)')
+    p.set_defaults(func=cmd_share)
+
+    p = commands.add_parser('validate', help='report duplicate keys, placeholder drift and untranslated values')
+    _add_common(p)
+    p.add_argument('--format', choices=('text', 'json'), default='text')
+    p.add_argument('--strict', action='store_true', help='exit with status 1 on warnings too')
+    p.set_defaults(func=cmd_validate)
+
+    p = commands.add_parser('usage', help='index which catalog keys the source code uses')
+    _add_common(p)
+    p.add_argument('--list', action='append', choices=('dead', 'indirect', 'dynamic', 'missing'),
+                   help='also list keys of this kind (repeatable)')
+    p.add_argument('--format', choices=('text', 'json'), default='text')
+    p.add_argument('--cache', default=DEFAULT_USAGE_CACHE, help='per-file scan cache (default: %(default)s)')
+    p.set_defaults(func=cmd_usage)
+
+    p = commands.add_parser('prune', help='drop catalog keys that no source file references')
+    _add_common(p)
+    p.add_argument('--dry-run', action='store_true', help='only report what would be removed')
+    p.add_argument('--verbose', '-v', action='store_true', help='print the removed keys')
+    p.add_argument('--cache', default=DEFAULT_USAGE_CACHE, help='per-file scan cache (default: %(default)s)')
+    p.set_defaults(func=cmd_prune)
+
+    p = commands.add_parser('split', help='split web catalogs into per-route i18next namespaces')
+    _add_common(p)
+    p.add_argument('--out', help="output folder, one <out>/<app> folder per app (default: the app's locale folder)")
+    p.add_argument('--dry-run', action='store_true', help='compute the split without writing')
+    p.add_argument('--verbose', '-v', action='store_true', help='print the size of every namespace')
+    p.add_argument('--cache', default=DEFAULT_USAGE_CACHE, help='per-file scan cache (default: %(default)s)')
+    p.set_defaults(func=cmd_split)
+
+    p = commands.add_parser('build', help='write minified, precompressed, content-hashed catalogs for production')
+    _add_common(p)
+    p.add_argument('--out', help="output folder, one <out>/<app> folder per app (default: the app's locale folder)")
+    p.add_argument('--base-url', default='/locales',
+                   help="URL each app's output folder is served under (default: %(default)s)")
+    p.add_argument('--namespaces', action='store_true', help='also build the per-route namespaces (see split)')
+    p.add_argument('--delta', action='store_true',
+                   help="only keep the entries that differ from the app's fallbackLng language")
+    p.add_argument('--dry-run', action='store_true', help='compute sizes without writing')
+    p.add_argument('--cache', default=DEFAULT_USAGE_CACHE, help='per-file scan cache (default: %(default)s)')
+    p.set_defaults(func=cmd_build)
+
+    p = commands.add_parser('compile', help='compile the mobile app catalogs into lazily loaded TypeScript modules')
+    _add_common(p)
+    p.add_argument('--out', help='output folder (default: i18n/compiled next to the locales)')
+    p.add_argument('--delta', action='store_true',
+                   help='only keep the entries that differ from the fallback language')
+    p.add_argument('--dry-run', action='store_true', help='render without writing')
+    p.set_defaults(func=cmd_compile)
+
+    p = commands.add_parser('tenants', help='compile per-country and per-restaurant overrides into tenant bundles')
+    _add_common(p)
+    p.add_argument('--overrides', default=OVERRIDES_DIR, help='overrides folder (default: %(default)s)')
+    p.add_argument('--out', help="output folder, one <out>/<app> folder per app (default: the app's locale folder)")
+    p.add_argument('--base-url', default='/locales',
+                   help="URL each app's output folder is served under (default: %(default)s)")
+    p.add_argument('--cache-mb', type=int, default=64, help='memory budget of the bundle cache (default: %(default)s)')
+    p.add_argument('--state', default=DEFAULT_TENANT_STATE,
+                   help='fingerprints of the last run, to only rebuild changed tenants (default: %(default)s)')
+    p.add_argument('--force', action='store_true', help='rebuild every tenant')
+    p.add_argument('--dry-run', action='store_true', help='compile without writing')
+    p.set_defaults(func=cmd_tenants)
+
+    p = commands.add_parser('suggest', help='suggest translations from similar strings of every catalog')
+    p.add_argument('text', nargs='*',
+                   help='Portuguese text to look up (default: the untranslated values of every new_keys.json)')
+    p.add_argument('--app', action='append', dest='apps', metavar='NAME',
+                   help="only look at this app's new_keys.json (repeatable)")
+    p.add_argument('--all', action='store_true', help='also suggest for languages new_keys.json already fills')
+    p.add_argument('--limit', type=int, default=3, help='candidates per language (default: %(default)s)')
+    p.add_argument('--min-score', type=float, default=0.5,
+                   help='minimum trigram similarity, 0-1 (default: %(default)s)')
+    p.add_argument('--apply', action='store_true',
+                   help='write the best candidate into empty new_keys.json values when it scores --apply-score')
+    p.add_argument('--apply-score', type=float, default=0.9, help='minimum score for --apply (default: %(default)s)')
+    p.set_defaults(func=cmd_suggest)
+
+    p = commands.add_parser('bench', help='time load/merge/sort/serialize on synthetic catalogs')
+    p.add_argument('--sizes', type=int, nargs='+', metavar='KEYS',
+                   help='catalog sizes to run (default: 1000 10000 100000 500000)')
+    p.add_argument('--languages', type=int, default=4, help='languages per catalog (default: %(default)s)')
+    p.add_argument('--repeat', type=int, default=3, help='runs per size, the best one counts (default: %(default)s)')
+    p.add_argument('--seed', type=int, default=0, help='generator seed (default: %(default)s)')
+    p.add_argument('--baseline', default=DEFAULT_BENCH_BASELINE,
+                   help='baseline file (default: %(default)s)')
+    p.add_argument('--save', action='store_true', help='store the results as the new baseline')
+    p.add_argument('--compare', action='store_true', help='exit with status 1 if a stage regressed')
+    p.add_argument('--threshold', type=float, default=1.25,
+                   help='slowdown ratio that counts as a regression (default: %(default)s)')
+    p.set_defaults(func=cmd_bench)
+
+    p = commands.add_parser('watch', help='resync incrementally whenever a catalog or new_keys.json changes')
+    _add_common(p)
+    p.add_argument('--debounce', type=float, default=0.3,
+                   help='seconds of quiet to wait for before resyncing a burst of saves (default: %(default)s)')
+    p.add_argument('--poll', action='store_true', help='poll mtimes instead of using inotify')
+    p.add_argument('--manifest', default=DEFAULT_MANIFEST,
+                   help='hash manifest shared with sync --incremental (default: %(default)s)')
+    p.add_argument('--shared', default=SHARED_KEYS_PATH,
+                   help='catalog shared by every app (default: %(default)s)')
+    p.set_defaults(func=cmd_watch)
+
+    for p in commands.choices.values():
+        p.add_argument('--profile', nargs='?', const='-', metavar='REPORT',
+                       help='time each phase and record bytes read and written and memory peaks, as a JSON '
+                            'report written to REPORT (default: stderr)')
+        p.add_argument('--cprofile', metavar='FILE', help='also dump cProfile statistics to FILE (see pstats)')
+
+    return parser
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    parser = build_parser()
+    if not argv or argv[0].startswith('-') and argv[0] not in ('-h', '--help'):
+        argv.insert(0, 'sync')
+    args = parser.parse_args(argv)
+    try:
+        with profiling(f'i18n_sync {args.command}', args.profile, args.cprofile):
+            return args.func(args)
+    except ValueError as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
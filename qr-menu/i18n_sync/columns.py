@@ -0,0 +1,195 @@
+"""
+Columnar in-memory catalogs shared by every sync stage.
+
+Instead of one ``{key: value}`` dict per language, a ``ColumnarCatalog``
+holds one ``KeyIndex`` (the sorted key union, shared by all languages) and
+one column per language: a list with the value of every indexed key, or
+``MISSING``. Columns only hold references, so a string is never copied:
+the values ``fill`` takes from the fallback language are the fallback's own
+objects, and the parsed per-language dicts can be dropped once the table
+is built.
+
+Merge, fill and diff work in place on the columns; serialization encodes
+each key once and reuses the encoded text for every language.
+"""
+
+import json
+from itertools import compress, repeat
+from json.encoder import encode_basestring
+from operator import ne
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'MISSING'
+
+
+MISSING = _Missing()
+
+
+class KeyIndex:
+    """Sorted key union; built once per app, shared by every column."""
+
+    __slots__ = ('keys', '_positions', '_prefixes')
+
+    def __init__(self, keys):
+        self.keys = tuple(sorted(keys))
+        self._positions = None
+        self._prefixes = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def positions(self):
+        """``{key: position}``, built on first use."""
+        if self._positions is None:
+            self._positions = dict(zip(self.keys, range(len(self.keys))))
+        return self._positions
+
+    def prefixes(self, indent=None):
+        """
+        ``'<indent>"key": '`` for every key (``'"key":'`` when ``indent`` is
+        None), computed once per indent for every column serialized.
+        """
+        found = self._prefixes.get(indent)
+        if found is None:
+            if indent is None:
+                found = [f'{encode_basestring(key)}:' for key in self.keys]
+            else:
+                pad = ' ' * indent
+                found = [f'{pad}{encode_basestring(key)}: ' for key in self.keys]
+            self._prefixes[indent] = found
+        return found
+
+
+def dump_column(index, column, indent=None):
+    """
+    Serialize one column over ``index`` exactly like ``dump_catalog`` (or
+    ``dump_compact`` when ``indent`` is None) would serialize it as a dict.
+    """
+    prefixes = index.prefixes(indent)
+    try:
+        if MISSING in column:
+            lines = [prefix + encode_basestring(value)
+                     for prefix, value in zip(prefixes, column) if value is not MISSING]
+        else:
+            lines = list(map(str.__add__, prefixes, map(encode_basestring, column)))
+    except TypeError:  # a non-string value (nested object, number, null)
+        data = {key: value for key, value in zip(index.keys, column) if value is not MISSING}
+        separators = (',', ':') if indent is None else None
+        return json.dumps(data, ensure_ascii=False, indent=indent, separators=separators)
+    if indent is None:
+        return '{' + ','.join(lines) + '}'
+    return '{\n' + ',\n'.join(lines) + '\n}' if lines else '{}'
+
+
+def _missing(column):
+    """Positions of ``MISSING`` in ``column``."""
+    pos = -1
+    while True:
+        try:
+            pos = column.index(MISSING, pos + 1)
+        except ValueError:
+            return
+        yield pos
+
+
+class ColumnarCatalog:
+    """All languages of one app over a shared key index."""
+
+    __slots__ = ('index', 'columns')
+
+    def __init__(self, index):
+        self.index = index
+        self.columns = {}
+
+    @classmethod
+    def from_catalogs(cls, catalogs, languages, extra_keys=(), index=None):
+        """
+        Build from ``{lang: {key: value}}``.
+
+        ``extra_keys`` (e.g. the keys of ``new_keys.json``) join the index
+        without a value; pass a prebuilt ``index`` to share one between
+        catalogs or to time the sort separately.
+        """
+        if index is None:
+            keys = set(extra_keys)
+            for lang in languages:
+                keys.update(catalogs.get(lang, ()))
+            index = KeyIndex(keys)
+        table = cls(index)
+        for lang in languages:
+            table.add_language(lang, catalogs.get(lang, {}))
+        return table
+
+    def add_language(self, lang, data):
+        keys = self.index.keys
+        if len(data) == len(keys) and tuple(data) == keys:
+            # Already sorted and complete, as sync leaves every catalog.
+            column = list(data.values())
+        else:
+            # Keys outside the index are dropped.
+            column = list(map(data.get, keys, repeat(MISSING, len(keys))))
+        self.columns[lang] = column
+        return column
+
+    def get(self, lang, key, default=None):
+        pos = self.index.positions.get(key)
+        value = MISSING if pos is None else self.columns[lang][pos]
+        return default if value is MISSING else value
+
+    def apply_new_keys(self, new_keys, overwrite=False):
+        """
+        Apply ``new_keys.json`` definitions ({key: {lang: value}}).
+
+        A definition only fills a value that is missing or empty, so a
+        translation edited in the catalog is never overwritten; with
+        ``overwrite`` (shared keys) the definition always wins.
+        """
+        positions = self.index.positions
+        for key, translations in new_keys.items():
+            pos = positions[key]
+            for lang, column in self.columns.items():
+                if lang in translations and (overwrite or column[pos] is MISSING or column[pos] == ''):
+                    column[pos] = translations[lang]
+
+    def fill(self, fallback):
+        """Give every language every key; missing values come from ``fallback`` (or "")."""
+        source = self.columns.get(fallback)
+        for lang, column in self.columns.items():
+            if lang == fallback:
+                continue
+            for pos in _missing(column):
+                found = source[pos] if source is not None else MISSING
+                column[pos] = '' if found is MISSING else found
+        if source is not None:
+            for pos in _missing(source):
+                source[pos] = ''
+
+    def diff(self, lang, other):
+        """Positions where ``lang`` has a value that ``other`` lacks or holds differently."""
+        column = self.columns[lang]
+        changed = compress(range(len(column)), map(ne, column, self.columns[other]))
+        return [pos for pos in changed if column[pos] is not MISSING]
+
+    def delta(self, lang, other):
+        """``{key: value}`` of ``lang`` without what ``other`` already provides."""
+        keys, column = self.index.keys, self.columns[lang]
+        return {keys[pos]: column[pos] for pos in self.diff(lang, other)}
+
+    def to_dict(self, lang):
+        keys, column = self.index.keys, self.columns[lang]
+        if MISSING not in column:
+            return dict(zip(keys, column))
+        return {key: value for key, value in zip(keys, column) if value is not MISSING}
+
+    def dump(self, lang, indent=4):
+        """
+        ``dump_catalog(self.to_dict(lang), indent)`` without building the dict.
+
+        Keys are encoded once per table and reused by every language.
+        """
+        return dump_column(self.index, self.columns[lang], indent)
@@ -0,0 +1,75 @@
+"""
+Delta catalogs: keep only what differs from the runtime fallback.
+
+``sync`` fills every gap by copying the English value, so brand names
+("M-Pesa", "e-Mola") and strings nobody translated yet end up in every
+language file. At runtime i18next already resolves a missing key through
+``fallbackLng``, so a language only has to ship the entries whose value is
+not what that lookup would return anyway.
+
+The fallback is read from the app's own i18next setup (``fallbackLng`` in
+``src/i18n.js``, ``i18n/index.ts``...); when it cannot be found statically
+``FALLBACK_LANGUAGE`` is assumed. Only the first language of the chain is
+used: it is kept complete, so every other language resolves through it no
+matter what the rest of the chain holds.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+
+from .apps import FALLBACK_LANGUAGE
+from .catalog import dump_compact
+from .columns import ColumnarCatalog
+
+CONFIG_FILES = ('i18n.js', 'i18n.ts', os.path.join('i18n', 'index.js'), os.path.join('i18n', 'index.ts'))
+FALLBACK_LNG = re.compile(r'''fallbackLng\s*:\s*\[?\s*(['"])([\w-]+)\1''')
+
+
+def runtime_fallback(app):
+    """The language i18next falls back to in ``app``, as configured in its source."""
+    for name in CONFIG_FILES:
+        path = os.path.join(app.source_dir, name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                m = FALLBACK_LNG.search(f.read())
+        except FileNotFoundError:
+            continue
+        if m and m.group(2) in app.languages:
+            return m.group(2)
+    return FALLBACK_LANGUAGE if FALLBACK_LANGUAGE in app.languages else app.languages[0]
+
+
+def delta_catalogs(catalogs, languages, fallback):
+    """
+    ``{lang: {key: value}}`` with every language but ``fallback`` reduced to
+    the entries the fallback does not already provide with the same value,
+    plus a ``DeltaSize`` per reduced language.
+    """
+    table = ColumnarCatalog.from_catalogs(catalogs, languages)
+    deltas, sizes = {}, []
+    for lang in languages:
+        if lang == fallback:
+            deltas[lang] = catalogs[lang]
+        else:
+            deltas[lang] = table.delta(lang, fallback)
+            sizes.append(measure(lang, catalogs[lang], deltas[lang]))
+    return deltas, sizes
+
+
+@dataclass
+class DeltaSize:
+    lang: str
+    full_bytes: int
+    delta_bytes: int
+    full_keys: int
+    delta_keys: int
+
+    @property
+    def saved(self):
+        return self.full_bytes - self.delta_bytes
+
+
+def measure(lang, data, delta):
+    return DeltaSize(lang, len(dump_compact(data).encode('utf-8')), len(dump_compact(delta).encode('utf-8')),
+                     len(data), len(delta))
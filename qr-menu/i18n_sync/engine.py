@@ -0,0 +1,191 @@
+"""
+Read-merge-sort-write loop shared by every app.
+
+All catalogs of all selected apps are loaded, merged (as a
+``ColumnarCatalog``, see ``columns``) and written in a single run; file I/O
+and JSON parsing are spread over a thread pool. Catalogs whose merged
+output is byte-identical to the file on disk are never rewritten, so dev
+servers watching the locale folders do not reload for nothing.
+
+With a ``Manifest`` the sync is incremental: apps whose inputs hash the same
+as after the previous sync are skipped without parsing, and only languages
+whose inputs changed are re-merged.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from instrument import phase
+
+from .apps import FALLBACK_LANGUAGE
+from .catalog import parse_catalog, parse_new_keys, read_bytes, write_catalog
+from .columns import ColumnarCatalog
+from .manifest import content_hash, definitions_hash, keys_hash
+
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one app."""
+
+    app: object
+    key_count: int = 0
+    written: list = field(default_factory=list)
+    unchanged: list = field(default_factory=list)
+    # True when incremental mode skipped the app because no input changed.
+    skipped: bool = False
+    # {lang: [key, ...]} keys defined twice in a catalog (the last value wins).
+    duplicates: dict = field(default_factory=dict)
+
+
+def merge_table(catalogs, new_keys, languages, fallback=FALLBACK_LANGUAGE, index=None, shared=None):
+    """
+    Merge one app's catalogs ({lang: {key: value}}) with its new key definitions.
+
+    Returns a ``ColumnarCatalog`` in which every language has the same
+    sorted key set. ``shared`` definitions (the app's slice of
+    ``shared_keys.json``) replace the catalog values; new keys only fill
+    values that are missing or empty; keys still missing in a language are
+    taken from the fallback language. ``index`` is a prebuilt ``KeyIndex``
+    covering every key, if there is one.
+    """
+    shared = shared or {}
+    extra_keys = new_keys.keys() | shared.keys()
+    table = ColumnarCatalog.from_catalogs(catalogs, languages, extra_keys=extra_keys, index=index)
+    table.apply_new_keys(shared, overwrite=True)
+    table.apply_new_keys(new_keys)
+    table.fill(fallback)
+    return table
+
+
+def merge_app(catalogs, new_keys, languages, fallback=FALLBACK_LANGUAGE, targets=None):
+    """
+    ``merge_table`` as plain dicts ({lang: {key: value}}, keys sorted).
+
+    ``targets`` limits which languages are returned (all of them by default).
+    """
+    table = merge_table(catalogs, new_keys, languages, fallback)
+    return {lang: table.to_dict(lang) for lang in (languages if targets is None else targets)}
+
+
+def default_jobs():
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def _is_unchanged(entry, new_keys_hash, hashes):
+    if not entry or entry.get('new_keys') != new_keys_hash:
+        return False
+    stored = entry.get('languages', {})
+    return set(stored) == set(hashes) and all(
+        hashes[lang] is not None and stored[lang]['hash'] == hashes[lang] for lang in hashes
+    )
+
+
+def _dirty_languages(app, entry, new_keys_hash, hashes, files, fallback=FALLBACK_LANGUAGE):
+    """Languages whose merged output may differ from what the manifest recorded."""
+    everything = list(app.languages)
+    if not entry or entry.get('new_keys') != new_keys_hash:
+        return everything
+    stored = entry.get('languages', {})
+    if set(stored) != set(app.languages):
+        return everything
+    changed = [lang for lang in app.languages if stored[lang]['hash'] != hashes[lang]]
+    if fallback in changed:
+        return everything
+    # A changed key set changes the key union, and with it every language.
+    for lang in changed:
+        if keys_hash(files[lang].data) != stored[lang]['keys']:
+            return everything
+    return changed
+
+
+def sync(apps, jobs=None, dry_run=False, manifest=None, shared=None):
+    """
+    Sync every catalog of ``apps`` in one pass and return a ``SyncResult`` per app.
+
+    ``shared`` maps app names to their slice of the shared catalog (see
+    ``shared.shared_slices``). Pass a ``Manifest`` to run incrementally; it
+    is updated in place (but not saved) unless ``dry_run`` is set.
+    """
+    shared = shared or {}
+    with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as pool:
+        with phase('load'):
+            reads = {
+                (app.name, lang): pool.submit(read_bytes, app.catalog_path(lang))
+                for app in apps for lang in app.languages
+            }
+            key_reads = {app.name: pool.submit(read_bytes, app.new_keys_path) for app in apps}
+
+            # Hash everything first; only apps with changed inputs get parsed.
+            pending = []
+            results = []
+            for app in apps:
+                raw = {lang: reads[(app.name, lang)].result() for lang in app.languages}
+                keys_raw = key_reads[app.name].result()
+                hashes = {lang: content_hash(raw[lang]) for lang in app.languages}
+                new_keys_hash = content_hash(keys_raw)
+                if shared.get(app.name):
+                    # The shared slice is a definition input like new_keys.json.
+                    new_keys_hash = definitions_hash({'new_keys': new_keys_hash, 'shared': shared[app.name]})
+                entry = manifest.get(app.name) if manifest is not None else None
+                if _is_unchanged(entry, new_keys_hash, hashes):
+                    results.append(SyncResult(app, entry.get('key_count', 0), skipped=True))
+                    continue
+                parses = {
+                    lang: pool.submit(parse_catalog, app.catalog_path(lang), raw[lang])
+                    for lang in app.languages
+                }
+                pending.append((app, raw, keys_raw, hashes, new_keys_hash, entry, parses))
+
+        writes = []
+        updates = []
+        for app, raw, keys_raw, hashes, new_keys_hash, entry, parses in pending:
+            with phase('load'):
+                files = {lang: parses[lang].result() for lang in app.languages}
+            if manifest is not None:
+                targets = _dirty_languages(app, entry, new_keys_hash, hashes, files)
+            else:
+                targets = list(app.languages)
+            with phase('merge'):
+                table = merge_table(
+                    {lang: f.data for lang, f in files.items()},
+                    parse_new_keys(app.new_keys_path, keys_raw),
+                    app.languages,
+                    shared=shared.get(app.name),
+                )
+                merged_keys = keys_hash(table.index.keys)
+
+            result = SyncResult(app)
+            result.duplicates = {lang: f.duplicates for lang, f in files.items() if f.duplicates}
+            state = {}
+            with phase('serialize'):
+                for lang in app.languages:
+                    if lang in targets:
+                        out = table.dump(lang, files[lang].indent).encode('utf-8')
+                        key_count, lang_keys = len(table.index), merged_keys
+                    else:
+                        out = raw[lang]
+                        key_count, lang_keys = len(files[lang].data), keys_hash(files[lang].data)
+                    result.key_count = max(result.key_count, key_count)
+                    if out == raw[lang]:
+                        result.unchanged.append(lang)
+                    else:
+                        result.written.append(lang)
+                        if not dry_run:
+                            writes.append((files[lang].path, out))
+                    state[lang] = {'hash': content_hash(out), 'keys': lang_keys}
+
+            if manifest is not None and not dry_run:
+                updates.append((app.name, new_keys_hash, state, result.key_count))
+            results.append(result)
+
+        # Written once everything merged, so a bad catalog leaves every file as it was.
+        with phase('write'):
+            for future in [pool.submit(write_catalog, path, out) for path, out in writes]:
+                future.result()
+        # Recorded only once written: an app whose write failed is synced again next time.
+        for update in updates:
+            manifest.update(*update)
+
+    order = {app.name: i for i, app in enumerate(apps)}
+    return sorted(results, key=lambda r: order[r.app.name])
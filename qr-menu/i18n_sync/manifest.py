@@ -0,0 +1,70 @@
+"""
+Content-hash manifest used by incremental syncs.
+
+For every app the manifest remembers the hash of its ``new_keys.json`` and,
+per language, the hash of the catalog bytes and of its key set as they were
+after the last sync. An app whose inputs still hash the same is skipped
+without parsing a single file.
+"""
+
+import hashlib
+import json
+import os
+
+from filecache import write_json
+
+from .apps import ROOT
+
+# Bump when the merge rules change so stale manifests force a full re-merge.
+ENGINE_VERSION = 1
+
+CACHE_DIR = os.path.join(ROOT, '.i18n-cache')
+DEFAULT_MANIFEST = os.path.join(CACHE_DIR, 'manifest.json')
+
+
+def content_hash(raw):
+    if raw is None:
+        return None
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def keys_hash(keys):
+    return content_hash('\n'.join(sorted(keys)).encode('utf-8'))
+
+
+def definitions_hash(definitions):
+    """Hash of ``{key: {lang: value}}`` definitions, independent of their order."""
+    return content_hash(json.dumps(definitions, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+
+
+class Manifest:
+    """Per-app input fingerprints, persisted as JSON."""
+
+    def __init__(self, path=DEFAULT_MANIFEST, apps=None):
+        self.path = path
+        self.apps = apps or {}
+
+    @classmethod
+    def load(cls, path=DEFAULT_MANIFEST):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        if data.get('version') != ENGINE_VERSION:
+            return cls(path)
+        return cls(path, data.get('apps', {}))
+
+    def get(self, app_name):
+        return self.apps.get(app_name)
+
+    def update(self, app_name, new_keys_hash, languages, key_count):
+        """``languages`` maps each language to ``{'hash': ..., 'keys': ...}``."""
+        self.apps[app_name] = {
+            'new_keys': new_keys_hash,
+            'languages': languages,
+            'key_count': key_count,
+        }
+
+    def save(self):
+        write_json(self.path, {'version': ENGINE_VERSION, 'apps': self.apps}, indent=2, sort_keys=True)
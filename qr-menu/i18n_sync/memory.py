@@ -0,0 +1,173 @@
+"""
+Translation memory over every catalog, for suggesting new keys' values.
+
+Each distinct source-language (``pt``) string of every app is one entry,
+with the values the other languages give it under the same key. Entries are
+indexed by character trigrams of their normalized text (case, accents and
+punctuation ignored) in an inverted index, and ranked by the Dice
+coefficient of the trigram sets.
+
+Lookups do not compare the query with every entry: a string scoring at
+least ``min_score`` must share a minimum number of trigrams with the query,
+so it has to contain one of the query's rarest trigrams (prefix filtering).
+Only those short posting lists are read; the candidates they yield are then
+length-filtered and scored exactly.
+"""
+
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from .apps import FALLBACK_LANGUAGE, SOURCE_LANGUAGE
+from .catalog import load_catalog
+
+NGRAM = 3
+DEFAULT_MIN_SCORE = 0.5
+DEFAULT_LIMIT = 3
+_SEPARATORS = re.compile(r'[\W_]+')
+_COMBINING = re.compile(r'[\u0300-\u036f]+')
+
+
+def normalize(text):
+    """``'Erro ao validar código!'`` -> ``'erro ao validar codigo'``."""
+    text = text.casefold()
+    if not text.isascii():
+        text = _COMBINING.sub('', unicodedata.normalize('NFKD', text))
+    return _SEPARATORS.sub(' ', text).strip()
+
+
+def ngrams(text, n=NGRAM):
+    padded = f' {normalize(text)} '
+    if len(padded) <= n:
+        return frozenset((padded,))
+    return frozenset({padded[i:i + n] for i in range(len(padded) - n + 1)})
+
+
+@dataclass
+class Match:
+    score: float
+    text: str
+    entry: int
+
+
+@dataclass
+class Suggestion:
+    """A candidate value for one language, and the closest source string it translates."""
+
+    value: str
+    score: float
+    source: str
+    # "app:key" of every catalog entry giving this value to ``source``
+    origins: list = field(default_factory=list)
+
+
+class TranslationMemory:
+    def __init__(self, source=SOURCE_LANGUAGE, n=NGRAM):
+        self.source = source
+        self.n = n
+        self.texts = []
+        self.grams = []
+        # Per entry: {lang: {value: [origin, ...]}}
+        self.translations = []
+        self.postings = defaultdict(list)
+        self._ids = {}
+
+    def __len__(self):
+        return len(self.texts)
+
+    def add(self, text, translations, origin):
+        """Record that ``text`` is translated as ``translations`` ({lang: value}) at ``origin``."""
+        entry = self._ids.get(text)
+        if entry is None:
+            entry = self._ids[text] = len(self.texts)
+            grams = ngrams(text, self.n)
+            self.texts.append(text)
+            self.grams.append(grams)
+            self.translations.append({})
+            postings = self.postings
+            for gram in grams:
+                postings[gram].append(entry)
+        values = self.translations[entry]
+        for lang, value in translations.items():
+            values.setdefault(lang, {}).setdefault(value, []).append(origin)
+        return entry
+
+    @classmethod
+    def from_apps(cls, apps, source=SOURCE_LANGUAGE, fallback=FALLBACK_LANGUAGE):
+        """
+        Index every app's catalogs.
+
+        ``sync`` fills gaps with the ``fallback`` value, so a value equal to
+        the fallback's (and not to the source) is an untranslated copy and
+        is left out.
+        """
+        memory = cls(source)
+        for app in apps:
+            if source not in app.languages:
+                continue
+            catalogs = {lang: load_catalog(app.catalog_path(lang)).data for lang in app.languages}
+            others = [lang for lang in app.languages if lang != source]
+            for key, text in catalogs[source].items():
+                if not isinstance(text, str) or not text.strip():
+                    continue
+                copied = catalogs.get(fallback, {}).get(key)
+                translations = {}
+                for lang in others:
+                    value = catalogs[lang].get(key)
+                    if not isinstance(value, str) or not value.strip():
+                        continue
+                    if lang != fallback and value == copied and value != text:
+                        continue
+                    translations[lang] = value
+                memory.add(text, translations, f'{app.name}:{key}')
+        return memory
+
+    def search(self, text, min_score=DEFAULT_MIN_SCORE, limit=10):
+        """Entries whose source text scores at least ``min_score`` against ``text``, best first."""
+        query = ngrams(text, self.n)
+        size = len(query)
+        # Dice >= s needs an overlap of at least s*|q|/(2-s) trigrams, so any
+        # match contains one of the |q| - overlap + 1 rarest query trigrams.
+        overlap = max(1, math.ceil(min_score * size / (2 - min_score) - 1e-9))
+        known = sorted((gram for gram in query if gram in self.postings), key=lambda g: len(self.postings[g]))
+        prefix = known[:max(0, len(known) - overlap + 1)]
+        candidates = set()
+        for gram in prefix:
+            candidates.update(self.postings[gram])
+
+        low, high = size * min_score / (2 - min_score), size * (2 - min_score) / min_score
+        matches = []
+        for entry in candidates:
+            grams = self.grams[entry]
+            if not low <= len(grams) <= high:
+                continue
+            score = 2 * len(query & grams) / (size + len(grams))
+            if score >= min_score:
+                matches.append(Match(score, self.texts[entry], entry))
+        matches.sort(key=lambda m: (-m.score, m.text))
+        return matches[:limit]
+
+    def suggest(self, text, languages, min_score=DEFAULT_MIN_SCORE, limit=DEFAULT_LIMIT, exclude=()):
+        """
+        ``{lang: [Suggestion, ...]}`` ranked by score, then by how many
+        catalog entries agree. Origins in ``exclude`` (e.g. the key being
+        translated) are ignored.
+        """
+        found = {lang: {} for lang in languages}
+        for match in self.search(text, min_score, limit=max(10, limit * 4)):
+            for lang in languages:
+                for value, origins in self.translations[match.entry].get(lang, {}).items():
+                    origins = [origin for origin in origins if origin not in exclude]
+                    if not origins:
+                        continue
+                    best = found[lang].get(value)
+                    if best is None or match.score > best.score:
+                        found[lang][value] = Suggestion(value, match.score, match.text, origins)
+                    elif match.score == best.score:
+                        best.origins.extend(origins)
+        return {
+            lang: sorted(values.values(), key=lambda s: (-s.score, -len(s.origins), s.value))[:limit]
+            for lang, values in found.items()
+        }
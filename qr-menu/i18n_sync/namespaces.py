@@ -0,0 +1,131 @@
+"""
+Split a web app's catalog into per-route i18next namespaces.
+
+Pages under ``src/pages`` form route groups: a top-level page is its own
+group (``pages/Login.jsx`` -> ``login``), a sub-folder is one group
+(``pages/reports/*`` -> ``reports``), and ``components/<group>/`` belongs
+to the page group of the same name. A key used by exactly one group goes to
+that group's namespace; everything else (shared components, contexts,
+keys used by several pages, unreferenced keys) stays in ``common``.
+
+Next to the namespace files a ``namespaces.json`` manifest tells the
+frontend which namespace each page needs, so it can load ``common`` up
+front and the rest lazily on navigation.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+
+from .catalog import dump_compact, load_catalog, write_if_changed
+
+COMMON = 'common'
+MANIFEST_NAME = 'namespaces.json'
+# Names a page namespace must not take (they would clash with other files).
+RESERVED = {COMMON, 'translation', 'namespaces'}
+PAGES_DIR = 'pages'
+COMPONENTS_DIR = 'components'
+
+
+def namespace_name(stem):
+    """``OwnerDashboard`` -> ``owner-dashboard``."""
+    name = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', '-', stem).replace('_', '-').lower()
+    return f'{name}-page' if name in RESERVED else name
+
+
+def page_groups(app):
+    """Map every page file (relative to the source dir) to its namespace."""
+    groups = {}
+    for path in app.source_files():
+        rel = os.path.relpath(path, app.source_dir)
+        parts = rel.split(os.sep)
+        if parts[0] != PAGES_DIR:
+            continue
+        if len(parts) > 2:
+            groups[rel] = namespace_name(parts[1])
+        else:
+            groups[rel] = namespace_name(os.path.splitext(parts[1])[0])
+    return groups
+
+
+def _group_of(app, path, pages, group_names):
+    rel = os.path.relpath(path, app.source_dir)
+    if rel in pages:
+        return pages[rel]
+    parts = rel.split(os.sep)
+    if len(parts) > 2 and parts[0] == COMPONENTS_DIR and namespace_name(parts[1]) in group_names:
+        return namespace_name(parts[1])
+    return None
+
+
+@dataclass
+class NamespaceSplit:
+    """Result of splitting one app."""
+
+    app: object
+    namespaces: dict = field(default_factory=dict)  # namespace -> sorted keys
+    pages: dict = field(default_factory=dict)       # page file -> namespace
+    written: list = field(default_factory=list)
+
+
+def split_keys(usage):
+    """Assign every catalog key of ``usage.app`` to a namespace."""
+    app = usage.app
+    pages = page_groups(app)
+    group_names = set(pages.values())
+    assignment = {}
+    for key in usage.status:
+        groups = {_group_of(app, path, pages, group_names) for path in usage.referencing_files(key)}
+        if len(groups) == 1 and None not in groups:
+            assignment[key] = groups.pop()
+        else:
+            assignment[key] = COMMON
+    namespaces = {COMMON: []}
+    for key in sorted(assignment):
+        namespaces.setdefault(assignment[key], []).append(key)
+    # Pages without keys of their own only need common.
+    pages = {rel: ns if ns in namespaces else COMMON for rel, ns in sorted(pages.items())}
+    return NamespaceSplit(app, dict(sorted(namespaces.items())), pages)
+
+
+def manifest_for(split):
+    return {
+        'defaultNS': COMMON,
+        'namespaces': {ns: len(keys) for ns, keys in split.namespaces.items()},
+        'pages': {rel.replace(os.sep, '/'): ns for rel, ns in split.pages.items()},
+    }
+
+
+def namespace_chunks(split, data):
+    """Yield ``(namespace, {key: value})`` for one language's catalog ``data``."""
+    for ns, keys in split.namespaces.items():
+        yield ns, {key: data[key] for key in keys if key in data}
+
+
+def build_namespaces(usage, out_dir=None, dry_run=False):
+    """
+    Write ``<out_dir>/<lang>/<namespace>.json`` for every language plus the manifest.
+
+    ``out_dir`` defaults to the app's locale folder, next to ``translation.json``.
+    Files whose content did not change are left untouched.
+    """
+    split = split_keys(usage)
+    app = usage.app
+    out_dir = out_dir or app.locale_dir
+    for lang in app.languages:
+        data = load_catalog(app.catalog_path(lang)).data
+        for ns, chunk in namespace_chunks(split, data):
+            path = os.path.join(out_dir, lang, f'{ns}.json')
+            if not dry_run and write_if_changed(path, dump_compact(chunk).encode('utf-8')):
+                split.written.append(path)
+
+    manifest = json.dumps(manifest_for(split), indent=2) + '\n'
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if not dry_run and write_if_changed(path, manifest.encode('utf-8')):
+        split.written.append(path)
+    return split
+
+
+def has_pages(app):
+    return os.path.isdir(os.path.join(app.source_dir, PAGES_DIR))
@@ -0,0 +1,111 @@
+"""
+Core catalog shared by every app.
+
+``shared_keys.json`` (next to the apps) defines the keys several apps use,
+in the ``new_keys.json`` format: ``{key: {lang: value}}``. ``sync`` compiles
+each app's ``translation.json`` from its own catalog plus the slice of the
+shared catalog it needs: the shared keys it already has, and those its
+source calls (``t('key')``, or a ``t(`prefix_${x}`)`` covering them).
+Shared values win over the app's, so a shared key is edited in one place
+and every app picks the change up.
+
+Each slice is hashed into the app's manifest fingerprint, so an edit to
+the shared catalog only rebuilds the apps whose slice it touches.
+"""
+
+import os
+from dataclasses import dataclass, field
+
+from .apps import ROOT
+from .catalog import dump_catalog, load_catalog, load_new_keys, write_if_changed
+from .usage import DYNAMIC, USED, UsageCache, classify
+
+SHARED_KEYS_NAME = 'shared_keys.json'
+SHARED_KEYS_PATH = os.path.join(ROOT, SHARED_KEYS_NAME)
+
+
+def load_shared(path=SHARED_KEYS_PATH):
+    """The shared definitions; a missing file means nothing is shared."""
+    return load_new_keys(path)
+
+
+def _catalog_keys(app):
+    keys = set()
+    for lang in app.languages:
+        keys.update(load_catalog(app.catalog_path(lang)).data)
+    return keys
+
+
+def needed_keys(shared, scans, catalog_keys):
+    """Shared keys an app needs: those it has, plus those its source calls."""
+    status, _, _ = classify(sorted(shared), scans)
+    return sorted(key for key, s in status.items() if key in catalog_keys or s in (USED, DYNAMIC))
+
+
+def shared_slices(apps, shared, cache=None, jobs=None):
+    """``{app name: {key: {lang: value}}}``: the part of ``shared`` each app compiles in."""
+    if not shared:
+        return {}
+    cache = cache if cache is not None else UsageCache(os.devnull)
+    slices = {}
+    for app in apps:
+        scans = cache.scan(app.source_files(), jobs=jobs)
+        slices[app.name] = {key: shared[key] for key in needed_keys(shared, scans, _catalog_keys(app))}
+    return slices
+
+
+@dataclass
+class SharedReport:
+    """Keys several apps define, and how they relate to the shared catalog."""
+
+    # {key: {lang: value}} defined identically by two apps or more, not shared yet
+    candidates: dict = field(default_factory=dict)
+    # {key: [app, ...]} defined by two apps or more with different values
+    drift: dict = field(default_factory=dict)
+    # {key: [app, ...]} shared keys whose value in those apps' catalogs the next sync overwrites
+    overridden: dict = field(default_factory=dict)
+
+
+def analyze(apps, shared):
+    report = SharedReport()
+    values = {}
+    for app in apps:
+        catalogs = {lang: load_catalog(app.catalog_path(lang)).data for lang in app.languages}
+        for key in catalogs[app.languages[0]]:
+            definition = {lang: catalogs[lang].get(key) for lang in app.languages}
+            values.setdefault(key, []).append((app.name, definition))
+    for key, found in sorted(values.items()):
+        if key in shared:
+            differ = [name for name, definition in found
+                      if any(definition.get(lang) != value for lang, value in shared[key].items())]
+            if differ:
+                report.overridden[key] = differ
+        elif len(found) > 1:
+            first = found[0][1]
+            if all(definition == first for _, definition in found[1:]):
+                report.candidates[key] = first
+            else:
+                report.drift[key] = [name for name, _ in found]
+    return report
+
+
+def extract(apps, shared, candidates, path=SHARED_KEYS_PATH, dry_run=False):
+    """
+    Move ``candidates`` into the shared catalog and out of every app's
+    ``new_keys.json``. Returns the paths written.
+    """
+    written = []
+    if not candidates:
+        return written
+    merged = dict(sorted({**shared, **candidates}.items()))
+    if not dry_run and write_if_changed(path, (dump_catalog(merged) + '\n').encode('utf-8')):
+        written.append(path)
+    for app in apps:
+        definitions = load_catalog(app.new_keys_path)
+        kept = {key: value for key, value in definitions.data.items() if key not in candidates}
+        if len(kept) == len(definitions.data):
+            continue
+        raw = (dump_catalog(kept, definitions.indent) + '\n').encode('utf-8')
+        if not dry_run and write_if_changed(app.new_keys_path, raw):
+            written.append(app.new_keys_path)
+    return written
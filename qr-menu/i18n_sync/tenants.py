@@ -0,0 +1,310 @@
+"""
+Per-restaurant wording compiled into layered, cached bundles.
+
+Overrides live next to the apps, in ``locale-overrides/``::
+
+    countries/<country>.json       {"pt": {"popular": "..."}, "en": {...}}
+    restaurants/<restaurant>.json  {"country": "Mozambique", "pt": {"today_billing": "..."}}
+
+``<country>`` is the slug of the restaurant's ``address.country``
+(``Mozambique`` -> ``mozambique``) and ``<restaurant>`` its id. For every web
+app, a tenant's bundle is the base catalog, then its country layer, then
+its own overrides; only keys the app already has are overridden.
+
+Bundles are minified and content-addressed
+(``public/locales/tenants/<lng>/<hash>.json``), so tenants that end up with
+the same wording share one file, and a language a tenant does not override
+points at the base ``translation.json``. ``public/locales/tenants.json``
+maps every country and restaurant to its URLs.
+
+A tenant is only recompiled when one of its layers changed since the
+previous run (fingerprints in ``.i18n-cache/tenants.json``); compiled
+bundles are kept in a ``BundleCache`` with a byte budget, so the restaurants
+of one country that only override another language share the work. The
+unknown keys and placeholder warnings of a bundle are kept with it (and in
+the state), so they are reported on every run, compiled or not.
+"""
+
+import json
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from filecache import write_json
+
+from .apps import ROOT
+from .catalog import CatalogError, load_catalog, write_catalog, write_if_changed
+from .columns import ColumnarCatalog, dump_column
+from .manifest import CACHE_DIR, content_hash
+from .validate import placeholders
+
+OVERRIDES_DIR = os.path.join(ROOT, 'locale-overrides')
+DEFAULT_STATE = os.path.join(CACHE_DIR, 'tenants.json')
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+TENANT_DIR = 'tenants'
+MANIFEST_NAME = 'tenants.json'
+STATE_VERSION = 2
+HASH_LENGTH = 10
+BUNDLE_NAME = re.compile(r'^[0-9a-f]{%d}\.json$' % HASH_LENGTH)
+TENANT_NAME = re.compile(r'^[\w-]+$')
+COUNTRY_FIELD = 'country'
+
+
+def country_slug(name):
+    """``South Africa`` -> ``south-africa``."""
+    return re.sub(r'[^a-z0-9]+', '-', name.strip().lower()).strip('-')
+
+
+@dataclass
+class Layer:
+    """One overrides file: ``{lang: {key: value}}`` plus a hash per language."""
+
+    kind: str
+    name: str
+    path: str
+    data: dict = field(default_factory=dict)
+    hashes: dict = field(default_factory=dict)
+    country: str = ''
+
+
+def _parse_layer(kind, path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    if not TENANT_NAME.match(name):
+        raise CatalogError(f'{path}: file name must only use letters, digits, "_" and "-"')
+    raw = load_catalog(path).data
+    layer = Layer(kind, name, path)
+    for lang, overrides in raw.items():
+        if lang == COUNTRY_FIELD and kind == 'restaurant':
+            layer.country = country_slug(str(overrides))
+            continue
+        if not isinstance(overrides, dict) or not all(isinstance(v, str) for v in overrides.values()):
+            raise CatalogError(f'{path}: "{lang}" must map keys to strings')
+        layer.data[lang] = overrides
+        layer.hashes[lang] = content_hash(json.dumps(overrides, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return layer
+
+
+def load_layers(root=OVERRIDES_DIR):
+    """Return ``(countries, restaurants)``, both ``{name: Layer}``; a missing folder means no overrides."""
+    found = {}
+    for kind, folder in (('country', 'countries'), ('restaurant', 'restaurants')):
+        found[kind] = {}
+        directory = os.path.join(root, folder)
+        if not os.path.isdir(directory):
+            continue
+        for entry in sorted(os.listdir(directory)):
+            if entry.endswith('.json'):
+                layer = _parse_layer(kind, os.path.join(directory, entry))
+                found[kind][layer.name] = layer
+    return found['country'], found['restaurant']
+
+
+@dataclass(frozen=True)
+class Bundle:
+    """One compiled language of a tenant, with what its layers got wrong."""
+
+    raw: bytes
+    unknown: frozenset = frozenset()  # overridden keys the app does not have
+    warnings: tuple = ()              # (key, message) of overrides whose placeholders differ
+
+    def __len__(self):
+        return len(self.raw)
+
+
+class BundleCache:
+    """LRU of compiled ``Bundle`` s bounded by their total size."""
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+
+    def get(self, key):
+        value = self._items.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if len(value) > self.max_bytes:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self._items[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._items)
+
+
+class TenantState:
+    """Layer fingerprints and bundle names of the previous run, per app and tenant."""
+
+    def __init__(self, path=DEFAULT_STATE, apps=None):
+        self.path = path
+        self.apps = apps or {}
+
+    @classmethod
+    def load(cls, path=DEFAULT_STATE):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        if data.get('version') != STATE_VERSION:
+            return cls(path)
+        return cls(path, data.get('apps', {}))
+
+    def save(self):
+        write_json(self.path, {'version': STATE_VERSION, 'apps': self.apps}, indent=2, sort_keys=True)
+
+
+@dataclass
+class TenantResult:
+    """Outcome of compiling one app's tenant bundles."""
+
+    app: object
+    tenants: int = 0
+    rebuilt: list = field(default_factory=list)
+    manifest: dict = field(default_factory=dict)
+    written: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    # {tenant: {key, ...}} overrides for keys this app does not have
+    unknown: dict = field(default_factory=dict)
+    # (tenant, lang, key, message) overrides whose placeholders differ from the base value
+    warnings: list = field(default_factory=list)
+
+
+def _chains(countries, restaurants):
+    """``{tenant id: [Layer, ...]}`` in the order the layers apply."""
+    chains = {f'country:{name}': [layer] for name, layer in countries.items()}
+    for name, layer in restaurants.items():
+        country = countries.get(layer.country)
+        chains[f'restaurant:{name}'] = ([country] if country else []) + [layer]
+    return chains
+
+
+def _compile(table, lang, layers):
+    column = list(table.columns[lang])
+    positions = table.index.positions
+    unknown, warnings = set(), []
+    for layer in layers:
+        for key, value in layer.data.get(lang, {}).items():
+            pos = positions.get(key)
+            if pos is None:
+                unknown.add(key)
+                continue
+            if placeholders(value) != placeholders(column[pos]):
+                warnings.append((key, f'placeholders {sorted(placeholders(value))} '
+                                      f'differ from {sorted(placeholders(column[pos]))}'))
+            column[pos] = value
+    return Bundle(dump_column(table.index, column).encode('utf-8'), frozenset(unknown), tuple(warnings))
+
+
+def _report(result, tenant, entry):
+    if entry['unknown']:
+        result.unknown.setdefault(tenant, set()).update(entry['unknown'])
+    result.warnings.extend((tenant, lang, key, message) for lang, key, message in entry['warnings'])
+
+
+def build_tenants(app, countries, restaurants, state, cache, out_dir=None, base_url='/locales',
+                  force=False, dry_run=False):
+    """
+    Compile the bundles of every tenant of ``app`` whose layers changed.
+
+    ``state`` (a ``TenantState``) is updated in place but not saved.
+    """
+    out_dir = out_dir or app.locale_dir
+    base_url = base_url.rstrip('/')
+    result = TenantResult(app)
+    catalogs = {lang: load_catalog(app.catalog_path(lang)) for lang in app.languages}
+    base_hashes = {lang: content_hash(c.text.encode('utf-8')) for lang, c in catalogs.items()}
+    table = None
+    previous = state.apps.get(app.name, {})
+    current = {}
+
+    for tenant, layers in sorted(_chains(countries, restaurants).items()):
+        result.tenants += 1
+        # Per language, only the layers that override it matter.
+        keys = {lang: (app.name, lang, base_hashes[lang]) + tuple(
+                    f'{layer.kind}:{layer.name}:{layer.hashes[lang]}' for layer in layers if lang in layer.hashes)
+                for lang in app.languages}
+        fingerprint = content_hash(json.dumps(keys, sort_keys=True).encode('utf-8'))
+        entry = previous.get(tenant)
+        bundles = entry['bundles'] if entry and entry['fingerprint'] == fingerprint else None
+        if bundles is not None and not force and all(
+                name is None or os.path.exists(os.path.join(out_dir, TENANT_DIR, lang, name))
+                for lang, name in bundles.items()):
+            current[tenant] = entry
+            _report(result, tenant, entry)
+            continue
+
+        result.rebuilt.append(tenant)
+        bundles = {}
+        unknown, warnings = set(), []
+        for lang in app.languages:
+            if not any(lang in layer.hashes for layer in layers):
+                bundles[lang] = None
+                continue
+            bundle = cache.get(keys[lang])
+            if bundle is None:
+                if table is None:
+                    table = ColumnarCatalog.from_catalogs({lang: c.data for lang, c in catalogs.items()}, app.languages)
+                bundle = _compile(table, lang, layers)
+                cache.put(keys[lang], bundle)
+            unknown.update(bundle.unknown)
+            warnings.extend([lang, key, message] for key, message in bundle.warnings)
+            name = f'{content_hash(bundle.raw)[:HASH_LENGTH]}.json'
+            path = os.path.join(out_dir, TENANT_DIR, lang, name)
+            if not dry_run and not os.path.exists(path):
+                write_catalog(path, bundle.raw)
+                result.written.append(path)
+            bundles[lang] = name
+        current[tenant] = {'fingerprint': fingerprint, 'bundles': bundles,
+                           'unknown': sorted(unknown), 'warnings': warnings}
+        _report(result, tenant, current[tenant])
+
+    manifest = {}
+    for tenant, entry in sorted(current.items()):
+        kind, name = tenant.split(':', 1)
+        urls = {lang: f'{base_url}/{TENANT_DIR}/{lang}/{bundle}' if bundle else f'{base_url}/{lang}/translation.json'
+                for lang, bundle in entry['bundles'].items()}
+        manifest.setdefault('countries' if kind == 'country' else 'restaurants', {})[name] = urls
+    result.manifest = manifest
+    if dry_run:
+        return result
+
+    state.apps[app.name] = current
+    text = json.dumps(manifest, indent=2, sort_keys=True) + '\n'
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if write_if_changed(path, text.encode('utf-8')):
+        result.written.append(path)
+    _remove_stale(result, out_dir, current)
+    return result
+
+
+def _remove_stale(result, out_dir, current):
+    keep = {(lang, name) for entry in current.values() for lang, name in entry['bundles'].items() if name}
+    root = os.path.join(out_dir, TENANT_DIR)
+    if not os.path.isdir(root):
+        return
+    for lang in sorted(os.listdir(root)):
+        lang_dir = os.path.join(root, lang)
+        if not os.path.isdir(lang_dir):
+            continue
+        for name in sorted(os.listdir(lang_dir)):
+            if BUNDLE_NAME.match(name) and (lang, name) not in keep:
+                os.remove(os.path.join(lang_dir, name))
+                result.removed.append(os.path.join(lang_dir, name))
@@ -0,0 +1,58 @@
+import json
+
+from i18n_sync.catalog import dump_catalog
+from i18n_sync.columns import MISSING, ColumnarCatalog, KeyIndex, dump_column
+from i18n_sync.engine import merge_app, merge_table
+
+LANGUAGES = ('pt', 'en', 'es')
+
+
+def test_from_catalogs_marks_absent_keys_missing():
+    table = ColumnarCatalog.from_catalogs({'pt': {'b': 'B', 'a': 'A'}, 'en': {'a': 'A'}}, ('pt', 'en'),
+                                          extra_keys={'c'})
+    assert table.index.keys == ('a', 'b', 'c')
+    assert table.columns['pt'] == ['A', 'B', MISSING]
+    assert table.columns['en'] == ['A', MISSING, MISSING]
+    assert table.get('en', 'b', 'none') == 'none'
+    assert table.to_dict('en') == {'a': 'A'}
+
+
+def test_merge_fills_from_fallback_and_new_keys():
+    catalogs = {
+        'pt': {'save': 'Guardar', 'old': 'Antigo'},
+        'en': {'save': 'Save', 'old': 'Old', 'edited': 'Kept'},
+        'es': {'save': ''},
+    }
+    new_keys = {'edited': {'en': 'Overwritten?'}, 'new': {'pt': 'Novo', 'en': 'New'}}
+    table = merge_table(catalogs, new_keys, LANGUAGES, fallback='en')
+    assert table.to_dict('en') == {'edited': 'Kept', 'new': 'New', 'old': 'Old', 'save': 'Save'}
+    # Missing values come from the fallback; empty ones are kept as they are.
+    assert table.to_dict('pt') == {'edited': 'Kept', 'new': 'Novo', 'old': 'Antigo', 'save': 'Guardar'}
+    assert table.to_dict('es') == {'edited': 'Kept', 'new': 'New', 'old': 'Old', 'save': ''}
+    assert not any(value is MISSING for column in table.columns.values() for value in column)
+
+
+def test_shared_definitions_overwrite_catalog_values():
+    table = merge_table({'pt': {'brand': 'Velho'}, 'en': {'brand': 'Old'}}, {},
+                        ('pt', 'en'), shared={'brand': {'pt': 'Novo', 'en': 'New'}})
+    assert table.to_dict('pt') == {'brand': 'Novo'}
+    assert table.to_dict('en') == {'brand': 'New'}
+
+
+def test_missing_fallback_language_leaves_empty_strings():
+    merged = merge_app({'pt': {'a': 'A'}}, {}, ('pt', 'es'), fallback='en')
+    assert merged == {'pt': {'a': 'A'}, 'es': {'a': ''}}
+
+
+def test_dump_column_matches_dump_catalog():
+    index = KeyIndex({'b', 'a', 'ç'})
+    column = ['Á "quoted"', MISSING, 'linha\nnova']
+    expected = dump_catalog({'a': 'Á "quoted"', 'ç': 'linha\nnova'}, 4)
+    assert dump_column(index, column, 4) == expected
+    assert json.loads(dump_column(index, column)) == {'a': 'Á "quoted"', 'ç': 'linha\nnova'}
+
+
+def test_diff_and_delta_skip_missing():
+    table = ColumnarCatalog.from_catalogs({'pt': {'a': 'A', 'b': 'B'}, 'en': {'a': 'A', 'c': 'C'}}, ('pt', 'en'))
+    assert table.delta('pt', 'en') == {'b': 'B'}
+    assert table.delta('en', 'pt') == {'c': 'C'}
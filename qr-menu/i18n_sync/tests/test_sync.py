@@ -0,0 +1,62 @@
+import json
+import os
+
+from i18n_sync.apps import App
+from i18n_sync.engine import sync
+from i18n_sync.manifest import Manifest
+
+
+def make_app(root, catalogs, new_keys):
+    locale_dir = os.path.join(root, 'i18n', 'locales')
+    for lang, data in catalogs.items():
+        os.makedirs(os.path.join(locale_dir, lang))
+        with open(os.path.join(locale_dir, lang, 'translation.json'), 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+    with open(os.path.join(root, 'new_keys.json'), 'w', encoding='utf-8') as f:
+        json.dump(new_keys, f)
+    return App('demo', str(root), locale_dir, tuple(catalogs))
+
+
+def read(app, lang):
+    with open(app.catalog_path(lang), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_second_sync_skips_unchanged_app(tmp_path):
+    app = make_app(tmp_path, {'pt': {'a': 'A'}, 'en': {'a': 'A', 'b': 'B'}}, {'c': {'pt': 'C', 'en': 'C'}})
+    manifest_path = str(tmp_path / 'manifest.json')
+
+    manifest = Manifest.load(manifest_path)
+    [first] = sync([app], jobs=1, manifest=manifest)
+    manifest.save()
+    assert not first.skipped
+    assert sorted(first.written) == ['en', 'pt']
+    assert read(app, 'pt') == {'a': 'A', 'b': 'B', 'c': 'C'}
+
+    [second] = sync([app], jobs=1, manifest=Manifest.load(manifest_path))
+    assert second.skipped
+    assert second.key_count == 3
+
+
+def test_changed_catalog_is_synced_again(tmp_path):
+    app = make_app(tmp_path, {'pt': {'a': 'A'}, 'en': {'a': 'A'}}, {})
+    manifest_path = str(tmp_path / 'manifest.json')
+    manifest = Manifest.load(manifest_path)
+    sync([app], jobs=1, manifest=manifest)
+    manifest.save()
+
+    with open(app.catalog_path('en'), 'w', encoding='utf-8') as f:
+        json.dump({'a': 'A', 'z': 'Z'}, f, indent=4)
+    [result] = sync([app], jobs=1, manifest=Manifest.load(manifest_path))
+    assert not result.skipped
+    assert read(app, 'pt') == {'a': 'A', 'z': 'Z'}
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    app = make_app(tmp_path, {'pt': {'a': 'A'}, 'en': {'b': 'B'}}, {})
+    before = read(app, 'pt')
+    manifest = Manifest(str(tmp_path / 'manifest.json'))
+    [result] = sync([app], jobs=1, dry_run=True, manifest=manifest)
+    assert sorted(result.written) == ['en', 'pt']
+    assert read(app, 'pt') == before
+    assert manifest.get('demo') is None
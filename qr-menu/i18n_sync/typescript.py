@@ -0,0 +1,133 @@
+"""
+Compile the mobile app's catalogs into TypeScript modules.
+
+``app/i18n/compiled/`` gets one module per language holding a frozen,
+key-sorted table, a ``keys.ts`` with the ``TranslationKey`` union type and
+an ``index.ts`` whose loaders ``require()`` a language only when i18next
+asks for it, so Metro never evaluates the catalogs nobody uses. The
+``i18next.d.ts`` augmentation types ``t()`` with the key union, so a key
+missing from the catalog fails ``tsc`` instead of showing up at runtime.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+
+from .catalog import load_catalog, write_if_changed
+from .delta import delta_catalogs, runtime_fallback
+
+COMPILED_DIR = 'compiled'
+HEADER = '// Generated by `python -m i18n_sync compile` from {source}. Do not edit.\n'
+
+
+def ts_string(value):
+    """A TypeScript string literal (JSON plus the two separators JS string literals reject)."""
+    return json.dumps(value, ensure_ascii=False).replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
+
+def _identifier(lang):
+    return lang.replace('-', '_')
+
+
+def _property(name):
+    """Object literal property name: bare when it is a plain identifier."""
+    return name if name.isidentifier() else ts_string(name)
+
+
+@dataclass
+class CompileResult:
+    app: object
+    out_dir: str = ''
+    key_count: int = 0
+    written: list = field(default_factory=list)
+    deltas: list = field(default_factory=list)  # DeltaSize per non-fallback language
+
+
+def render_keys(keys, languages):
+    lines = [HEADER.format(source='the locale catalogs')]
+    quoted = ', '.join(f"'{lang}'" for lang in languages)
+    lines.append(f'export const LANGUAGES = [{quoted}] as const;')
+    lines.append('export type Language = (typeof LANGUAGES)[number];')
+    lines.append('')
+    if keys:
+        lines.append('export type TranslationKey =')
+        lines.extend(f'  | {ts_string(key)}' for key in keys)
+        lines[-1] += ';'
+    else:
+        lines.append('export type TranslationKey = never;')
+    return '\n'.join(lines) + '\n'
+
+
+def render_catalog(lang, data, keys, source, partial=False):
+    name = _identifier(lang)
+    record = 'Partial<Record<TranslationKey, string>>' if partial else 'Record<TranslationKey, string>'
+    lines = [HEADER.format(source=source), "import type { TranslationKey } from './keys';", '']
+    lines.append(f'const {name}: Readonly<{record}> = Object.freeze({{')
+    if partial:
+        keys = [key for key in keys if key in data]
+    lines.extend(f'  {ts_string(key)}: {ts_string(data.get(key, ""))},' for key in keys)
+    lines.append('});')
+    lines.append('')
+    lines.append(f'export default {name};')
+    return '\n'.join(lines) + '\n'
+
+
+def render_index(languages, fallback, partial=False):
+    record = 'Partial<Record<TranslationKey, string>>' if partial else 'Record<TranslationKey, string>'
+    lines = [HEADER.format(source='the locale catalogs'),
+             "import type { Language, TranslationKey } from './keys';", '',
+             "export { LANGUAGES } from './keys';",
+             "export type { Language, TranslationKey } from './keys';", '',
+             f'export type Catalog = Readonly<{record}>;', '',
+             f"export const FALLBACK_LANGUAGE: Language = '{fallback}';", '',
+             '// require() inside each loader: Metro only evaluates a catalog the first time it is loaded.',
+             'export const loaders: Record<Language, () => Catalog> = {']
+    lines.extend(f"  {_property(lang)}: () => require('./{lang}').default," for lang in languages)
+    lines.append('};')
+    return '\n'.join(lines) + '\n'
+
+
+def render_typings():
+    return '\n'.join([
+        HEADER.format(source='the locale catalogs'),
+        "import 'i18next';",
+        "import type { TranslationKey } from './keys';",
+        '',
+        "declare module 'i18next' {",
+        '  interface CustomTypeOptions {',
+        "    defaultNS: 'translation';",
+        '    resources: { translation: Record<TranslationKey, string> };',
+        '  }',
+        '}',
+    ]) + '\n'
+
+
+def compile_app(app, out_dir=None, delta=False, dry_run=False):
+    """
+    Write the compiled modules for ``app``; unchanged files are left alone.
+
+    With ``delta`` only the fallback language keeps every key; the others
+    hold what differs from it and i18next resolves the rest at runtime.
+    """
+    out_dir = out_dir or os.path.join(os.path.dirname(app.locale_dir), COMPILED_DIR)
+    catalogs = {lang: load_catalog(app.catalog_path(lang)).data for lang in app.languages}
+    keys = sorted(set().union(*catalogs.values())) if catalogs else []
+    fallback = runtime_fallback(app)
+    result = CompileResult(app, out_dir, len(keys))
+    if delta:
+        catalogs, result.deltas = delta_catalogs(catalogs, app.languages, fallback)
+
+    files = {
+        'keys.ts': render_keys(keys, app.languages),
+        'index.ts': render_index(app.languages, fallback, partial=delta),
+        'i18next.d.ts': render_typings(),
+    }
+    for lang, data in catalogs.items():
+        source = os.path.relpath(app.catalog_path(lang), app.root).replace(os.sep, '/')
+        files[f'{lang}.ts'] = render_catalog(lang, data, keys, source, partial=delta and lang != fallback)
+
+    for name, text in files.items():
+        path = os.path.join(out_dir, name)
+        if not dry_run and write_if_changed(path, text.encode('utf-8')):
+            result.written.append(path)
+    return result
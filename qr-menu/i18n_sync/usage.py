@@ -0,0 +1,171 @@
+"""
+Index of which translation keys the source code actually uses.
+
+Every JS/TS file of an app is scanned for
+
+* literal calls: ``t('key')``, ``i18n.t("key")``, ``i18nKey="key"``,
+* dynamic calls: ``t(`status_${x}`)`` keeps every key starting with ``status_``,
+* indirect references: any other string literal that looks like a key
+  (``labelKey: 'tab_visual'`` later passed to ``t(item.labelKey)``).
+
+Scans are cached per file in ``.i18n-cache/usage.json`` by
+``filecache.FileCache``: a file whose mtime and size did not change is
+not read, and one whose content hash did not change is not re-scanned.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+
+from filecache import FileCache
+
+from .catalog import dump_catalog, load_catalog, load_new_keys, write_catalog
+from .manifest import CACHE_DIR
+
+CACHE_VERSION = 1
+DEFAULT_CACHE = os.path.join(CACHE_DIR, 'usage.json')
+
+CALL = re.compile(r'''(?<![\w$])t\(\s*(['"])((?:\\.|(?!\1).)*?)\1(\s*\+)?''')
+TEMPLATE_CALL = re.compile(r'(?<![\w$])t\(\s*`([^`$]*)(\$\{)?')
+I18N_KEY = re.compile(r'''i18nKey\s*[=:]\s*\{?\s*(['"])((?:\\.|(?!\1).)*?)\1''')
+# Short literals ('a', 'T', '2d') are DOM tags and date separators, not keys.
+LITERAL = re.compile(r'''(['"])([A-Za-z][\w.-]{2,99})\1''')
+
+USED = 'used'
+DYNAMIC = 'dynamic'
+INDIRECT = 'indirect'
+DEAD = 'dead'
+
+
+def scan_source(text):
+    """Return ``(calls, prefixes, literals)`` found in one source file."""
+    calls = set()
+    prefixes = set()
+    for m in CALL.finditer(text):
+        # t('status_' + x) is a dynamic call like t(`status_${x}`)
+        (prefixes if m.group(3) else calls).add(m.group(2))
+    calls.update(m.group(2) for m in I18N_KEY.finditer(text))
+    for m in TEMPLATE_CALL.finditer(text):
+        if m.group(2):
+            if m.group(1):
+                prefixes.add(m.group(1))
+        else:
+            calls.add(m.group(1))
+    literals = {m.group(2) for m in LITERAL.finditer(text)} - calls
+    return calls, prefixes, literals
+
+
+def _scan_entry(text):
+    calls, prefixes, literals = scan_source(text)
+    return {'calls': sorted(calls), 'prefixes': sorted(prefixes), 'literals': sorted(literals)}
+
+
+class UsageCache(FileCache):
+    """Per-file scan results keyed by path (``filecache.FileCache``)."""
+
+    def __init__(self, path=DEFAULT_CACHE, files=None):
+        super().__init__(path, _scan_entry, files, CACHE_VERSION)
+
+
+@dataclass
+class AppUsage:
+    """Usage of one app's catalog keys by its source code."""
+
+    app: object
+    status: dict = field(default_factory=dict)   # key -> USED/DYNAMIC/INDIRECT/DEAD
+    missing: list = field(default_factory=list)  # t('key') calls with no catalog entry
+    files: dict = field(default_factory=dict)    # key -> files calling it literally
+    scans: dict = field(default_factory=dict)    # source file -> scan entry
+
+    _literals: dict = field(default=None, repr=False)
+    _prefixes: dict = field(default=None, repr=False)
+
+    def referencing_files(self, key):
+        """Source files whose calls, dynamic prefixes or literals cover ``key``."""
+        if self._literals is None:
+            self._literals, self._prefixes = {}, {}
+            for path, entry in self.scans.items():
+                for literal in entry['literals']:
+                    self._literals.setdefault(literal, set()).add(path)
+                for prefix in entry['prefixes']:
+                    self._prefixes.setdefault(prefix, set()).add(path)
+        found = set(self.files.get(key, ()))
+        found.update(self._literals.get(key, ()))
+        for prefix, paths in self._prefixes.items():
+            if key.startswith(prefix):
+                found.update(paths)
+        return found
+
+    def keys(self, status):
+        return [key for key, s in self.status.items() if s == status]
+
+    def counts(self):
+        counts = {USED: 0, DYNAMIC: 0, INDIRECT: 0, DEAD: 0}
+        for s in self.status.values():
+            counts[s] += 1
+        return counts
+
+
+def classify(keys, scans, declared=()):
+    """
+    Classify catalog ``keys`` against per-file scan results.
+
+    Keys listed in ``declared`` (the app's ``new_keys.json``) are never
+    reported dead: the next sync would only add them back.
+    """
+    calls, prefixes, literals = {}, set(), set()
+    for path, entry in scans.items():
+        for key in entry['calls']:
+            calls.setdefault(key, []).append(path)
+        prefixes.update(entry['prefixes'])
+        literals.update(entry['literals'])
+    prefixes = tuple(sorted(prefixes))
+    declared = set(declared)
+
+    status = {}
+    for key in keys:
+        if key in calls:
+            status[key] = USED
+        elif prefixes and key.startswith(prefixes):
+            status[key] = DYNAMIC
+        elif key in literals or key in declared:
+            status[key] = INDIRECT
+        else:
+            status[key] = DEAD
+    key_set = set(keys)
+    missing = sorted(key for key in calls if key not in key_set and key.strip())
+    return status, missing, calls
+
+
+def build_usage(apps, cache=None, jobs=None):
+    """Return an ``AppUsage`` per app; ``cache`` is updated but not saved."""
+    cache = cache if cache is not None else UsageCache(os.devnull)
+    results = []
+    for app in apps:
+        scans = cache.scan(app.source_files(), jobs=jobs)
+        keys = set()
+        for lang in app.languages:
+            keys.update(load_catalog(app.catalog_path(lang)).data)
+        status, missing, calls = classify(sorted(keys), scans, load_new_keys(app.new_keys_path))
+        results.append(AppUsage(app, status, missing, {k: v for k, v in calls.items() if k in status}, scans))
+    return results
+
+
+def prune(usage, dry_run=False):
+    """
+    Drop the keys nothing references from every language of ``usage.app``.
+
+    Returns the list of removed keys.
+    """
+    dead = set(usage.keys(DEAD))
+    if not dead:
+        return []
+    app = usage.app
+    for lang in app.languages:
+        catalog = load_catalog(app.catalog_path(lang))
+        if not catalog.exists:
+            continue
+        kept = {key: value for key, value in catalog.data.items() if key not in dead}
+        if len(kept) != len(catalog.data) and not dry_run:
+            write_catalog(catalog.path, dump_catalog(kept, catalog.indent).encode('utf-8'))
+    return sorted(dead)
@@ -0,0 +1,229 @@
+"""
+Single-pass validation of every catalog and ``new_keys.json``.
+
+Each file is read and parsed once; the same pass reports
+
+* ``duplicate_key``: a key defined twice in one file (``json`` keeps the
+  last one without a word),
+* ``placeholder_mismatch``: ``{{placeholder}}`` sets that differ between
+  the languages of a key,
+* ``untranslated``: a value that reads as another language, e.g. Spanish
+  text still in Portuguese.
+"""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+from .apps import SOURCE_LANGUAGE
+from .catalog import CatalogError, parse_catalog, read_bytes
+from .engine import default_jobs
+
+ERROR = 'error'
+WARNING = 'warning'
+
+PLACEHOLDER = re.compile(r'{{\s*([\w.-]+)\s*(?:,[^}]*)?}}')
+KEY_LINE = re.compile(r'^(\s*)"((?:[^"\\]|\\.)*)"\s*:', re.M)
+WORD = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?")
+FRENCH_ELISION = re.compile(r"\b[ldnjcsqm]'", re.I)
+
+# Function words that only one of our languages uses, plus characters and
+# word endings typical of it. Good enough to spot a sentence left in the
+# wrong language; short labels ("Total", "Cancelar") never score.
+_STOPWORDS = {
+    'pt': {'o', 'os', 'as', 'do', 'da', 'dos', 'das', 'em', 'no', 'na', 'nos', 'nas', 'um', 'uma',
+           'não', 'ao', 'seu', 'sua', 'é', 'você', 'pelo', 'pela'},
+    'es': {'el', 'los', 'las', 'del', 'y', 'su', 'sus', 'es', 'más', 'usted', 'al'},
+    'fr': {'le', 'les', 'du', 'des', 'et', 'au', 'aux', 'sur', 'votre', 'vos', 'est', 'pas', 'une', 'à'},
+    'en': {'the', 'of', 'to', 'and', 'for', 'with', 'by', 'your', 'is', 'on', 'an', 'at', 'from', 'this'},
+}
+_SUFFIXES = {
+    'pt': ('ção', 'ções', 'ões', 'ão'),
+    'es': ('ción', 'ciones'),
+    'fr': ('eux', 'ée', 'ées'),
+    'en': ('ing',),
+}
+_CHARS = {'pt': 'ãõ', 'es': 'ñ¿¡', 'fr': 'èùœûëï', 'en': ''}
+_UNIQUE_STOPWORDS = {
+    lang: words - set().union(*(other for o, other in _STOPWORDS.items() if o != lang))
+    for lang, words in _STOPWORDS.items()
+}
+MIN_SCORE = 2
+
+
+@dataclass
+class Issue:
+    app: str
+    path: str
+    lang: str
+    key: str
+    kind: str
+    severity: str
+    message: str
+    line: int = 0
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def language_scores(text):
+    """How strongly ``text`` looks like each supported language."""
+    lowered = text.lower()
+    words = [w.lower() for w in WORD.findall(PLACEHOLDER.sub(' ', text))]
+    scores = {}
+    for lang, stopwords in _UNIQUE_STOPWORDS.items():
+        score = sum(1 for w in words if w in stopwords)
+        score += sum(1 for w in words if w.endswith(_SUFFIXES[lang]))
+        score += sum(1 for ch in lowered if ch in _CHARS[lang])
+        scores[lang] = score
+    scores['fr'] += len(FRENCH_ELISION.findall(lowered))
+    return scores
+
+
+def guess_other_language(text, lang):
+    """Return the language ``text`` is clearly written in, if it is not ``lang``."""
+    if lang not in _UNIQUE_STOPWORDS:
+        return None
+    scores = language_scores(text)
+    best = max(scores, key=scores.get)
+    if best != lang and scores[best] >= MIN_SCORE and scores[best] - scores[lang] >= MIN_SCORE:
+        return best
+    return None
+
+
+def placeholders(value):
+    return frozenset(PLACEHOLDER.findall(value)) if isinstance(value, str) else frozenset()
+
+
+def _key_lines(text):
+    """Line numbers of every top-level key in a JSON file (keys repeat for duplicates)."""
+    found = [(len(m.group(1)), m.group(2), m.start()) for m in KEY_LINE.finditer(text)]
+    if not found:
+        return {}
+    top = min(indent for indent, _, _ in found)
+    lines = {}
+    line_no, pos = 1, 0
+    for indent, key, start in found:
+        line_no += text.count('\n', pos, start)
+        pos = start
+        if indent == top:
+            lines.setdefault(json.loads(f'"{key}"'), []).append(line_no)
+    return lines
+
+
+class _Lines:
+    """Lazily computed key → line numbers for one file."""
+
+    def __init__(self, text):
+        self.text = text
+        self._lines = None
+
+    def all(self, key):
+        if self._lines is None:
+            self._lines = _key_lines(self.text)
+        return self._lines.get(key, [])
+
+    def of(self, key):
+        found = self.all(key)
+        return found[-1] if found else 0
+
+
+def _check_key(issues, app, key, values, paths, lines):
+    """Placeholder and language checks for one key across languages ({lang: value})."""
+    present = {lang: v for lang, v in values.items() if isinstance(v, str) and v != ''}
+    sets = {lang: placeholders(v) for lang, v in present.items()}
+    if sets and len(set(sets.values())) > 1:
+        if SOURCE_LANGUAGE in sets:
+            reference = sets[SOURCE_LANGUAGE]
+        else:
+            reference = max(set(sets.values()), key=list(sets.values()).count)
+        for lang, found in sets.items():
+            if found != reference:
+                issues.append(Issue(
+                    app, paths[lang], lang, key, 'placeholder_mismatch', ERROR,
+                    f"placeholders {sorted(found)} differ from {sorted(reference)}",
+                    lines[lang].of(key),
+                ))
+    for lang, value in present.items():
+        other = guess_other_language(value, lang)
+        if other:
+            issues.append(Issue(
+                app, paths[lang], lang, key, 'untranslated', WARNING,
+                f'value looks like {other}: {value[:60]!r}', lines[lang].of(key),
+            ))
+
+
+def _duplicates(issues, app, lang, catalog, lines):
+    for key in dict.fromkeys(catalog.duplicates):
+        found = lines.all(key)
+        where = f" on lines {', '.join(map(str, found))}" if found else ''
+        issues.append(Issue(
+            app, catalog.path, lang, key, 'duplicate_key', ERROR,
+            f'defined more than once{where}; only the last value is kept', lines.of(key),
+        ))
+
+
+def _read_and_parse(path):
+    try:
+        return parse_catalog(path, read_bytes(path))
+    except (CatalogError, UnicodeDecodeError) as e:
+        return e
+
+
+def validate(apps, jobs=None):
+    """Validate every catalog and key-definition file of ``apps``; return a list of ``Issue``."""
+    with ThreadPoolExecutor(max_workers=jobs or default_jobs()) as pool:
+        loads = {
+            (app.name, lang): pool.submit(_read_and_parse, app.catalog_path(lang))
+            for app in apps for lang in app.languages
+        }
+        key_loads = {app.name: pool.submit(_read_and_parse, app.new_keys_path) for app in apps}
+
+        issues = []
+        for app in apps:
+            catalogs = {}
+            for lang in app.languages:
+                loaded = loads[(app.name, lang)].result()
+                if isinstance(loaded, Exception):
+                    issues.append(Issue(app.name, app.catalog_path(lang), lang, '', 'invalid_json', ERROR, str(loaded)))
+                elif loaded.exists:
+                    catalogs[lang] = loaded
+            lines = {lang: _Lines(c.text) for lang, c in catalogs.items()}
+            for lang, catalog in catalogs.items():
+                _duplicates(issues, app.name, lang, catalog, lines[lang])
+
+            paths = {lang: c.path for lang, c in catalogs.items()}
+            keys = dict.fromkeys(k for c in catalogs.values() for k in c.data)
+            for key in keys:
+                values = {lang: c.data.get(key) for lang, c in catalogs.items()}
+                _check_key(issues, app.name, key, values, paths, lines)
+
+            definitions = key_loads[app.name].result()
+            if isinstance(definitions, Exception):
+                issues.append(Issue(app.name, app.new_keys_path, '', '', 'invalid_json', ERROR, str(definitions)))
+                continue
+            if not definitions.exists:
+                continue
+            def_lines = _Lines(definitions.text)
+            _duplicates(issues, app.name, '', definitions, def_lines)
+            for key, translations in definitions.data.items():
+                if isinstance(translations, dict):
+                    per_lang = {lang: def_lines for lang in translations}
+                    per_path = {lang: definitions.path for lang in translations}
+                    _check_key(issues, app.name, key, translations, per_path, per_lang)
+    return issues
+
+
+def format_text(issues):
+    return '\n'.join(
+        f'{issue.path}:{issue.line}: {issue.severity}: [{issue.kind}] {issue.key}: {issue.message}'
+        for issue in issues
+    )
+
+
+def format_json(issues):
+    summary = {}
+    for issue in issues:
+        summary[issue.kind] = summary.get(issue.kind, 0) + 1
+    return json.dumps({'issues': [i.as_dict() for i in issues], 'summary': summary}, ensure_ascii=False, indent=2)
@@ -0,0 +1,189 @@
+"""
+Long-running watch mode: resync catalogs as soon as they are edited.
+
+On Linux the locale folders and app folders are watched through inotify
+(via ctypes, no extra dependency). Elsewhere, or with ``poll=True``, the
+watched files are polled by mtime. Bursts of saves are batched into one
+incremental resync of only the affected apps.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+from .apps import CATALOG_NAME, NEW_KEYS_NAME
+from .engine import sync
+from .shared import SHARED_KEYS_NAME
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT = struct.Struct('iIII')
+
+WATCHED_NAMES = {CATALOG_NAME, NEW_KEYS_NAME, SHARED_KEYS_NAME}
+
+
+def watched_files(apps):
+    """Map every input file of ``apps`` to the app it belongs to."""
+    files = {}
+    for app in apps:
+        files[app.new_keys_path] = app
+        for lang in app.languages:
+            files[app.catalog_path(lang)] = app
+    return files
+
+
+class InotifyWatcher:
+    """Directory watches on the folders holding the watched files."""
+
+    def __init__(self, paths):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs = {}
+        for directory in sorted({os.path.dirname(p) for p in paths}):
+            os.makedirs(directory, exist_ok=True)
+            wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+            self.dirs[wd] = directory
+
+    def wait(self, timeout=None):
+        """Block up to ``timeout`` seconds; return the set of touched paths."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(buf):
+            wd, _mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+            offset += _EVENT.size
+            name = buf[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += length
+            if wd in self.dirs and name in WATCHED_NAMES:
+                changed.add(os.path.join(self.dirs[wd], name))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable fallback comparing mtimes and sizes at a fixed interval."""
+
+    def __init__(self, paths, interval=0.5):
+        self.paths = list(paths)
+        self.interval = interval
+        self.stats = {p: self._stat(p) for p in self.paths}
+
+    @staticmethod
+    def _stat(path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path in self.paths:
+                current = self._stat(path)
+                if current != self.stats[path]:
+                    self.stats[path] = current
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return changed
+            remaining = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(remaining)
+
+    def close(self):
+        pass
+
+
+def make_watcher(paths, poll=False):
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(paths)
+
+
+def _print_error(error):
+    print(f'Error: {error} (waiting for the next save)', file=sys.stderr, flush=True)
+
+
+def watch(apps, manifest, debounce=0.3, jobs=None, poll=False, on_result=print, stop=None, shared=None,
+          on_error=_print_error):
+    """
+    Resync ``apps`` whenever one of their inputs changes, until interrupted.
+
+    Events are collected until the watched files have been quiet for
+    ``debounce`` seconds, then only the affected apps are synced
+    incrementally (the manifest narrows the work down to changed languages).
+    ``shared`` is ``(path, load)``: the shared catalog and a callable
+    returning fresh slices for every app, called whenever it changes.
+    ``stop`` is an optional callable checked between batches. A batch with
+    an invalid catalog (typically saved halfway) is passed to ``on_error``
+    and writes nothing; the next save retries it.
+    """
+    files = watched_files(apps)
+    shared_path, load_slices = shared or (None, None)
+    slices = load_slices() if load_slices else None
+    if shared_path:
+        files[shared_path] = None
+    watcher = make_watcher(files, poll=poll)
+    try:
+        while stop is None or not stop():
+            changed = watcher.wait(timeout=1.0)
+            if not changed:
+                continue
+            while True:
+                more = watcher.wait(timeout=debounce)
+                if not more:
+                    break
+                changed |= more
+
+            try:
+                if shared_path in changed:
+                    # Only the apps whose slice changed get past the manifest.
+                    slices = load_slices()
+                    affected = {app.name for app in apps}
+                else:
+                    affected = {files[p].name for p in changed if p in files}
+                batch = [app for app in apps if app.name in affected]
+                if not batch:
+                    continue
+                results = sync(batch, jobs=jobs, manifest=manifest, shared=slices)
+            except ValueError as e:  # CatalogError included
+                # sync writes nothing (files or manifest) unless every catalog of the batch parsed.
+                on_error(e)
+                continue
+            for result in results:
+                if not result.skipped and result.written:
+                    on_result(result)
+            manifest.save()
+    finally:
+        watcher.close()
@@ -0,0 +1,17 @@
+"""
+Opt-in profiling shared by the Python tooling (``i18n_sync`` and
+``docgen``): per-phase wall time, bytes read and written and memory peaks
+as a JSON report, plus an optional ``cProfile`` dump. Both tools take
+``--profile [REPORT]`` and ``--cprofile FILE``.
+"""
+
+from .phases import Profile, active, count_read, count_written, phase, profiling
+
+__all__ = [
+    'Profile',
+    'active',
+    'count_read',
+    'count_written',
+    'phase',
+    'profiling',
+]
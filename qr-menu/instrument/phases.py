@@ -0,0 +1,183 @@
+"""
+Phase timing, byte counts and memory peaks for the Python tooling.
+
+The tools mark their phases (``with phase('load'):``) and count the bytes
+their I/O helpers read and write (``count_read``, ``count_written``).
+Nothing is recorded unless a run is wrapped in ``profiling``, so outside
+of ``--profile`` a phase costs one global lookup.
+
+Inside ``profiling`` every phase accumulates its wall time, number of
+entries, bytes read and written (counted against the innermost phase open
+when the I/O happens, from any thread) and its ``tracemalloc`` peak above
+the memory traced when it started. The run ends with a JSON report and,
+if asked for, a ``cProfile`` dump for ``python -m pstats`` or snakeviz.
+``tracemalloc`` slows allocation-heavy code down noticeably, so compare
+timings of profiled runs with each other rather than with plain runs.
+"""
+
+import cProfile
+import datetime
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+REPORT_VERSION = 1
+# Counts made while no phase is open.
+OUTSIDE = '(outside phases)'
+
+_active = None
+
+
+class _Phase:
+    __slots__ = ('calls', 'seconds', 'peak_bytes', 'bytes_read', 'bytes_written')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.peak_bytes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def as_dict(self):
+        return {name: round(getattr(self, name), 6) if name == 'seconds' else getattr(self, name)
+                for name in self.__slots__}
+
+
+class Profile:
+    """Measurements of one run, by phase."""
+
+    def __init__(self, tool):
+        self.tool = tool
+        self.phases = {}
+        self._stack = []  # [name, memory traced at entry, peak seen so far]
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.started_at = datetime.datetime.now().astimezone()
+        self.seconds = None
+        self.peak_bytes = 0
+
+    def _phase(self, name):
+        found = self.phases.get(name)
+        if found is None:
+            found = self.phases[name] = _Phase()
+        return found
+
+    @contextmanager
+    def phase(self, name):
+        if self._stack:
+            # Resetting the peak for this phase must not lose the enclosing phase's.
+            self._stack[-1][2] = max(self._stack[-1][2], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        frame = [name, tracemalloc.get_traced_memory()[0], 0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            frame[2] = max(frame[2], tracemalloc.get_traced_memory()[1])
+            self.peak_bytes = max(self.peak_bytes, frame[2])
+            if self._stack:
+                self._stack[-1][2] = max(self._stack[-1][2], frame[2])
+            entry = self._phase(name)
+            entry.calls += 1
+            entry.seconds += elapsed
+            entry.peak_bytes = max(entry.peak_bytes, frame[2] - frame[1])
+
+    def count(self, field, nbytes):
+        with self._lock:
+            entry = self._phase(self._stack[-1][0] if self._stack else OUTSIDE)
+            setattr(entry, field, getattr(entry, field) + nbytes)
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self._started
+        self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+
+    def report(self):
+        phases = {name: entry.as_dict() for name, entry in self.phases.items()}
+        return {
+            'version': REPORT_VERSION,
+            'tool': self.tool,
+            'argv': sys.argv,
+            'python': platform.python_version(),
+            'machine': f'{platform.system()} {platform.machine()}',
+            'started': self.started_at.isoformat(timespec='seconds'),
+            'seconds': round(self.seconds, 6) if self.seconds is not None else None,
+            'peak_bytes': self.peak_bytes,
+            'bytes_read': sum(entry['bytes_read'] for entry in phases.values()),
+            'bytes_written': sum(entry['bytes_written'] for entry in phases.values()),
+            'phases': phases,
+        }
+
+
+def phase(name):
+    """Context manager timing phase ``name`` of the profiled run, if there is one."""
+    return _active.phase(name) if _active is not None else nullcontext()
+
+
+def count_read(nbytes):
+    if _active is not None and nbytes:
+        _active.count('bytes_read', nbytes)
+
+
+def count_written(nbytes):
+    if _active is not None and nbytes:
+        _active.count('bytes_written', nbytes)
+
+
+def active():
+    """Whether a profiled run is in progress (tools then avoid process pools, whose work it cannot see)."""
+    return _active is not None
+
+
+@contextmanager
+def profiling(tool, report=None, cprofile=None):
+    """
+    Profile the run inside the block when ``report`` or ``cprofile`` is set.
+
+    The JSON report goes to the file ``report`` (stderr for ``'-'``, or
+    when only ``cprofile`` is given); ``cprofile`` is a path for the
+    ``cProfile`` statistics. Yields the ``Profile`` (None when off).
+    """
+    global _active
+    if report is None and cprofile is None:
+        yield None
+        return
+    if _active is not None:
+        raise RuntimeError('a profiled run is already in progress')
+    profile = Profile(tool)
+    profiler = cProfile.Profile() if cprofile else None
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    _active = profile
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield profile
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        profile.finish()
+        _active = None
+        if not tracing:
+            tracemalloc.stop()
+        data = profile.report()
+        if profiler is not None:
+            profiler.dump_stats(cprofile)
+            data['cprofile'] = os.path.abspath(cprofile)
+        text = json.dumps(data, indent=2)
+        if report in (None, '-'):
+            print(text, file=sys.stderr)
+        else:
+            directory = os.path.dirname(report)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(report, 'w', encoding='utf-8') as f:
+                f.write(text + '\n')
@@ -0,0 +1,24 @@
+"""
+Offline reports over the dashboard's exports.
+
+Run ``python -m reports --help`` from the ``qr-menu`` directory.
+"""
+
+from .activity import Rollup
+from .ledger import Ledger
+from .sessions import SessionIndex
+from .store import Store
+from .transactions import Chunk, Dictionary, ExportSource, Summary, read_exports, summarize
+
+__all__ = [
+    'Chunk',
+    'Dictionary',
+    'ExportSource',
+    'Ledger',
+    'Rollup',
+    'SessionIndex',
+    'Store',
+    'Summary',
+    'read_exports',
+    'summarize',
+]
@@ -0,0 +1,196 @@
+"""
+Precomputed activity rollups for the dashboard's ``activity_by_hour``,
+``peak_hours``, ``orders_by_shift`` and ``flow_distribution`` charts.
+
+Orders are binned by the hour they were placed in: one ``floordiv`` over
+the timestamp column gives every row's hour since the epoch, and a
+``Counter`` of ``(hour, amount)`` pairs gives each hour's order count and
+order value in one pass per chunk. A rollup keeps:
+
+* ``hours``: ``{hour: [orders, value]}`` for the last ``RECENT_DAYS`` days,
+* ``days``: ``{day: [orders, value]}`` for older days,
+* ``profiles``: for older months, ``{month: {weekday * 24 + hour: [orders,
+  value]}}``, which is all the hour-of-day and weekday charts need.
+
+Hours that leave the recent window are folded into ``days`` and
+``profiles``, so a rollup stays a few kilobytes however long the history.
+For older data, hour-of-day figures resolve to whole months.
+
+Rollups are built from the transaction store (``reports.store``). Rows are
+only ever appended to it, so a rollup remembers how many rows it has seen
+and only bins the rows ingested since; it is built again only when an
+ingest changed the time or amount of an order already binned. Order value counts every exported
+order, whatever its payment status.
+"""
+
+import datetime
+import json
+import os
+from collections import Counter
+from itertools import repeat
+from operator import floordiv
+
+from filecache import write_json
+
+from .store import CACHE_DIR
+from .transactions import day_label, day_number
+
+DEFAULT_ROLLUPS = os.path.join(CACHE_DIR, 'activity')
+ROLLUP_VERSION = 1
+RECENT_DAYS = 31
+HOUR = 3600
+# The dashboard's shifts (analyticsController.js): 06-12h, 12-18h, then 18-06h.
+SHIFTS = (('morning', range(6, 12)), ('afternoon', range(12, 18)), ('night', (*range(18, 24), *range(0, 6))))
+# 1970-01-01 was a Thursday; weekdays count from Monday.
+_WEEKDAY_OFFSET = 3
+
+
+def _month(day):
+    date = datetime.date.fromisoformat(day_label(day))
+    return date.year * 12 + date.month - 1
+
+
+def _bump(table, key, orders, value):
+    found = table.get(key)
+    if found is None:
+        table[key] = [orders, value]
+    else:
+        found[0] += orders
+        found[1] += value
+
+
+def bin_hours(chunks):
+    """``{hour since the epoch: [orders, value]}`` of every row of ``chunks``."""
+    hours = {}
+    for chunk in chunks:
+        pairs = Counter(zip(map(floordiv, chunk.timestamps, repeat(HOUR)), chunk.amounts))
+        for (hour, amount), count in pairs.items():
+            _bump(hours, hour, count, amount * count)
+    return hours
+
+
+class Rollup:
+    """Hourly, daily and monthly profile bins of one restaurant's orders."""
+
+    def __init__(self, path, recent_days=RECENT_DAYS):
+        self.path = path
+        self.recent_days = recent_days
+        self.rows = 0
+        self.first_id = None
+        self.revised = 0
+        self.hours = {}
+        self.days = {}
+        self.profiles = {}
+
+    @classmethod
+    def load(cls, path, recent_days=RECENT_DAYS):
+        rollup = cls(path, recent_days)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return rollup
+        if data.get('version') != ROLLUP_VERSION:
+            return rollup
+        rollup.rows = data['rows']
+        rollup.first_id = data['first_id']
+        rollup.revised = data['revised']
+        rollup.hours = {int(hour): bins for hour, bins in data['hours'].items()}
+        rollup.days = {int(day): bins for day, bins in data['days'].items()}
+        rollup.profiles = {int(month): {int(slot): bins for slot, bins in profile.items()}
+                           for month, profile in data['profiles'].items()}
+        # A narrower window than the saved one takes effect on the next compaction.
+        rollup.compact()
+        return rollup
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            'version': ROLLUP_VERSION,
+            'rows': self.rows,
+            'first_id': self.first_id,
+            'revised': self.revised,
+            'hours': self.hours,
+            'days': self.days,
+            'profiles': self.profiles,
+        }
+        write_json(self.path, data, separators=(',', ':'))
+
+    def update(self, store):
+        """Bin the rows ingested into ``store`` since the last update; returns how many."""
+        first_id = store.column('order_ids')[0] if store.rows else None
+        if store.rows < self.rows or first_id != self.first_id or store.revised != self.revised:
+            # Another store, or binned rows since moved or changed value: start over.
+            self.__init__(self.path, self.recent_days)
+            self.first_id, self.revised = first_id, store.revised
+        start = self.rows
+        for hour, (orders, value) in bin_hours(store.chunks(first=start)).items():
+            _bump(self.hours, hour, orders, value)
+        self.rows = store.rows
+        self.compact()
+        return self.rows - start
+
+    def compact(self):
+        """Fold the hours older than the recent window into ``days`` and ``profiles``."""
+        if not self.hours:
+            return
+        cutoff = (max(self.hours) // 24 - self.recent_days + 1) * 24
+        for hour in [hour for hour in self.hours if hour < cutoff]:
+            orders, value = self.hours.pop(hour)
+            day = hour // 24
+            _bump(self.days, day, orders, value)
+            slot = (day + _WEEKDAY_OFFSET) % 7 * 24 + hour % 24
+            _bump(self.profiles.setdefault(_month(day), {}), slot, orders, value)
+
+    def _slots(self, since, until):
+        """``{weekday * 24 + hour: [orders, value]}`` for the period (dates, ``until`` exclusive)."""
+        lower = None if since is None else day_number(since)
+        upper = None if until is None else day_number(until)
+        slots = {}
+        for hour, (orders, value) in self.hours.items():
+            day = hour // 24
+            if (lower is None or day >= lower) and (upper is None or day < upper):
+                _bump(slots, (day + _WEEKDAY_OFFSET) % 7 * 24 + hour % 24, orders, value)
+        first = None if lower is None else _month(lower)
+        last = None if upper is None else _month(upper - 1)
+        for month, profile in self.profiles.items():
+            if (first is None or month >= first) and (last is None or month <= last):
+                for slot, (orders, value) in profile.items():
+                    _bump(slots, slot, orders, value)
+        return slots
+
+    def by_weekday_hour(self, since=None, until=None):
+        """7 x 24 ``[orders, value]`` grid, Monday first (the flow distribution)."""
+        slots = self._slots(since, until)
+        return [[list(slots.get(weekday * 24 + hour, (0, 0))) for hour in range(24)] for weekday in range(7)]
+
+    def by_hour(self, since=None, until=None):
+        """24 ``[orders, value]`` bins by hour of day."""
+        grid = self.by_weekday_hour(since, until)
+        return [[sum(grid[weekday][hour][i] for weekday in range(7)) for i in (0, 1)] for hour in range(24)]
+
+    def by_shift(self, since=None, until=None):
+        hours = self.by_hour(since, until)
+        return {name: [sum(hours[hour][i] for hour in span) for i in (0, 1)] for name, span in SHIFTS}
+
+    def peak_hours(self, count=3, since=None, until=None):
+        """The ``count`` busiest hours of day as ``(hour, orders)``, busiest first."""
+        hours = self.by_hour(since, until)
+        ranked = sorted(range(24), key=lambda hour: (-hours[hour][0], hour))
+        return [(hour, hours[hour][0]) for hour in ranked[:count] if hours[hour][0]]
+
+    def by_day(self, since=None, until=None):
+        """``{day: [orders, value]}`` over the period, exact for every day."""
+        lower = None if since is None else day_number(since)
+        upper = None if until is None else day_number(until)
+        days = {day: list(bins) for day, bins in self.days.items()
+                if (lower is None or day >= lower) and (upper is None or day < upper)}
+        for hour, (orders, value) in self.hours.items():
+            day = hour // 24
+            if (lower is None or day >= lower) and (upper is None or day < upper):
+                _bump(days, day, orders, value)
+        return dict(sorted(days.items()))
+
+
+def rollup_path(restaurant, directory=DEFAULT_ROLLUPS):
+    return os.path.join(directory, f'{restaurant}.json')
@@ -0,0 +1,438 @@
+"""Command line entry point: ``python -m reports <command>``."""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+
+from .activity import DEFAULT_ROLLUPS, RECENT_DAYS
+from .ledger import DEFAULT_LEDGER
+from .sessions import DEFAULT_SESSIONS, UTC_OFFSET
+from .store import DEFAULT_STORE
+from .transactions import CHUNK_ROWS
+
+
+def _date(text):
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'not a yyyy-mm-dd date: {text!r}')
+
+
+def _moment(text):
+    from .transactions import parse_timestamp
+
+    try:
+        return parse_timestamp(text)
+    except (ValueError, IndexError):
+        raise argparse.ArgumentTypeError(f'not a yyyy-mm-dd[ HH:MM] time: {text!r}')
+
+
+def _period(text):
+    """``(since, until)`` of ``yyyy`` or ``yyyy-mm``."""
+    try:
+        if len(text) == 4:
+            year = int(text)
+            return datetime.date(year, 1, 1), datetime.date(year + 1, 1, 1)
+        year, month = map(int, text.split('-'))
+        start = datetime.date(year, month, 1)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'not a yyyy or yyyy-mm period: {text!r}')
+    return start, datetime.date(year + month // 12, month % 12 + 1, 1)
+
+
+def _money(centavos):
+    return f'{centavos / 100:,.2f}'
+
+
+def _table(title, rows, label=lambda key: ' / '.join(key)):
+    print(title)
+    width = max((len(label(key)) for key in rows), default=0)
+    for key, (count, amount) in rows.items():
+        print(f'  {label(key):<{width}}  {count:>9,}  {_money(amount):>16}')
+
+
+def _method_label(key):
+    from .transactions import METHOD_LABELS
+
+    return ' / '.join((METHOD_LABELS.get(key[0], key[0]),) + key[1:])
+
+
+def _summary_json(summary):
+    from .transactions import DAY, day_label
+
+    def cells(names):
+        return [{**dict(zip(names, key)), 'count': count, 'amount': amount / 100}
+                for key, (count, amount) in summary.totals(*names).items()]
+
+    out = {'rows': summary.rows, 'amount': summary.amount / 100}
+    for names in (('day',), ('method',), ('status',), ('method', 'status')):
+        out['by_' + '_'.join(names)] = cells(names)
+    out['pending'] = [{'order_id': p.order_id, 'date': day_label(p.timestamp // DAY),
+                       'customer': p.customer, 'amount': p.amount / 100, 'method': p.method, 'status': p.status}
+                      for p in summary.pending()]
+    return out
+
+
+def cmd_transactions(args):
+    from .transactions import CHASE_STATUSES, ExportSource, summarize
+
+    chase = tuple(args.chase or CHASE_STATUSES)
+    start = time.perf_counter()
+    if args.paths:
+        source = ExportSource(args.paths, chunk_rows=args.chunk_rows)
+    else:
+        source = _open_store(args.store)
+    summary = summarize(source, since=args.since, until=args.until, chase=chase)
+    elapsed = time.perf_counter() - start
+    _warn_rows(source)
+    if args.format == 'json':
+        print(json.dumps(_summary_json(summary), ensure_ascii=False, indent=2))
+    else:
+        _table('By day:', summary.totals('day'))
+        _table('By method:', summary.totals('method'), _method_label)
+        _table('By status:', summary.totals('status'))
+        _table('By method and status:', summary.totals('method', 'status'), _method_label)
+        print(f'Total: {summary.rows:,} transactions, {_money(summary.amount)}.')
+        total = summary.pending_count
+        shown = summary.pending(args.limit)
+        if total:
+            print(f"{total} orders to chase ({', '.join(chase)}):")
+        for p in shown:
+            when = datetime.datetime.fromtimestamp(p.timestamp, datetime.timezone.utc).strftime('%Y-%m-%d %H:%M')
+            print(f'  {p.order_id}  {when}  {p.customer}  {_money(p.amount)}  {p.method}')
+        if len(shown) < total:
+            print(f'  ... and {total - len(shown)} more (--limit).')
+    print(f'{summary.rows:,} rows aggregated in {elapsed:.2f} s.', file=sys.stderr)
+    return 0
+
+
+def _open_store(path):
+    from .store import Store
+
+    store = Store.open(path)
+    if not store.rows:
+        raise ValueError(f"nothing ingested in {os.path.relpath(path)} yet (run 'ingest' or pass export files)")
+    return store
+
+
+def _warn_rows(source):
+    for error in source.errors:
+        where = error.path if error.line is None else f'{error.path}:{error.line}'
+        print(f'  warning: {where}: {error.message}', file=sys.stderr)
+    if source.skipped:
+        print(f'{source.skipped} invalid rows skipped.', file=sys.stderr)
+
+
+def cmd_ingest(args):
+    from .store import Store
+
+    store = Store.open(args.store)
+    start = time.perf_counter()
+    results = store.ingest(args.paths, force=args.force, chunk_rows=args.chunk_rows)
+    elapsed = time.perf_counter() - start
+    _warn_rows(store)
+    for result in results:
+        if result.skipped:
+            print(f'{result.path}: already ingested.')
+        else:
+            print(f'{result.path}: {result.added:,} added, {result.updated:,} updated, '
+                  f'{result.unchanged:,} unchanged.')
+    print(f'{os.path.relpath(args.store)}: {store.rows:,} orders ({elapsed:.2f} s).')
+    return 0
+
+
+def _print_ledger(ledger, report, since, until):
+    from .ledger import account_name
+
+    if report in ('vat', 'all'):
+        vat = ledger.vat_clearance(since, until)
+        print('IVA Liquidado vs Dedutível (16%):')
+        print(f'  IVA Liquidado (4433)  {_money(vat.collected):>16}')
+        print(f'  IVA Dedutível (4432)  {_money(vat.deductible):>16}')
+        if vat.recoverable:
+            print(f'  IVA a Recuperar       {_money(vat.recoverable):>16}')
+        else:
+            print(f'  IVA a Pagar           {_money(vat.payable):>16}')
+    if report in ('trial', 'all'):
+        rows = ledger.trial_balance(since, until)
+        print('Balancete:')
+        print(f"  {'Conta':<6} {'':<36} {'Saldo inicial':>16} {'Débito':>16} {'Crédito':>16} {'Saldo final':>16}")
+        for row in rows:
+            print(f'  {row.code:<6} {row.name[:36]:<36} {_money(row.opening):>16} {_money(row.debit):>16} '
+                  f'{_money(row.credit):>16} {_money(row.closing):>16}')
+        debit, credit = sum(row.debit for row in rows), sum(row.credit for row in rows)
+        print(f"  {'Total':<43} {'':>16} {_money(debit):>16} {_money(credit):>16}"
+              + ('' if debit == credit else '  (not balanced!)'))
+    if report in ('income', 'all'):
+        statement = ledger.income_statement(since, until)
+        print('Demonstração de Resultados (antes do custo das vendas):')
+        for code, amount in list(statement.revenues.items()) + list(statement.expenses.items()):
+            print(f'  {code:<6} {account_name(code)[:36]:<36} {_money(amount):>16}')
+        print(f"  {'Rendimentos':<43} {_money(statement.total_revenue):>16}")
+        print(f"  {'Gastos':<43} {_money(statement.total_expenses):>16}")
+        print(f"  {'Resultado antes do custo das vendas':<43} {_money(statement.net_income):>16}")
+        print('  Compras de matérias-primas ficam em 26; o custo das vendas (61) não é lançado.')
+
+
+def _ledger_json(ledger, since, until):
+    vat = ledger.vat_clearance(since, until)
+    statement = ledger.income_statement(since, until)
+    return {
+        'period': {'since': since and since.isoformat(), 'until': until and until.isoformat()},
+        'vat_clearance': {'collected': vat.collected / 100, 'deductible': vat.deductible / 100,
+                          'payable': vat.payable / 100, 'recoverable': vat.recoverable / 100},
+        'trial_balance': [{'code': row.code, 'name': row.name, 'type': row.type, 'opening': row.opening / 100,
+                           'debit': row.debit / 100, 'credit': row.credit / 100, 'closing': row.closing / 100}
+                          for row in ledger.trial_balance(since, until)],
+        'income_statement': {'revenues': {code: amount / 100 for code, amount in statement.revenues.items()},
+                             'expenses': {code: amount / 100 for code, amount in statement.expenses.items()},
+                             'net_income': statement.net_income / 100,
+                             # Purchases go to inventory (26): no cost of sales is posted.
+                             'basis': 'before cost of sales'},
+    }
+
+
+def cmd_ledger(args):
+    from .ledger import Ledger, refresh
+    from .store import Store
+
+    since, until = args.period or (args.since, args.until)
+    ledger = Ledger.load(args.ledger)
+    for path in args.forget or ():
+        ledger.forget('purchases:' + os.path.abspath(path))
+    known = [name.split(':', 1)[1] for name in ledger.sources if name.startswith('purchases:')]
+    purchases = list(dict.fromkeys([os.path.abspath(path) for path in args.purchases or ()]
+                                   + [path for path in known if os.path.exists(path)]))
+    start = time.perf_counter()
+    store = Store.open(args.store)
+    posted = refresh(ledger, store if store.rows else None, purchases)
+    if posted or args.forget:
+        ledger.save()
+        print(f"posted {', '.join(os.path.relpath(name.split(':', 1)[-1]) if ':' in name else name for name in posted) or 'nothing'} "
+              f'in {time.perf_counter() - start:.2f} s.', file=sys.stderr)
+    if args.format == 'json':
+        print(json.dumps(_ledger_json(ledger, since, until), ensure_ascii=False, indent=2))
+    else:
+        _print_ledger(ledger, args.report, since, until)
+    return 0
+
+
+def _activity_json(rollup, since, until):
+    from .activity import SHIFTS
+    from .transactions import day_label
+
+    hours = rollup.by_hour(since, until)
+    shifts = rollup.by_shift(since, until)
+    # Shaped like the dashboard's analytics (peakHours, shifts) so it can be served as is.
+    return {
+        'period': {'since': since and since.isoformat(), 'until': until and until.isoformat()},
+        'peakHours': [{'hour': f'{hour}:00', 'orders': orders, 'revenue': value / 100}
+                      for hour, (orders, value) in enumerate(hours)],
+        'busiest': [{'hour': f'{hour}:00', 'orders': orders} for hour, orders in rollup.peak_hours(3, since, until)],
+        'shifts': [{'_id': name, 'orders': shifts[name][0], 'revenue': shifts[name][1] / 100} for name, _ in SHIFTS],
+        'flow': [[orders for orders, _ in day] for day in rollup.by_weekday_hour(since, until)],
+        'days': [{'date': day_label(day), 'orders': orders, 'revenue': value / 100}
+                 for day, (orders, value) in rollup.by_day(since, until).items()],
+    }
+
+
+def cmd_activity(args):
+    from .activity import Rollup, rollup_path
+    from .store import Store
+
+    since, until = args.period or (args.since, args.until)
+    rollup = Rollup.load(rollup_path(args.restaurant, args.rollups), args.recent_days)
+    start = time.perf_counter()
+    with Store.open(args.store) as store:
+        binned = rollup.update(store)
+    if binned:
+        rollup.save()
+        print(f'{binned:,} orders binned in {time.perf_counter() - start:.2f} s.', file=sys.stderr)
+    if args.format == 'json':
+        print(json.dumps(_activity_json(rollup, since, until), indent=2))
+        return 0
+    hours = rollup.by_hour(since, until)
+    top = max((orders for orders, _ in hours), default=0) or 1
+    print('Orders by hour:')
+    for hour, (orders, value) in enumerate(hours):
+        print(f'  {hour:02}:00  {orders:>9,}  {_money(value):>16}  {"#" * round(40 * orders / top)}'.rstrip())
+    print('Peak hours: ' + (', '.join(f'{hour:02}:00 ({orders:,})' for hour, orders
+                                      in rollup.peak_hours(3, since, until)) or 'none'))
+    _table('By shift:', {(name,): bins for name, bins in rollup.by_shift(since, until).items()})
+    print('Orders by weekday and hour:')
+    print('       ' + ''.join(f'{hour:>6}' for hour in range(24)))
+    for name, day in zip(('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'), rollup.by_weekday_hour(since, until)):
+        print(f'  {name}  ' + ''.join(f'{orders:>6}' for orders, _ in day))
+    return 0
+
+
+def _minutes(seconds):
+    return '-' if seconds is None else f'{seconds / 60:,.0f} min'
+
+
+def _when(seconds):
+    return datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc).strftime('%Y-%m-%d %H:%M')
+
+
+def _turnover(index, since, until):
+    """Per-table ``TableStats`` of the period, plus their sum as a last row."""
+    from .sessions import SHIFT_NAMES, TableStats
+    from .transactions import DAY, day_number
+
+    rows = index.stats(since and day_number(since) * DAY, until and day_number(until) * DAY)
+    total = TableStats('', 'All tables', sum(row.seats for row in rows),
+                       shifts={name: [0, 0] for name in SHIFT_NAMES})
+    for row in rows:
+        total.sessions += row.sessions
+        total.revenue += row.revenue
+        total.orders += row.orders
+        total.seat_seconds += row.seat_seconds
+        for name, (sessions, seconds) in row.shifts.items():
+            total.shifts[name][0] += sessions
+            total.shifts[name][1] += seconds
+    total.seconds = sum(seconds for _, seconds in total.shifts.values())
+    return rows, total
+
+
+def _turnover_json(index, rows, total, at):
+    from .sessions import SHIFT_NAMES
+
+    def stats(row):
+        return {
+            'table': row.label, 'seats': row.seats, 'sessions': row.sessions, 'orders': row.orders,
+            'revenue': row.revenue / 100, 'turnMinutes': row.turn_time and row.turn_time / 60,
+            'byShift': {name: {'sessions': row.shifts[name][0],
+                               'turnMinutes': row.shift_turn_time(name) and row.shift_turn_time(name) / 60}
+                        for name in SHIFT_NAMES},
+            'revenuePerSeatHour': row.revenue_per_seat_hour and row.revenue_per_seat_hour / 100,
+        }
+
+    out = {'asOf': index.as_of and _when(index.as_of), 'tables': [stats(row) for row in rows], 'total': stats(total)}
+    if at is not None:
+        out['occupied'] = {'at': _when(at), 'tables': [label for _, label, _ in index.occupied(at)]}
+    out['flags'] = [{'session': flag.session, 'table': flag.table, 'startedAt': _when(flag.started),
+                     'problem': flag.message} for flag in index.flags]
+    return out
+
+
+def cmd_turnover(args):
+    from .sessions import SHIFT_NAMES, SessionIndex, refresh
+
+    since, until = args.period or (args.since, args.until)
+    start = time.perf_counter()
+    index, rebuilt = refresh(SessionIndex.load(args.index), args.paths, args.tables, round(args.utc_offset * 3600))
+    if rebuilt:
+        _warn_rows(index)
+        index.save()
+        print(f'{len(index):,} sessions indexed in {time.perf_counter() - start:.2f} s.', file=sys.stderr)
+    if not index.tables:
+        raise ValueError(f'no sessions indexed in {os.path.relpath(args.index)} (pass TableSession exports)')
+    start = time.perf_counter()
+    rows, total = _turnover(index, since, until)
+    if args.format == 'json':
+        print(json.dumps(_turnover_json(index, rows, total, args.at), ensure_ascii=False, indent=2))
+    else:
+        labels = {table: label for table, label, *_ in index.tables}
+        if args.at is not None:
+            occupied = index.occupied(args.at)
+            print(f'Occupied at {_when(args.at)}: {len(occupied)} of {len(index.tables)} tables, '
+                  f'{sum(seats for *_, seats in occupied)} of {total.seats} seats'
+                  + (': ' + ', '.join(label for _, label, _ in occupied) if occupied else '.'))
+        width = max(len(row.label) for row in rows + [total])
+        print('Turnover (closed sessions):')
+        print(f"  {'Table':<{width}}  {'Seats':>5}  {'Sessions':>8}  {'Turn time':>10}  "
+              + ''.join(f'{name.capitalize():>10}  ' for name in SHIFT_NAMES)
+              + f"{'Revenue':>16}  {'Per seat-hour':>13}")
+        for row in rows + [total]:
+            per_seat_hour = row.revenue_per_seat_hour
+            print(f'  {row.label:<{width}}  {row.seats:>5}  {row.sessions:>8,}  {_minutes(row.turn_time):>10}  '
+                  + ''.join(f'{_minutes(row.shift_turn_time(name)):>10}  ' for name in SHIFT_NAMES)
+                  + f"{_money(row.revenue):>16}  {'-' if per_seat_hour is None else _money(per_seat_hour):>13}")
+        if index.flags:
+            print(f'{len(index.flags)} sessions to check:')
+        for flag in index.flags[:args.limit]:
+            print(f'  {flag.session}  table {labels.get(flag.table, flag.table)}  {_when(flag.started)}  {flag.message}')
+        if len(index.flags) > args.limit:
+            print(f'  ... and {len(index.flags) - args.limit} more (--limit).')
+    print(f'answered in {(time.perf_counter() - start) * 1000:.1f} ms.', file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m reports', description='Offline reports over dashboard exports.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('ingest', help='add exports to the columnar transaction store')
+    p.add_argument('paths', nargs='+', metavar='EXPORT', help='transaction exports (.csv, or .xls with xlrd)')
+    p.add_argument('--store', default=DEFAULT_STORE, help='store folder (default: %(default)s)')
+    p.add_argument('--force', action='store_true', help='read exports again even if already ingested')
+    p.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help='rows read per chunk (default: %(default)s)')
+    p.set_defaults(func=cmd_ingest)
+
+    p = commands.add_parser('transactions', help='totals by day, method and status, plus the orders to chase')
+    p.add_argument('paths', nargs='*', metavar='EXPORT',
+                   help='transaction exports of the Payments page (default: read the store)')
+    p.add_argument('--store', default=DEFAULT_STORE, help='store read without exports (default: %(default)s)')
+    p.add_argument('--since', type=_date, help='first day to include (yyyy-mm-dd)')
+    p.add_argument('--until', type=_date, help='first day to leave out (yyyy-mm-dd)')
+    p.add_argument('--chase', action='append', default=None, metavar='STATUS',
+                   help='status to list orders of (repeatable; default: pending)')
+    p.add_argument('--limit', type=int, default=50, help='orders to chase to print (default: %(default)s)')
+    p.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help='rows read per chunk (default: %(default)s)')
+    p.add_argument('--format', choices=('text', 'json'), default='text')
+    p.set_defaults(func=cmd_transactions)
+
+    p = commands.add_parser('ledger', help='VAT clearance, trial balance and income statement for a period')
+    p.add_argument('--period', type=_period, help='yyyy or yyyy-mm (default: everything)')
+    p.add_argument('--since', type=_date, help='first day to include (yyyy-mm-dd)')
+    p.add_argument('--until', type=_date, help='first day to leave out (yyyy-mm-dd)')
+    p.add_argument('--report', choices=('vat', 'trial', 'income', 'all'), default='all')
+    p.add_argument('--purchases', action='append', metavar='CSV',
+                   help='purchase export to post (repeatable; posted exports are remembered)')
+    p.add_argument('--forget', action='append', metavar='CSV', help='remove a posted purchase export')
+    p.add_argument('--store', default=DEFAULT_STORE, help='transaction store with the sales (default: %(default)s)')
+    p.add_argument('--ledger', default=DEFAULT_LEDGER, help='posted movements and running totals (default: %(default)s)')
+    p.add_argument('--format', choices=('text', 'json'), default='text')
+    p.set_defaults(func=cmd_ledger)
+
+    p = commands.add_parser('activity', help='orders by hour, shift and weekday from precomputed rollups')
+    p.add_argument('--restaurant', default='default',
+                   help='name of the rollup kept for the store, one per restaurant (default: %(default)s)')
+    p.add_argument('--period', type=_period, help='yyyy or yyyy-mm (default: everything)')
+    p.add_argument('--since', type=_date, help='first day to include (yyyy-mm-dd)')
+    p.add_argument('--until', type=_date, help='first day to leave out (yyyy-mm-dd)')
+    p.add_argument('--recent-days', type=int, default=RECENT_DAYS,
+                   help='days kept hour by hour; older ones by day and month (default: %(default)s)')
+    p.add_argument('--store', default=DEFAULT_STORE, help='transaction store to bin (default: %(default)s)')
+    p.add_argument('--rollups', default=DEFAULT_ROLLUPS, help='rollup folder (default: %(default)s)')
+    p.add_argument('--format', choices=('text', 'json'), default='text')
+    p.set_defaults(func=cmd_activity)
+
+    p = commands.add_parser('turnover', help='table occupancy, turn times and revenue per seat-hour')
+    p.add_argument('paths', nargs='*', metavar='EXPORT',
+                   help='mongoexport of tablesessions, JSON or CSV (default: the exports indexed last)')
+    p.add_argument('--tables', metavar='EXPORT', help='mongoexport of tables, for table numbers and seats')
+    p.add_argument('--at', type=_moment, help='list the tables occupied at this time (yyyy-mm-dd HH:MM)')
+    p.add_argument('--period', type=_period, help='yyyy or yyyy-mm of the sessions started (default: everything)')
+    p.add_argument('--since', type=_date, help='first day to include (yyyy-mm-dd)')
+    p.add_argument('--until', type=_date, help='first day to leave out (yyyy-mm-dd)')
+    p.add_argument('--utc-offset', type=float, default=UTC_OFFSET / 3600,
+                   help='hours from UTC of the restaurant clock (default: %(default)s, Africa/Maputo)')
+    p.add_argument('--limit', type=int, default=50, help='sessions to check to print (default: %(default)s)')
+    p.add_argument('--index', default=DEFAULT_SESSIONS, help='session index folder (default: %(default)s)')
+    p.add_argument('--format', choices=('text', 'json'), default='text')
+    p.set_defaults(func=cmd_turnover)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError) as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
@@ -0,0 +1,422 @@
+"""
+Double-entry ledger posted from the exports: VAT clearance, trial balance
+and income statement for any period.
+
+Entries follow the API's automatic postings (``accountingService.js``) on
+the PGC-NIRF chart, with IVA at 16% included in every amount:
+
+* a sale paid by cash, card or mobile wallet debits 111, 121 or 131; a
+  pending one debits 411 (Clientes c/c); failed or cancelled orders are
+  not posted. Both credit 711 with the net amount and 4433 (IVA
+  Liquidado) with the tax;
+* a purchase debits 26 (Matérias-Primas), or the export's ``Account``
+  column when set (e.g. 63 for services), with the net amount and 4432
+  (IVA Dedutível) with the tax. It credits 421 (Fornecedores) when there
+  is a supplier or the method is ``credit``, otherwise 131, 121 or 111.
+
+Nothing is posted to 61 (cost of sales) since consumption of stock is not
+exported, so the income statement is before cost of sales.
+
+Sales are read from the transaction store (``reports.store``) so every
+order is posted once, purchases from CSV exports with a ``Date,
+Description,Supplier,Amount,Method,VAT Included[,Account]`` header. Sales
+are posted in streaming batches: each chunk is folded into
+``(day, account) -> [debit, credit]`` movements through a ``Counter`` of
+``(day, account, amount)`` triples, and each distinct amount is split into
+net and tax once.
+
+``.reports-cache/ledger.json`` keeps the daily movements of every source,
+their sum and the running totals at the end of every month. Balances
+through any day are the running total at the end of the previous month
+plus that month's days, so querying a period reads at most two months of
+days whatever the length of the history. A source is posted again only
+when its content changed; for the store, only the rows ingested since are
+posted, unless an ingest updated rows already posted.
+"""
+
+import csv
+import datetime
+import json
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import repeat
+from operator import floordiv
+
+from filecache import write_json
+
+from .store import CACHE_DIR, _file_hash
+from .transactions import DAY, day_label, day_number, parse_amount, parse_timestamp
+
+DEFAULT_LEDGER = os.path.join(CACHE_DIR, 'ledger.json')
+LEDGER_VERSION = 1
+# IVA 16% (Lei 32/2007), included in every exported amount.
+VAT_PERCENT = 16
+PURCHASE_HEADER = ('Date', 'Description', 'Supplier', 'Amount', 'Method', 'VAT Included')
+
+# The accounts the postings use: code -> (name, type, nature).
+CHART = {
+    '111': ('Caixa Geral', 'asset', 'debit'),
+    '121': ('Depósitos à ordem', 'asset', 'debit'),
+    '131': ('Carteiras Móveis (M-Pesa / e-Mola)', 'asset', 'debit'),
+    '26': ('Matérias-Primas', 'asset', 'debit'),
+    '411': ('Clientes c/c', 'asset', 'debit'),
+    '421': ('Fornecedores c/c', 'liability', 'credit'),
+    '4432': ('IVA Dedutível', 'asset', 'debit'),
+    '4433': ('IVA Liquidado', 'liability', 'credit'),
+    '63': ('Fornecimentos e Serviços de Terceiros', 'expense', 'debit'),
+    '711': ('Venda de Refeições / Restaurante', 'revenue', 'credit'),
+}
+# Type of an account outside CHART, from its PGC class (first digit).
+CLASS_TYPES = {'1': 'asset', '2': 'asset', '3': 'asset', '4': 'liability', '5': 'equity', '6': 'expense',
+               '7': 'revenue', '8': 'equity'}
+
+SALES = '711'
+VAT_COLLECTED = '4433'
+VAT_DEDUCTIBLE = '4432'
+RECEIVABLE = '411'
+INVENTORY = '26'
+SUPPLIERS = '421'
+CASH = '111'
+PAID = ('paid', 'completed')
+RECEIVABLE_STATUSES = ('pending', 'processing')
+METHOD_ACCOUNTS = {
+    'cash': '111',
+    'mpesa': '131', 'm-pesa': '131', 'emola': '131', 'e-mola': '131',
+    'visa': '121', 'pos': '121', 'transfer': '121', 'bank': '121', 'bim': '121', 'bci': '121',
+}
+
+
+def split_vat(gross):
+    """``(net, vat)`` centavos of a VAT-inclusive amount."""
+    net = round(gross * 100 / (100 + VAT_PERCENT))
+    return net, gross - net
+
+
+def account_name(code):
+    return CHART[code][0] if code in CHART else ''
+
+
+def account_type(code):
+    return CHART[code][1] if code in CHART else CLASS_TYPES.get(code[:1], 'asset')
+
+
+def _month(day):
+    date = datetime.date.fromisoformat(day_label(day))
+    return date.year * 12 + date.month - 1
+
+
+def _month_start(month):
+    return day_number(datetime.date(month // 12, month % 12 + 1, 1))
+
+
+def _month_label(month):
+    return f'{month // 12:04d}-{month % 12 + 1:02d}'
+
+
+def _add(movements, day, account, debit, credit):
+    accounts = movements.get(day)
+    if accounts is None:
+        accounts = movements[day] = {}
+    found = accounts.get(account)
+    if found is None:
+        accounts[account] = [debit, credit]
+    else:
+        found[0] += debit
+        found[1] += credit
+
+
+def _sum_into(total, accounts, sign=1):
+    for account, (debit, credit) in accounts.items():
+        found = total.get(account)
+        if found is None:
+            total[account] = [sign * debit, sign * credit]
+        else:
+            found[0] += sign * debit
+            found[1] += sign * credit
+
+
+def post_sales(source, first=0):
+    """
+    Daily movements ``{day: {account: [debit, credit]}}`` of the sales in
+    ``source``; from row ``first`` on for a ``Store``.
+    """
+    statuses = source.dictionaries.statuses
+    methods = source.dictionaries.methods
+    movements = {}
+    splits = {}
+    for chunk in (source.chunks(first=first) if first else source):
+        # Debit account of every (method, status) pair seen, by packed code.
+        debits = {}
+        for status, code in ((status, statuses.find(status)) for status in PAID + RECEIVABLE_STATUSES):
+            if code is None:
+                continue
+            for method, method_code in methods.codes.items():
+                debits[(method_code << 16) | code] = (
+                    METHOD_ACCOUNTS.get(method, CASH) if status in PAID else RECEIVABLE)
+        packed = map(int.__or__, map(int.__lshift__, chunk.methods, repeat(16)), chunk.statuses)
+        days = map(floordiv, chunk.timestamps, repeat(DAY))
+        for (day, account, amount), count in Counter(zip(days, map(debits.get, packed), chunk.amounts)).items():
+            if account is None:
+                continue  # failed, cancelled...
+            split = splits.get(amount)
+            if split is None:
+                split = splits[amount] = split_vat(amount)
+            net, vat = split
+            _add(movements, day, account, amount * count, 0)
+            _add(movements, day, SALES, 0, net * count)
+            if vat:
+                _add(movements, day, VAT_COLLECTED, 0, vat * count)
+    return movements
+
+
+def _yes(text):
+    return text.strip().lower() not in ('no', 'não', 'nao', 'false', '0', 'n')
+
+
+def post_purchases(path):
+    """Daily movements of the purchases exported to ``path``."""
+    movements = {}
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        missing = [name for name in PURCHASE_HEADER if name not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError(f"{path}: not a purchase export, missing column(s) {', '.join(missing)}")
+        for row in reader:
+            try:
+                day = parse_timestamp(row['Date'].strip()) // DAY
+                gross = parse_amount(row['Amount'])
+            except (ValueError, IndexError):
+                raise ValueError(f"{path}:{reader.line_num}: bad date or amount") from None
+            net, vat = split_vat(gross) if _yes(row['VAT Included']) else (gross, 0)
+            method = row['Method'].strip().lower()
+            if row['Supplier'].strip() or method == 'credit':
+                credit = SUPPLIERS
+            else:
+                credit = METHOD_ACCOUNTS.get(method, CASH)
+            _add(movements, day, (row.get('Account') or '').strip() or INVENTORY, net, 0)
+            if vat:
+                _add(movements, day, VAT_DEDUCTIBLE, vat, 0)
+            _add(movements, day, credit, 0, gross)
+    return movements
+
+
+@dataclass
+class TrialRow:
+    code: str
+    name: str
+    type: str
+    opening: int
+    debit: int
+    credit: int
+
+    @property
+    def closing(self):
+        return self.opening + self.debit - self.credit
+
+
+@dataclass
+class VatClearance:
+    collected: int
+    deductible: int
+
+    @property
+    def payable(self):
+        return max(0, self.collected - self.deductible)
+
+    @property
+    def recoverable(self):
+        return max(0, self.deductible - self.collected)
+
+
+@dataclass
+class IncomeStatement:
+    """
+    Revenues and expenses of a period, before cost of sales: purchases are
+    posted to inventory (26) and no consumption to 61, so ``net_income`` is
+    sales less the expenses posted directly.
+    """
+
+    revenues: dict = field(default_factory=dict)
+    expenses: dict = field(default_factory=dict)
+
+    @property
+    def total_revenue(self):
+        return sum(self.revenues.values())
+
+    @property
+    def total_expenses(self):
+        return sum(self.expenses.values())
+
+    @property
+    def net_income(self):
+        return self.total_revenue - self.total_expenses
+
+
+class Ledger:
+    """
+    Posted movements of every source, with their daily sum (``days``) and
+    the running totals at the end of each month (``months``).
+    """
+
+    def __init__(self, path=DEFAULT_LEDGER, sources=None, days=None, months=None):
+        self.path = path
+        self.sources = sources or {}
+        self.days = days or {}
+        self.months = months or {}
+        self._month_keys = sorted(self.months)
+
+    @classmethod
+    def load(cls, path=DEFAULT_LEDGER):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+        if data.get('version') != LEDGER_VERSION:
+            return cls(path)
+
+        def days(raw):
+            return {int(day): accounts for day, accounts in raw.items()}
+
+        sources = {name: {**source, 'days': days(source['days'])} for name, source in data['sources'].items()}
+        return cls(path, sources, days(data['days']), {int(month): totals for month, totals in data['months'].items()})
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            'version': LEDGER_VERSION,
+            'sources': self.sources,
+            'days': self.days,
+            'months': self.months,
+        }
+        write_json(self.path, data, separators=(',', ':'), ensure_ascii=False)
+
+    def fingerprint(self, name):
+        source = self.sources.get(name)
+        return source and source['fingerprint']
+
+    def replace(self, name, fingerprint, movements):
+        """Set the movements of source ``name`` and refresh the totals from its first changed month on."""
+        old = self.sources.get(name, {}).get('days', {})
+        self.sources[name] = {'fingerprint': fingerprint, 'days': movements}
+        changed = [day for day in set(old) | set(movements) if old.get(day) != movements.get(day)]
+        if not changed:
+            return
+        for day in changed:
+            total = {}
+            for source in self.sources.values():
+                _sum_into(total, source['days'].get(day, {}))
+            if total:
+                self.days[day] = total
+            else:
+                self.days.pop(day, None)
+        self._running_totals(_month(min(changed)))
+
+    def post(self, name, fingerprint, movements):
+        """Add ``movements`` to those of source ``name``, like ``replace``."""
+        days = dict(self.sources.get(name, {}).get('days', {}))
+        for day, accounts in movements.items():
+            merged = {account: list(pair) for account, pair in days.get(day, {}).items()}
+            _sum_into(merged, accounts)
+            days[day] = merged
+        self.replace(name, fingerprint, days)
+
+    def forget(self, name):
+        if name in self.sources:
+            self.replace(name, None, {})
+            del self.sources[name]
+
+    def _running_totals(self, first):
+        """Recompute ``months`` from month ``first`` on; earlier months are unchanged."""
+        by_month = {}
+        for day, accounts in self.days.items():
+            month = _month(day)
+            if month >= first:
+                _sum_into(by_month.setdefault(month, {}), accounts)
+        previous = [month for month in self.months if month < first]
+        running = {account: list(pair) for account, pair in self.months[max(previous)].items()} if previous else {}
+        self.months = {month: totals for month, totals in self.months.items() if month < first}
+        if by_month:
+            for month in range(first, max(by_month) + 1):
+                _sum_into(running, by_month.get(month, {}))
+                self.months[month] = {account: list(pair) for account, pair in running.items()}
+        self._month_keys = sorted(self.months)
+
+    def through(self, day):
+        """``{account: [debit, credit]}`` of every movement before ``day``."""
+        month = _month(day)
+        total = {}
+        earlier = [key for key in self._month_keys if key < month]
+        if earlier:
+            _sum_into(total, self.months[earlier[-1]])
+        for current in range(_month_start(month), day):
+            _sum_into(total, self.days.get(current, {}))
+        return total
+
+    def movements(self, since=None, until=None):
+        """``{account: [debit, credit]}`` posted from ``since`` up to ``until`` (exclusive), as dates."""
+        end = self.through(day_number(until)) if until is not None else self._all()
+        if since is not None:
+            _sum_into(end, self.through(day_number(since)), -1)
+        return end
+
+    def _all(self):
+        return {account: list(pair) for account, pair in self.months[self._month_keys[-1]].items()} \
+            if self._month_keys else {}
+
+    def vat_clearance(self, since=None, until=None):
+        moved = self.movements(since, until)
+        collected = moved.get(VAT_COLLECTED, [0, 0])
+        deductible = moved.get(VAT_DEDUCTIBLE, [0, 0])
+        return VatClearance(collected[1] - collected[0], deductible[0] - deductible[1])
+
+    def trial_balance(self, since=None, until=None):
+        opening = self.through(day_number(since)) if since is not None else {}
+        moved = self.movements(since, until)
+        rows = []
+        for code in sorted(set(opening) | set(moved)):
+            debit, credit = moved.get(code, (0, 0))
+            before = opening.get(code, (0, 0))
+            rows.append(TrialRow(code, account_name(code), account_type(code), before[0] - before[1], debit, credit))
+        return rows
+
+    def income_statement(self, since=None, until=None):
+        statement = IncomeStatement()
+        for code, (debit, credit) in sorted(self.movements(since, until).items()):
+            kind = account_type(code)
+            if kind == 'revenue':
+                statement.revenues[code] = credit - debit
+            elif kind == 'expense':
+                statement.expenses[code] = debit - credit
+        return statement
+
+
+def refresh(ledger, store=None, purchases=()):
+    """
+    Post the sales of ``store`` and the purchase exports ``purchases`` that
+    changed since ``ledger`` last saw them; returns the names posted.
+    """
+    posted = []
+    if store is not None:
+        fingerprint = store.fingerprint()
+        sales = ledger.sources.get('sales')
+        if not sales or sales['fingerprint'] != fingerprint:
+            first_id = store.column('order_ids')[0] if store.rows else None
+            seen = {'rows': store.rows, 'first_id': first_id, 'updated': store.updated}
+            if sales and sales.get('rows', store.rows + 1) <= store.rows and \
+                    (sales.get('first_id'), sales.get('updated')) == (first_id, store.updated):
+                # Rows are only appended: post the ones ingested since.
+                ledger.post('sales', fingerprint, post_sales(store, first=sales['rows']))
+            else:
+                # Another store, or posted rows since updated: post everything again.
+                ledger.replace('sales', fingerprint, post_sales(store))
+            ledger.sources['sales'].update(seen)
+            posted.append('sales')
+    for path in purchases:
+        name = 'purchases:' + os.path.abspath(path)
+        fingerprint = _file_hash(path)
+        if ledger.fingerprint(name) != fingerprint:
+            ledger.replace(name, fingerprint, post_purchases(path))
+            posted.append(name)
+    return posted
@@ -0,0 +1,418 @@
+"""
+Table turnover over exported ``TableSession`` documents: occupancy at any
+time, turn times by table and shift, revenue per seat-hour, and the
+sessions that overlap or were never closed.
+
+Sessions are read from ``mongoexport`` files of the ``tablesessions``
+collection, as JSON (one document per line, or ``--jsonArray``, Extended
+JSON or plain values) or CSV with at least the ``_id, table, startedAt,
+endedAt, status, totalRevenue, orderCount`` fields. Table numbers and
+seats come from an optional export of ``tables`` (``_id, number,
+capacity``); without it every table has the model's default 4 seats.
+Times are stored in UTC and shifted to the restaurants' wall-clock time
+(``Africa/Maputo``, UTC+2, no daylight saving) like the transaction
+exports.
+
+``SessionIndex.build`` sorts the sessions by table and start once, then
+keeps, per table, a contiguous run of:
+
+* ``starts``: the start of every session, sorted,
+* ``reach``: the latest end of the table's sessions up to each one (a
+  session still open reaches the end of the export), so the table is
+  occupied at ``T`` exactly when the last session started by ``T``
+  reaches past it,
+* prefix sums of the closed sessions' count and seconds by shift,
+  revenue and orders.
+
+Every query bisects each table's ``starts`` and subtracts two prefix sums,
+so it costs ``O(tables * log(sessions))`` whatever the history length.
+The index is saved under ``.reports-cache/sessions`` and only built again
+when an export changed; each save writes a new column directory and
+switches to it by replacing ``meta.json``.
+"""
+
+import csv
+import datetime
+import json
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from itertools import accumulate, chain, groupby
+from operator import itemgetter, mul, sub
+
+from filecache import write_json
+
+from .activity import SHIFTS
+from .store import CACHE_DIR, _file_hash
+from .transactions import MAX_ERRORS, RowError, parse_amount
+
+DEFAULT_SESSIONS = os.path.join(CACHE_DIR, 'sessions')
+SESSIONS_VERSION = 2
+# Table.capacity's default.
+DEFAULT_CAPACITY = 4
+# Africa/Maputo, the Restaurant model's default timezone.
+UTC_OFFSET = 2 * 3600
+# An open session started this long before the end of the export was never closed.
+STALE_HOURS = 12
+SESSION_FIELDS = ('_id', 'table', 'startedAt')
+SHIFT_NAMES = tuple(name for name, _ in SHIFTS)
+_SHIFT_OF_HOUR = [next(index for index, (_, hours) in enumerate(SHIFTS) if hour in hours) for hour in range(24)]
+# Saved columns: name -> typecode. ``starts`` and ``reach`` have one entry per
+# session, the prefix sums one more (a leading 0).
+COLUMNS = {
+    'starts': 'q',
+    'reach': 'q',
+    'revenue': 'q',
+    'orders': 'q',
+    **{f'{name}_count': 'q' for name in SHIFT_NAMES},
+    **{f'{name}_seconds': 'q' for name in SHIFT_NAMES},
+}
+
+
+def _plain(value):
+    """The value of an exported field: ``{"$oid": ...}``, ``ObjectId(...)`` and the like unwrapped."""
+    while isinstance(value, dict) and len(value) == 1:
+        value = next(iter(value.values()))
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith('ObjectId(') and value.endswith(')'):
+            value = value[9:-1].strip('"\'')
+    return value
+
+
+def parse_time(value, utc_offset=UTC_OFFSET):
+    """Wall-clock seconds since the epoch of an exported date; ``None`` if empty."""
+    value = _plain(value)
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)) or value.lstrip('-').isdigit():
+        return int(value) // 1000 + utc_offset  # milliseconds since the epoch
+    moment = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return int(moment.timestamp()) + utc_offset
+
+
+def _documents(path, on_error=None):
+    """
+    ``(line, document)`` of every document of a mongoexport file. Invalid
+    JSON goes to ``on_error(line, message)`` if given (a ``--jsonArray``
+    export is then skipped whole), and raises ``ValueError`` otherwise.
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        if path.lower().endswith('.csv'):
+            for line, row in enumerate(csv.DictReader(f), 2):
+                yield line, row
+            return
+        first = 1
+        head = f.read(1)
+        while head.isspace():
+            first += head == '\n'
+            head = f.read(1)
+        if head == '[':
+            try:
+                documents = json.loads(head + f.read())
+            except json.JSONDecodeError as e:
+                if on_error is None:
+                    raise ValueError(f'{path}: invalid JSON: {e}') from None
+                on_error(first + e.lineno - 1, f'invalid JSON, file skipped: {e.msg}')
+                return
+            for index, document in enumerate(documents):
+                yield index + 1, document
+            return
+        for line, text in enumerate(chain([head + f.readline()], f), first):
+            if not text.strip():
+                continue
+            try:
+                document = json.loads(text)
+            except json.JSONDecodeError as e:
+                if on_error is None:
+                    raise ValueError(f'{path}:{line}: invalid JSON: {e}') from None
+                on_error(line, f'invalid JSON: {e.msg} (column {e.colno})')
+                continue
+            yield line, document
+
+
+def read_tables(path):
+    """``{table id: (label, seats)}`` of an export of the ``tables`` collection."""
+    tables = {}
+    for _, document in _documents(path):
+        table = str(_plain(document.get('_id')))
+        number = _plain(document.get('number'))
+        capacity = _plain(document.get('capacity'))
+        tables[table] = (str(number) if number not in (None, '') else table,
+                         int(float(capacity)) if capacity not in (None, '') else DEFAULT_CAPACITY)
+    return tables
+
+
+@dataclass
+class Flag:
+    session: str
+    table: str
+    started: int
+    message: str
+
+
+@dataclass
+class TableStats:
+    """Closed sessions of one table started in a period."""
+
+    table: str
+    label: str
+    seats: int
+    sessions: int = 0
+    seconds: int = 0
+    seat_seconds: int = 0
+    revenue: int = 0
+    orders: int = 0
+    # shift -> [sessions, seconds]
+    shifts: dict = field(default_factory=dict)
+
+    @property
+    def turn_time(self):
+        """Average seconds from seating to closing, ``None`` without sessions."""
+        return self.seconds / self.sessions if self.sessions else None
+
+    def shift_turn_time(self, shift):
+        sessions, seconds = self.shifts[shift]
+        return seconds / sessions if sessions else None
+
+    @property
+    def seat_hours(self):
+        """Seat-hours the table was occupied."""
+        return self.seat_seconds / 3600
+
+    @property
+    def revenue_per_seat_hour(self):
+        """Centavos per occupied seat-hour, ``None`` without sessions."""
+        return self.revenue / self.seat_hours if self.seat_seconds else None
+
+
+class SessionIndex:
+    """Per-table interval index of the sessions of one restaurant."""
+
+    def __init__(self, path=DEFAULT_SESSIONS):
+        self.path = path
+        self.tables = []  # [(table id, label, seats, first, last)], rows first..last-1
+        self.columns = {name: array(code, [] if name in ('starts', 'reach') else [0])
+                        for name, code in COLUMNS.items()}
+        self.as_of = None
+        self.flags = []
+        self.sources = {}
+        self.utc_offset = UTC_OFFSET
+        self.skipped = 0
+        self.errors = []
+
+    def __len__(self):
+        return len(self.columns['starts'])
+
+    @classmethod
+    def load(cls, path=DEFAULT_SESSIONS):
+        """The index saved at ``path``; an empty one if nothing was built there yet."""
+        index = cls(path)
+        try:
+            with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return index
+        if meta.get('version') != SESSIONS_VERSION or meta.get('byteorder') != sys.byteorder:
+            return index
+        columns = {}
+        for name, code in COLUMNS.items():
+            column = columns[name] = array(code)
+            try:
+                with open(os.path.join(path, meta['columns'], name + '.' + code), 'rb') as f:
+                    column.frombytes(f.read())
+            except FileNotFoundError:
+                return index
+            if len(column) != meta['sessions'] + (name not in ('starts', 'reach')):
+                return index
+        index.columns = columns
+        index.tables = [tuple(table) for table in meta['tables']]
+        index.as_of = meta['as_of']
+        index.flags = [Flag(**flag) for flag in meta['flags']]
+        index.sources = meta['sources']
+        index.utc_offset = meta['utc_offset']
+        return index
+
+    def save(self):
+        """
+        Write the columns to a new directory, then swap ``meta.json``, which
+        names it, into place: readers see the old index or the new one.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        path = os.path.join(self.path, 'meta.json')
+        directory = tempfile.mkdtemp(prefix='columns-', dir=self.path)
+        for name, code in COLUMNS.items():
+            with open(os.path.join(directory, name + '.' + code), 'wb') as f:
+                self.columns[name].tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+        meta = {
+            'version': SESSIONS_VERSION,
+            'byteorder': sys.byteorder,
+            'columns': os.path.basename(directory),
+            'sessions': len(self),
+            'tables': self.tables,
+            'as_of': self.as_of,
+            'flags': [flag.__dict__ for flag in self.flags],
+            'sources': self.sources,
+            'utc_offset': self.utc_offset,
+        }
+        write_json(path, meta, ensure_ascii=False)
+        # The previous columns, and those of saves interrupted before the swap.
+        for entry in os.listdir(self.path):
+            if entry.startswith('columns-') and entry != meta['columns']:
+                shutil.rmtree(os.path.join(self.path, entry), ignore_errors=True)
+
+    def _drop(self, path, line, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(RowError(path, line, message))
+
+    def _read(self, paths):
+        """``{session id: (table, start, end, status, revenue, orders)}``; later exports win."""
+        sessions = {}
+        for path in paths:
+            for line, document in _documents(path, lambda line, message: self._drop(path, line, message)):
+                try:
+                    if not isinstance(document, dict):
+                        raise ValueError('not a document')
+                    missing = [name for name in SESSION_FIELDS if _plain(document.get(name)) in (None, '')]
+                    if missing:
+                        raise ValueError(f"no {', '.join(missing)}")
+                    revenue = _plain(document.get('totalRevenue'))
+                    orders = _plain(document.get('orderCount'))
+                    sessions[str(_plain(document['_id']))] = (
+                        str(_plain(document['table'])),
+                        parse_time(document['startedAt'], self.utc_offset),
+                        parse_time(document.get('endedAt'), self.utc_offset),
+                        _plain(document.get('status')) or 'active',
+                        parse_amount(str(revenue)) if revenue not in (None, '') else 0,
+                        int(float(orders)) if orders not in (None, '') else 0,
+                    )
+                except (TypeError, ValueError) as e:
+                    self._drop(path, line, str(e))
+        return sessions
+
+    @classmethod
+    def build(cls, paths, tables=None, path=DEFAULT_SESSIONS, utc_offset=UTC_OFFSET):
+        """
+        Index the sessions of the exports at ``paths``. ``tables`` is
+        ``read_tables`` of a tables export, for table numbers and seats.
+        """
+        index = cls(path)
+        index.utc_offset = utc_offset
+        sessions = index._read(paths)
+        tables = tables or {}
+        if not sessions:
+            return index
+        index.as_of = max(max(start, end or start) for _, start, end, _, _, _ in sessions.values())
+        stale = index.as_of - STALE_HOURS * 3600
+
+        rows = sorted((table, start, session) for session, (table, start, *_) in sessions.items())
+        ids = [session for _, _, session in rows]
+        starts = array('q', [start for _, start, _ in rows])
+        ends, closed = [], []
+        for session, start in zip(ids, starts):
+            table, _, end, status, _, _ = sessions[session]
+            if end is None and status != 'closed' and start >= stale:
+                end = index.as_of  # still seated when the export was taken
+            elif end is None or end < start:
+                message = ('ends before it starts' if end is not None else 'closed without an end time'
+                           if status == 'closed' else 'never closed')
+                index.flags.append(Flag(session, table, start, message))
+                end = start  # left out of occupancy and turn times
+            else:
+                closed.append(True)
+                ends.append(end)
+                continue
+            closed.append(False)
+            ends.append(end)
+
+        reach = array('q')
+        first = 0
+        for table, group in groupby(rows, itemgetter(0)):
+            last = first + sum(1 for _ in group)
+            label, seats = tables.get(table, (table, DEFAULT_CAPACITY))
+            index.tables.append((table, label, seats, first, last))
+            reach.extend(accumulate(ends[first:last], max))
+            for position in range(first + 1, last):
+                if starts[position] < reach[position - 1]:
+                    index.flags.append(Flag(ids[position], table, starts[position],
+                                            'starts before an earlier session of the table ends'))
+            first = last
+
+        columns = index.columns
+        columns['starts'], columns['reach'] = starts, reach
+        for name, values in (('revenue', [sessions[s][4] for s in ids]), ('orders', [sessions[s][5] for s in ids])):
+            columns[name] = array('q', accumulate(map(mul, values, closed), initial=0))
+        durations = list(map(sub, ends, starts))
+        shifts = [_SHIFT_OF_HOUR[start // 3600 % 24] for start in starts]
+        for code, name in enumerate(SHIFT_NAMES):
+            mine = [ok and shift == code for ok, shift in zip(closed, shifts)]
+            columns[f'{name}_count'] = array('q', accumulate(mine, initial=0))
+            columns[f'{name}_seconds'] = array('q', accumulate(map(mul, durations, mine), initial=0))
+        index.flags.sort(key=lambda flag: (flag.started, flag.table))
+        return index
+
+    def _range(self, first, last, since, until):
+        """Rows ``first..last`` of a table narrowed to the sessions started in ``[since, until)``."""
+        starts = self.columns['starts']
+        lower = first if since is None else bisect_left(starts, since, first, last)
+        upper = last if until is None else bisect_left(starts, until, first, last)
+        return lower, upper
+
+    def occupied(self, at):
+        """``(table id, label, seats)`` of the tables occupied at wall-clock second ``at``."""
+        starts, reach = self.columns['starts'], self.columns['reach']
+        found = []
+        for table, label, seats, first, last in self.tables:
+            position = bisect_right(starts, at, first, last) - 1
+            if position >= first and reach[position] > at:
+                found.append((table, label, seats))
+        return found
+
+    def stats(self, since=None, until=None):
+        """``TableStats`` of every table for the sessions started in ``[since, until)`` (wall-clock seconds)."""
+        columns = self.columns
+        out = []
+        for table, label, seats, first, last in self.tables:
+            lower, upper = self._range(first, last, since, until)
+
+            def total(name):
+                column = columns[name]
+                return column[upper] - column[lower]
+
+            row = TableStats(table, label, seats, revenue=total('revenue'), orders=total('orders'))
+            for name in SHIFT_NAMES:
+                row.shifts[name] = [total(f'{name}_count'), total(f'{name}_seconds')]
+                row.sessions += row.shifts[name][0]
+                row.seconds += row.shifts[name][1]
+            row.seat_seconds = seats * row.seconds
+            out.append(row)
+        return out
+
+
+def refresh(index, paths=(), tables=None, utc_offset=UTC_OFFSET):
+    """
+    ``index``, built again from ``paths`` (default: the exports it was
+    built from) and the tables export ``tables`` if any of them changed.
+    Returns ``(index, rebuilt)``.
+    """
+    paths = [os.path.abspath(path) for path in paths] or [
+        path for path in index.sources if not path.startswith('tables:') and os.path.exists(path)]
+    if tables is None:
+        tables = next((name.split(':', 1)[1] for name in index.sources if name.startswith('tables:')), None)
+    wanted = {path: _file_hash(path) for path in paths}
+    if tables is not None:
+        wanted['tables:' + os.path.abspath(tables)] = _file_hash(tables)
+    if wanted == index.sources and utc_offset == index.utc_offset:
+        return index, False
+    built = SessionIndex.build(paths, tables and read_tables(tables), index.path, utc_offset)
+    built.sources = wanted
+    return built, True
@@ -0,0 +1,345 @@
+"""
+Typed columnar store of the transaction history, ingested once from the
+exports and memory-mapped by every report.
+
+Parsing the exports again for each report is slow (``.xls`` above all).
+``Store.ingest`` converts them once into one file per column under
+``.reports-cache/transactions``:
+
+* ``order_id.bin``: the 24-hex-digit MongoDB ids as 12 raw bytes each,
+* ``timestamp.q`` and ``amount.q``: int64 seconds and centavos,
+* ``method.H``, ``status.H`` and ``customer.I``: dictionary codes, with the
+  dictionaries in ``meta.json``.
+
+Later exports are appended; an order already stored is updated in place
+when a later export shows it differently (a pending order since paid), so
+every order is stored once. An export whose content hash was already
+ingested is skipped without being parsed.
+
+Readers map only the columns they use and get ``memoryview`` s cast to the
+column type straight over the mapping: nothing is parsed or copied, and the
+pages of a column no report touches are never read. ``Store`` is a source
+for ``transactions.summarize`` like ``ExportSource``.
+
+``meta.json`` is written last (atomically) and holds the row count, so an
+interrupted ingest leaves the store as it was: trailing bytes past the
+count are ignored and truncated by the next ingest. Updates to stored rows
+go to ``updates.json`` first and are only written into the columns once
+the ``meta.json`` naming that journal is in place; a store opened with the
+journal still named in it applies the journal again before being read.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+from array import array
+from dataclasses import dataclass
+
+from filecache import write_json
+
+from .transactions import CHUNK_ROWS, MAX_ERRORS, Chunk, Dictionaries, ExportSource, RowError
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(ROOT, '.reports-cache')
+DEFAULT_STORE = os.path.join(CACHE_DIR, 'transactions')
+STORE_VERSION = 1
+ID_BYTES = 12
+# Chunk field -> (file name, array typecode).
+COLUMNS = {
+    'timestamps': ('timestamp.q', 'q'),
+    'amounts': ('amount.q', 'q'),
+    'methods': ('method.H', 'H'),
+    'statuses': ('status.H', 'H'),
+    'customers': ('customer.I', 'I'),
+}
+ID_FILE = 'order_id.bin'
+JOURNAL_FILE = 'updates.json'
+
+
+class OrderIds:
+    """Read-only sequence of the order ids of a stored column, decoded on access."""
+
+    __slots__ = ('raw',)
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def __len__(self):
+        return len(self.raw) // ID_BYTES
+
+    def __getitem__(self, pos):
+        if pos < 0:
+            pos += len(self)
+        return bytes(self.raw[pos * ID_BYTES:(pos + 1) * ID_BYTES]).hex()
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
+
+    def take(self, positions):
+        """The ids at ``positions``, copied out as raw bytes (``Chunk.select``)."""
+        raw = self.raw
+        return OrderIds(b''.join([raw[pos * ID_BYTES:(pos + 1) * ID_BYTES] for pos in positions]))
+
+
+def _id_bytes(order_id):
+    if len(order_id) != ID_BYTES * 2:
+        raise ValueError(order_id)
+    return bytes.fromhex(order_id)
+
+
+@dataclass
+class IngestResult:
+    path: str
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: bool = False
+
+
+def _file_hash(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Store:
+    """The columns of one store directory."""
+
+    def __init__(self, path=DEFAULT_STORE, rows=0, dictionaries=None, sources=None, revised=0, updated=0):
+        self.path = path
+        self.rows = rows
+        self.dictionaries = dictionaries or Dictionaries()
+        self.sources = sources or {}
+        # Rows ever updated with another timestamp or amount; rollups of
+        # those (``reports.activity``) have to be built again.
+        self.revised = revised
+        # Rows ever updated at all (a status or method change too); the
+        # ledger (``reports.ledger``) posts the sales again after one.
+        self.updated = updated
+        self._maps = {}
+        # Invalid rows of the last ingest, like ExportSource.
+        self.skipped = 0
+        self.errors = []
+
+    @classmethod
+    def open(cls, path=DEFAULT_STORE):
+        """The store at ``path``; an empty one if nothing was ingested there yet."""
+        try:
+            with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return cls(path)
+        if meta.get('version') != STORE_VERSION or meta.get('byteorder') != sys.byteorder:
+            raise ValueError(f'{path}: store written by another version or machine; delete it and ingest again')
+        words = meta['dictionaries']
+        store = cls(path, meta['rows'], Dictionaries(words['methods'], words['statuses'], words['customers']),
+                    meta['sources'], meta.get('revised', 0), meta.get('updated', 0))
+        if meta.get('journal'):
+            # An ingest stopped after committing its updates but before writing them all.
+            with open(os.path.join(path, JOURNAL_FILE), 'r', encoding='utf-8') as f:
+                journal = json.load(f)
+            store._apply(dict(zip(journal['positions'], journal['rows'])))
+        return store
+
+    def __len__(self):
+        return self.rows
+
+    def fingerprint(self):
+        """Changes whenever an ingest changed the store (rows added or updated)."""
+        try:
+            return _file_hash(os.path.join(self.path, 'meta.json'))
+        except FileNotFoundError:
+            return None
+
+    def close(self):
+        for mapped, view in self._maps.values():
+            view.release()
+            try:
+                mapped.close()
+            except BufferError:
+                pass  # a chunk still refers to it; unmapped once that is gone
+        self._maps = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _view(self, name, typecode, width):
+        found = self._maps.get(name)
+        if found is None:
+            if not self.rows:
+                return memoryview(b'').cast(typecode)
+            with open(os.path.join(self.path, name), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            found = self._maps[name] = (mapped, memoryview(mapped))
+        return found[1][:self.rows * width].cast(typecode)
+
+    def column(self, field):
+        """A zero-copy view of one ``Chunk`` field over every stored row."""
+        if field == 'order_ids':
+            return OrderIds(self._view(ID_FILE, 'B', ID_BYTES))
+        name, typecode = COLUMNS[field]
+        return self._view(name, typecode, array(typecode).itemsize)
+
+    def chunks(self, chunk_rows=CHUNK_ROWS, first=0):
+        """
+        The stored rows from row ``first`` on as ``Chunk`` s of zero-copy
+        views. Rows are only ever appended, so ``first`` can be a row count
+        read earlier, to go through the rows added since.
+        """
+        columns = {field: self.column(field) for field in COLUMNS}
+        ids = self.column('order_ids').raw
+        for start in range(first, self.rows, chunk_rows):
+            end = min(start + chunk_rows, self.rows)
+            yield Chunk(OrderIds(ids[start * ID_BYTES:end * ID_BYTES]),
+                        **{field: column[start:end] for field, column in columns.items()})
+
+    __iter__ = chunks
+
+    def _save_meta(self, rows, journal=False):
+        meta = {
+            'version': STORE_VERSION,
+            'byteorder': sys.byteorder,
+            'rows': rows,
+            'dictionaries': {
+                'methods': self.dictionaries.methods.values,
+                'statuses': self.dictionaries.statuses.values,
+                'customers': self.dictionaries.customers.values,
+            },
+            'sources': self.sources,
+            'revised': self.revised,
+            'updated': self.updated,
+            'journal': journal,
+        }
+        write_json(os.path.join(self.path, 'meta.json'), meta, ensure_ascii=False)
+
+    def ingest(self, paths, force=False, chunk_rows=CHUNK_ROWS):
+        """
+        Add the rows of the exports at ``paths``; returns one ``IngestResult``
+        per path. Exports already ingested with the same content are
+        skipped unless ``force``.
+        """
+        self.close()
+        os.makedirs(self.path, exist_ok=True)
+        widths = {ID_FILE: ID_BYTES, **{name: array(code).itemsize for name, code in COLUMNS.values()}}
+        for name, width in widths.items():
+            # Drop whatever an interrupted ingest appended past the committed rows.
+            with open(os.path.join(self.path, name), 'ab') as f:
+                f.truncate(self.rows * width)
+
+        with open(os.path.join(self.path, ID_FILE), 'rb') as f:
+            raw = f.read()
+        positions = {raw[pos:pos + ID_BYTES]: index
+                     for index, pos in enumerate(range(0, len(raw), ID_BYTES))}
+        del raw
+
+        results = []
+        source = ExportSource([], chunk_rows, self.dictionaries)
+        for path in paths:
+            key = os.path.abspath(path)
+            digest = _file_hash(path)
+            if not force and self.sources.get(key) == digest:
+                results.append(IngestResult(path, skipped=True))
+                continue
+            result = IngestResult(path)
+            added = {'ids': bytearray(), **{field: array(code) for field, (_, code) in COLUMNS.items()}}
+            updates = {}
+            for chunk in source.read(path):
+                self._merge(chunk, positions, added, updates, result, source)
+            # Codes new in this export must be on disk before any column refers to them.
+            self._save_meta(self.rows)
+            timestamps, amounts = self.column('timestamps'), self.column('amounts')
+            revised = sum(1 for pos, row in updates.items() if row[0] != timestamps[pos] or row[1] != amounts[pos])
+            del timestamps, amounts
+            self._append(added)
+            if updates:
+                self._save_journal(updates)
+            self.rows += len(added['ids']) // ID_BYTES
+            self.revised += revised
+            self.updated += len(updates)
+            self.sources[key] = digest
+            self._save_meta(self.rows, journal=bool(updates))
+            if updates:
+                self._apply(updates)
+            result.updated = len(updates)
+            results.append(result)
+        self.skipped, self.errors = source.skipped, source.errors
+        return results
+
+    def _merge(self, chunk, positions, added, updates, result, source):
+        stored = self.rows
+        fields = list(COLUMNS)
+        values = [getattr(chunk, field) for field in fields]
+        try:
+            keys = list(map(_id_bytes, chunk.order_ids))
+        except ValueError:
+            keys = None
+        if keys is not None and len(set(keys)) == len(keys) and not any(map(positions.__contains__, keys)):
+            # The usual case, an export of new orders: append whole columns.
+            base = stored + len(added['ids']) // ID_BYTES
+            positions.update(zip(keys, range(base, base + len(keys))))
+            added['ids'] += b''.join(keys)
+            for field, column in zip(fields, values):
+                added[field].extend(column)
+            result.added += len(keys)
+            return
+
+        current = [self.column(field) for field in fields]
+        for offset, order_id in enumerate(chunk.order_ids):
+            try:
+                key = _id_bytes(order_id)
+            except ValueError:
+                source.skipped += 1
+                if len(source.errors) < MAX_ERRORS:
+                    source.errors.append(RowError(result.path, None, f'not a MongoDB order id: {order_id}'))
+                continue
+            row = [column[offset] for column in values]
+            pos = positions.get(key)
+            if pos is None:
+                positions[key] = stored + len(added['ids']) // ID_BYTES
+                added['ids'] += key
+                for field, value in zip(fields, row):
+                    added[field].append(value)
+                result.added += 1
+            elif pos >= stored:
+                # Twice in the exports being ingested: the later row wins.
+                for field, value in zip(fields, row):
+                    added[field][pos - stored] = value
+            elif pos in updates or [column[pos] for column in current] != row:
+                updates[pos] = row
+            else:
+                result.unchanged += 1
+
+    def _append(self, added):
+        self.close()
+        for name, data in ((ID_FILE, added['ids']),
+                           *((name, added[field].tobytes()) for field, (name, _) in COLUMNS.items())):
+            with open(os.path.join(self.path, name), 'ab') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _save_journal(self, updates):
+        positions = sorted(updates)
+        write_json(os.path.join(self.path, JOURNAL_FILE),
+                   {'positions': positions, 'rows': [updates[pos] for pos in positions]})
+
+    def _apply(self, updates):
+        """Write the journalled ``updates`` into the columns, then drop the journal from ``meta.json``."""
+        self.close()
+        for index, (name, code) in enumerate(COLUMNS.values()):
+            width = array(code).itemsize
+            with open(os.path.join(self.path, name), 'r+b') as f:
+                for pos, row in sorted(updates.items()):
+                    f.seek(pos * width)
+                    f.write(array(code, [row[index]]).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+        self._save_meta(self.rows)
+        os.remove(os.path.join(self.path, JOURNAL_FILE))
@@ -0,0 +1,91 @@
+import datetime
+
+from reports.ledger import Ledger, refresh, split_vat
+from reports.store import Store
+from reports.transactions import HEADER
+
+SALES = [
+    ('6960029d8508962ffc0f03d8', '2026-01-08 21:16', 'Cipriano', '116', 'cash', 'paid'),
+    ('695fff498508962ffc0efa80', '2026-01-20 21:02', 'Mauro', '232', 'mpesa', 'pending'),
+    ('695ffac08508962ffc0ef448', '2026-01-21 20:43', 'Teste', '50', 'cash', 'failed'),
+]
+LATER_SALES = [
+    ('696100008508962ffc0f1000', '2026-02-03 12:30', 'Ana', '58', 'visa', 'paid'),
+]
+PURCHASES = [
+    'Date,Description,Supplier,Amount,Method,VAT Included,Account',
+    '2026-01-05,Farinha,Moagem Lda,1160,transfer,yes,',
+    '2026-02-10,Limpeza,,300,cash,no,63',
+]
+
+
+def write_export(path, rows):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(','.join(HEADER) + '\n')
+        f.writelines(','.join(row) + '\n' for row in rows)
+    return str(path)
+
+
+def posted(tmp_path, *exports):
+    store = Store(str(tmp_path / 'store'))
+    for export in exports:
+        store.ingest([export])
+    purchases = tmp_path / 'purchases.csv'
+    purchases.write_text('\n'.join(PURCHASES) + '\n', encoding='utf-8')
+    ledger = Ledger(str(tmp_path / 'ledger.json'))
+    refresh(ledger, Store.open(store.path), [str(purchases)])
+    return ledger
+
+
+def test_split_vat_is_exact():
+    assert split_vat(11600) == (10000, 1600)
+    net, vat = split_vat(9950)
+    assert net + vat == 9950
+
+
+def test_trial_balance_balances(tmp_path):
+    ledger = posted(tmp_path, write_export(tmp_path / 'a.csv', SALES + LATER_SALES))
+    rows = ledger.trial_balance()
+    assert sum(row.debit for row in rows) == sum(row.credit for row in rows)
+    closing = {row.code: row.closing for row in rows}
+    assert closing['111'] == 11600 - 30000
+    assert closing['121'] == 5800
+    assert '131' not in closing  # the M-Pesa sale is still pending
+    assert closing['411'] == 23200
+    assert closing['421'] == -116000
+    assert closing['711'] == -(10000 + 20000 + 5000)
+    assert sum(closing.values()) == 0
+
+
+def test_period_totals(tmp_path):
+    ledger = posted(tmp_path, write_export(tmp_path / 'a.csv', SALES + LATER_SALES))
+    january = ledger.income_statement(datetime.date(2026, 1, 1), datetime.date(2026, 2, 1))
+    assert january.revenues == {'711': 30000}
+    assert january.expenses == {}
+    february = ledger.income_statement(datetime.date(2026, 2, 1), datetime.date(2026, 3, 1))
+    assert (february.total_revenue, february.total_expenses, february.net_income) == (5000, 30000, -25000)
+
+    vat = ledger.vat_clearance(datetime.date(2026, 1, 1), datetime.date(2026, 2, 1))
+    assert (vat.collected, vat.deductible, vat.recoverable) == (4800, 16000, 11200)
+
+    # The opening balance of February is January's closing.
+    opening = {row.code: row.opening for row in ledger.trial_balance(datetime.date(2026, 2, 1))}
+    assert opening['711'] == -30000
+    assert opening['26'] == 100000
+
+
+def test_incremental_refresh_matches_a_full_post(tmp_path):
+    first = write_export(tmp_path / 'a.csv', SALES)
+    later = write_export(tmp_path / 'b.csv', LATER_SALES)
+    incremental = posted(tmp_path, first)
+    store = Store.open(str(tmp_path / 'store'))
+    store.ingest([later])
+    assert refresh(incremental, Store.open(store.path)) == ['sales']
+    incremental.save()
+
+    (tmp_path / 'full').mkdir()
+    full = posted(tmp_path / 'full', write_export(tmp_path / 'c.csv', SALES + LATER_SALES))
+    loaded = Ledger.load(incremental.path)
+    assert loaded.days == full.days
+    assert loaded.months == full.months
+    assert refresh(loaded, Store.open(store.path)) == []
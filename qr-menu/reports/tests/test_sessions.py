@@ -0,0 +1,80 @@
+import json
+import os
+
+import pytest
+
+from reports.sessions import SessionIndex, parse_time, read_tables
+
+
+def at(text):
+    return parse_time(text)
+
+
+SESSIONS = [
+    {'_id': {'$oid': 's1'}, 'table': {'$oid': 't1'}, 'startedAt': {'$date': '2026-01-08T10:00:00Z'},
+     'endedAt': {'$date': '2026-01-08T11:00:00Z'}, 'status': 'closed', 'totalRevenue': 500, 'orderCount': 2},
+    {'_id': {'$oid': 's2'}, 'table': {'$oid': 't1'}, 'startedAt': {'$date': '2026-01-08T18:00:00Z'},
+     'endedAt': {'$date': '2026-01-08T19:30:00Z'}, 'status': 'closed', 'totalRevenue': 1000, 'orderCount': 3},
+    {'_id': {'$oid': 's3'}, 'table': {'$oid': 't2'}, 'startedAt': {'$date': '2026-01-08T08:00:00Z'},
+     'endedAt': {'$date': '2026-01-08T09:00:00Z'}, 'status': 'closed', 'totalRevenue': 300, 'orderCount': 1},
+    # Still seated when the export was taken.
+    {'_id': {'$oid': 's4'}, 'table': {'$oid': 't2'}, 'startedAt': {'$date': '2026-01-08T19:00:00Z'},
+     'status': 'active'},
+    # Left open two days ago.
+    {'_id': {'$oid': 's5'}, 'table': {'$oid': 't3'}, 'startedAt': {'$date': '2026-01-06T08:00:00Z'},
+     'status': 'active'},
+]
+TABLES = [
+    {'_id': {'$oid': 't1'}, 'number': 1, 'capacity': 2},
+    {'_id': {'$oid': 't2'}, 'number': 2, 'capacity': 6},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    sessions = tmp_path / 'tablesessions.json'
+    sessions.write_text(''.join(json.dumps(doc) + '\n' for doc in SESSIONS), encoding='utf-8')
+    tables = tmp_path / 'tables.json'
+    tables.write_text(json.dumps(TABLES), encoding='utf-8')
+    return SessionIndex.build([str(sessions)], read_tables(str(tables)), str(tmp_path / 'index'))
+
+
+def test_occupied(index):
+    assert index.occupied(at('2026-01-08T10:30:00Z')) == [('t1', '1', 2)]
+    assert index.occupied(at('2026-01-08T19:15:00Z')) == [('t1', '1', 2), ('t2', '2', 6)]
+    # Sessions end at their end time; the stale one occupies nothing.
+    assert index.occupied(at('2026-01-08T11:00:00Z')) == []
+    assert index.occupied(at('2026-01-06T09:00:00Z')) == []
+
+
+def test_flags_stale_sessions(index):
+    assert [(flag.session, flag.message) for flag in index.flags] == [('s5', 'never closed')]
+
+
+def test_stats(index):
+    t1, t2, t3 = index.stats()
+    assert (t1.label, t1.sessions, t1.seconds, t1.revenue, t1.orders) == ('1', 2, 9000, 150000, 5)
+    assert t1.shifts['afternoon'] == [1, 3600]
+    assert t1.shifts['night'] == [1, 5400]
+    assert t1.turn_time == 4500
+    assert t1.seat_hours == 5
+    assert t1.revenue_per_seat_hour == 30000
+    # The open session is not counted until it closes.
+    assert (t2.sessions, t2.revenue, t2.shifts['morning']) == (1, 30000, [1, 3600])
+    assert (t3.label, t3.seats, t3.sessions, t3.turn_time) == ('t3', 4, 0, None)
+
+
+def test_stats_of_a_period(index):
+    t1, t2, _ = index.stats(since=at('2026-01-08T12:00:00Z'), until=at('2026-01-09T00:00:00Z'))
+    assert (t1.sessions, t1.revenue) == (1, 100000)
+    assert t2.sessions == 0
+
+
+def test_save_and_load(index):
+    index.save()
+    index.save()  # replaces the previous column directory
+    assert len([name for name in os.listdir(index.path) if name.startswith('columns-')]) == 1
+    loaded = SessionIndex.load(index.path)
+    assert len(loaded) == len(index)
+    assert loaded.stats() == index.stats()
+    assert loaded.occupied(at('2026-01-08T19:15:00Z')) == index.occupied(at('2026-01-08T19:15:00Z'))
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+from reports.store import JOURNAL_FILE, Store
+from reports.transactions import HEADER, parse_timestamp, summarize
+
+
+def write_export(path, rows):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(','.join(HEADER) + '\n')
+        for row in rows:
+            f.write(','.join(row) + '\n')
+    return str(path)
+
+
+ORDERS = [
+    ('6960029d8508962ffc0f03d8', '2026-01-08 21:16', 'Cipriano', '200', 'cash', 'paid'),
+    ('695fff498508962ffc0efa80', '2026-01-08 21:02', 'Mauro', '140', 'mpesa', 'pending'),
+]
+LATER = [
+    ('695fff498508962ffc0efa80', '2026-01-08 21:02', 'Mauro', '140', 'mpesa', 'paid'),
+    ('696100008508962ffc0f1000', '2026-01-09 12:30', 'Ana', '99.50', 'visa', 'paid'),
+]
+
+
+def statuses(store):
+    words = store.dictionaries.statuses.values
+    return [words[code] for code in store.column('statuses')]
+
+
+def test_ingest_appends_and_skips_known_exports(tmp_path):
+    export = write_export(tmp_path / 'a.csv', ORDERS)
+    store = Store(str(tmp_path / 'store'))
+    [result] = store.ingest([export])
+    assert (result.added, result.updated, result.skipped) == (2, 0, False)
+
+    store = Store.open(str(tmp_path / 'store'))
+    assert len(store) == 2
+    assert list(store.column('order_ids')) == [row[0] for row in ORDERS]
+    assert list(store.column('amounts')) == [20000, 14000]
+    assert store.column('timestamps')[0] == parse_timestamp('2026-01-08 21:16')
+    [again] = store.ingest([export])
+    assert again.skipped
+    store.close()
+
+
+def test_later_export_updates_rows_in_place(tmp_path):
+    path = str(tmp_path / 'store')
+    store = Store(path)
+    store.ingest([write_export(tmp_path / 'a.csv', ORDERS)])
+    [result] = store.ingest([write_export(tmp_path / 'b.csv', LATER)])
+    assert (result.added, result.updated) == (1, 1)
+
+    store = Store.open(path)
+    assert len(store) == 3
+    assert statuses(store) == ['paid', 'paid', 'paid']
+    assert (store.updated, store.revised) == (1, 0)
+    assert summarize(store).amount == 20000 + 14000 + 9950
+    assert not os.path.exists(os.path.join(path, JOURNAL_FILE))
+    store.close()
+
+
+def test_open_replays_an_interrupted_update(tmp_path, monkeypatch):
+    path = str(tmp_path / 'store')
+    Store(path).ingest([write_export(tmp_path / 'a.csv', ORDERS)])
+
+    def crash(self, updates):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Store, '_apply', crash)
+        with pytest.raises(KeyboardInterrupt):
+            Store.open(path).ingest([write_export(tmp_path / 'b.csv', LATER)])
+    assert os.path.exists(os.path.join(path, JOURNAL_FILE))
+
+    store = Store.open(path)
+    assert len(store) == 3
+    assert statuses(store) == ['paid', 'paid', 'paid']
+    assert not os.path.exists(os.path.join(path, JOURNAL_FILE))
+    store.close()
+
+
+def test_interrupted_append_is_truncated(tmp_path):
+    path = str(tmp_path / 'store')
+    store = Store(path)
+    store.ingest([write_export(tmp_path / 'a.csv', ORDERS)])
+    with open(os.path.join(path, 'amount.q'), 'ab') as f:
+        f.write(b'\0' * 8)  # bytes past the committed row count
+
+    store = Store.open(path)
+    assert list(store.column('amounts')) == [20000, 14000]
+    store.ingest([write_export(tmp_path / 'b.csv', LATER)])
+    assert list(Store.open(path).column('amounts')) == [20000, 14000, 9950]
@@ -0,0 +1,52 @@
+import datetime
+
+import pytest
+
+from reports import transactions
+from reports.transactions import ExportSource, summarize
+
+ROWS = [
+    'Order ID,Date,Customer,Amount,Method,Payment Status',
+    '6960029d8508962ffc0f03d8,2026-01-08 21:16,Cipriano,200,cash,paid',
+    '695fff498508962ffc0efa80,2026-01-08 21:02,Mauro,140,mpesa,pending',
+    '695ffac08508962ffc0ef448,2026-01-09 20:43,Silva, Lda,1400.50,Cash,Paid',
+    '695ffac08508962ffc0ef449,2026-01-10 09:00,Teste,99.90,visa,failed',
+]
+
+
+@pytest.fixture
+def export(tmp_path):
+    path = tmp_path / 'transactions.csv'
+    path.write_text('\n'.join(ROWS) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def test_summarize_totals(export):
+    summary = summarize(ExportSource([export], chunk_rows=2))
+    assert summary.rows == 4
+    assert summary.by_day() == {'2026-01-08': (2, 34000), '2026-01-09': (1, 140050), '2026-01-10': (1, 9990)}
+    assert summary.by_status()['paid'] == (2, 160050)
+    assert [row.customer for row in summary.pending()] == ['Mauro']
+
+
+def test_customer_with_a_comma_is_joined_back(export):
+    source = ExportSource([export])
+    [chunk] = source
+    assert source.dictionaries.customers.values[chunk.customers[2]] == 'Silva, Lda'
+
+
+def test_summarize_period(export):
+    summary = summarize(ExportSource([export]), since=datetime.date(2026, 1, 9), until=datetime.date(2026, 1, 10))
+    assert summary.rows == 1
+    assert summary.by_method() == {'cash': (1, 140050)}
+    assert summary.pending_count == 0
+
+
+def test_numpy_and_pure_python_folds_agree(export, monkeypatch):
+    pytest.importorskip('numpy')
+    expected = summarize(ExportSource([export], chunk_rows=3))
+    monkeypatch.setattr(transactions, 'numpy', None)
+    plain = summarize(ExportSource([export], chunk_rows=3))
+    assert plain.cube == expected.cube
+    assert (plain.rows, plain.first, plain.last) == (expected.rows, expected.first, expected.last)
+    assert plain.pending() == expected.pending()
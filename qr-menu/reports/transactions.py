@@ -0,0 +1,514 @@
+"""
+Streaming reader and aggregation for the dashboard's transaction exports.
+
+The Payments page exports ``Order ID,Date,Customer,Amount,Method,Payment
+Status`` rows (see ``imagens/transactions.csv``). ``read_exports`` streams
+such files (CSV, or ``.xls`` with the optional ``xlrd``) in chunks of
+``CHUNK_ROWS`` rows, so memory stays bounded however long the history is. Each chunk is transposed once into columns:
+
+* ``timestamps``: seconds since the epoch of the local wall-clock time the
+  export shows (``yyyy-MM-dd HH:mm``), in an ``array('q')``,
+* ``amounts``: centavos in an ``array('q')``, so sums are exact,
+* ``methods``, ``statuses`` and ``customers``: codes into a ``Dictionary``
+  shared by every chunk of the source,
+* ``order_ids``: the ids as strings.
+
+Conversions and filters work on whole columns (``map``, ``compress``) rather
+than row by row. ``summarize`` folds the chunks into a cube of
+``(day, method, status) -> [count, centavos]``; totals by day, method or
+status are marginals of that cube, which stays small (days x methods x
+statuses) whatever the row count. With the optional ``numpy`` the fold is
+array operations over zero-copy views of each chunk's columns (packed
+cell codes, one sort, integer ``reduceat`` sums); without it, ``map`` and
+a ``Counter`` over the columns.
+
+The dashboard joins fields with "," without quoting, so a customer name
+with a comma spreads over extra fields; those are joined back into the
+customer.
+"""
+
+import csv
+import datetime
+import os
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import compress, islice, repeat
+from operator import add, floordiv, ge, itemgetter, lshift, lt, or_
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+HEADER = ('Order ID', 'Date', 'Customer', 'Amount', 'Method', 'Payment Status')
+CHUNK_ROWS = 65_536
+DAY = 86_400
+_EPOCH = datetime.date(1970, 1, 1).toordinal()
+# Statuses whose orders still have to be chased.
+CHASE_STATUSES = ('pending',)
+METHOD_LABELS = {'cash': 'Cash', 'mpesa': 'M-Pesa', 'emola': 'e-Mola', 'visa': 'Visa', 'bim': 'BIM', 'bci': 'BCI',
+                 'room_account': 'Room account'}
+DIMENSIONS = ('day', 'method', 'status')
+# Invalid rows kept for the report; the rest are only counted.
+MAX_ERRORS = 20
+
+
+class Dictionary:
+    """Values of a dictionary-encoded column: ``values[code]``."""
+
+    __slots__ = ('values', 'codes')
+
+    def __init__(self, values=()):
+        self.values = list(values)
+        self.codes = {value: code for code, value in enumerate(self.values)}
+
+    def __len__(self):
+        return len(self.values)
+
+    def code(self, value):
+        found = self.codes.get(value)
+        if found is None:
+            found = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return found
+
+    def encode(self, column, typecode='H'):
+        """Codes of every value of ``column`` (a sequence), adding unseen values."""
+        codes = self.codes
+        try:
+            return array(typecode, map(codes.__getitem__, column))
+        except KeyError:
+            return array(typecode, map(self.code, column))
+
+    def find(self, value):
+        """Code of ``value``, or None if no row holds it."""
+        return self.codes.get(value)
+
+
+@dataclass
+class Chunk:
+    """A run of rows, one column per field."""
+
+    order_ids: list
+    timestamps: array
+    customers: array
+    amounts: array
+    methods: array
+    statuses: array
+
+    def __len__(self):
+        return len(self.order_ids)
+
+    def select(self, mask):
+        """The rows where ``mask`` (an iterable of booleans) is true, copied out of the chunk."""
+        positions = list(compress(range(len(self)), mask))
+        return Chunk(
+            _take_ids(self.order_ids, positions),
+            *(array(_typecode(column), map(column.__getitem__, positions))
+              for column in (self.timestamps, self.customers, self.amounts, self.methods, self.statuses)))
+
+
+def _take_ids(ids, positions):
+    # The store's ids (``store.OrderIds``) are copied as raw bytes, decoded only when read.
+    take = getattr(ids, 'take', None)
+    return take(positions) if take is not None else [ids[pos] for pos in positions]
+
+
+def _typecode(column):
+    """Item type of an ``array`` or of a ``memoryview`` cast over a stored column."""
+    return column.typecode if isinstance(column, array) else column.format
+
+
+@dataclass
+class RowError:
+    path: str
+    line: int
+    message: str
+
+
+class Dictionaries:
+    """The dictionaries a source encodes its method, status and customer columns with."""
+
+    def __init__(self, methods=(), statuses=(), customers=()):
+        self.methods = Dictionary(methods)
+        self.statuses = Dictionary(statuses)
+        self.customers = Dictionary(customers)
+
+
+def _day_seconds(text):
+    return (datetime.date.fromisoformat(text).toordinal() - _EPOCH) * DAY
+
+
+def _clock_seconds(text):
+    if not text:
+        return 0  # a date without time: midnight
+    clock = text.split(':')
+    return int(clock[0]) * 3600 + int(clock[1]) * 60 + (int(clock[2]) if len(clock) > 2 else 0)
+
+
+def parse_timestamp(text):
+    """Seconds since the epoch of ``yyyy-MM-dd[ HH:mm[:ss]]``, taken as wall-clock time."""
+    return _day_seconds(text[:10]) + _clock_seconds(text[11:])
+
+
+def _decode(column, parse):
+    """``parse`` of every value of ``column``, calling it once per distinct value."""
+    column = list(column)
+    found = {value: parse(value) for value in set(column)}
+    return map(found.__getitem__, column)
+
+
+_DAY_PART = itemgetter(slice(0, 10))
+_CLOCK_PART = itemgetter(slice(11, None))
+
+
+def _timestamps(dates):
+    # Days and clock times repeat far more than full dates: parse each distinct part once.
+    return array('q', map(add, _decode(map(_DAY_PART, dates), _day_seconds),
+                          _decode(map(_CLOCK_PART, dates), _clock_seconds)))
+
+
+def parse_amount(text):
+    """Centavos of a decimal amount (``140``, ``140.5``, ``1 400,50``)."""
+    text = text.replace(' ', '')
+    if ',' in text:
+        text = text.replace('.', '').replace(',', '.') if '.' in text else text.replace(',', '.')
+    return round(float(text) * 100)
+
+
+def day_number(date):
+    """Days since the epoch of a ``datetime.date``."""
+    return date.toordinal() - _EPOCH
+
+
+def day_label(day):
+    """ISO date of a day number (days since the epoch)."""
+    return datetime.date.fromordinal(day + _EPOCH).isoformat()
+
+
+def _positions(header, path):
+    names = [name.strip().lstrip('﻿') for name in header]
+    missing = [name for name in HEADER if name not in names]
+    if missing:
+        raise ValueError(f"{path}: not a transaction export, missing column(s) {', '.join(missing)}")
+    return [names.index(name) for name in HEADER], len(names)
+
+
+def _columns(rows, positions, width):
+    """Transpose ``rows`` into the six ``HEADER`` columns, rejoining split customer names."""
+    if set(map(len, rows)) != {width}:
+        customer = positions[2]
+        extra = [len(row) - width for row in rows]
+        rows = [row if n == 0 else row[:customer] + [','.join(row[customer:customer + n + 1])] + row[customer + n + 1:]
+                for row, n in zip(rows, extra)]
+    return [list(map(itemgetter(pos), rows)) for pos in positions]
+
+
+def _convert(ids, dates, customers, amounts, methods, statuses, dictionaries):
+    return Chunk(
+        ids,
+        _timestamps(dates),
+        dictionaries.customers.encode(customers, 'I'),
+        array('q', _decode(amounts, parse_amount)),
+        dictionaries.methods.encode(list(map(str.lower, methods))),
+        dictionaries.statuses.encode(list(map(str.lower, statuses))),
+    )
+
+
+def _csv_batches(path, chunk_rows):
+    """The header, then ``(first line, rows)`` for every ``chunk_rows`` lines of a CSV export."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        yield header
+        line = 1
+        while True:
+            raw = list(islice(reader, chunk_rows))
+            if not raw:
+                return
+            yield line + 1, [row for row in raw if row]
+            line = reader.line_num
+
+
+def _xls_cell(cell, datemode):
+    import xlrd
+
+    if cell.ctype == xlrd.XL_CELL_DATE:
+        return xlrd.xldate_as_datetime(cell.value, datemode).strftime('%Y-%m-%d %H:%M:%S')
+    if cell.ctype == xlrd.XL_CELL_NUMBER:
+        return repr(int(cell.value) if cell.value.is_integer() else cell.value)
+    return str(cell.value)
+
+
+def _xls_batches(path, chunk_rows):
+    """Like ``_csv_batches`` for the first sheet of an Excel 97 (``.xls``) export."""
+    try:
+        import xlrd
+    except ImportError:
+        raise ValueError(f'{path}: reading .xls exports needs xlrd (pip install xlrd)') from None
+    with xlrd.open_workbook(path, on_demand=True) as book:
+        sheet = book.sheet_by_index(0)
+        if not sheet.nrows:
+            return
+        yield [str(cell.value) for cell in sheet.row(0)]
+        for start in range(1, sheet.nrows, chunk_rows):
+            rows = [[_xls_cell(cell, book.datemode) for cell in sheet.row(r)]
+                    for r in range(start, min(start + chunk_rows, sheet.nrows))]
+            # Sheet rows are numbered from 1, like CSV lines.
+            yield start + 1, [row for row in rows if any(row)]
+
+
+class ExportSource:
+    """
+    Transaction exports read as ``Chunk`` s: CSV files, or ``.xls`` sheets
+    when the optional ``xlrd`` package is installed.
+
+    Rows that cannot be parsed are skipped and counted in ``skipped``; the
+    first ``MAX_ERRORS`` are kept in ``errors``.
+    """
+
+    def __init__(self, paths, chunk_rows=CHUNK_ROWS, dictionaries=None):
+        self.paths = [paths] if isinstance(paths, str) else list(paths)
+        self.chunk_rows = chunk_rows
+        self.dictionaries = dictionaries or Dictionaries()
+        self.skipped = 0
+        self.errors = []
+
+    def chunks(self):
+        for path in self.paths:
+            yield from self.read(path)
+
+    __iter__ = chunks
+
+    def read(self, path):
+        """The chunks of one export."""
+        is_xls = os.path.splitext(path)[1].lower() == '.xls'
+        batches = (_xls_batches if is_xls else _csv_batches)(path, self.chunk_rows)
+        header = next(batches, None)
+        if header is None:
+            return
+        positions, width = _positions(header, path)
+        for start, rows in batches:
+            if min(map(len, rows), default=width) < width:
+                rows = self._drop(rows, lambda row: len(row) >= width, path, start, 'too few fields')
+            if not rows:
+                continue
+            try:
+                yield _convert(*_columns(rows, positions, width), self.dictionaries)
+            except ValueError:
+                # Rare: find the bad rows one by one, convert the rest.
+                def valid(row):
+                    try:
+                        _convert(*_columns([row], positions, width), Dictionaries())
+                    except (ValueError, IndexError):
+                        return False
+                    return True
+
+                rows = self._drop(rows, valid, path, start, 'bad date or amount')
+                if rows:
+                    yield _convert(*_columns(rows, positions, width), self.dictionaries)
+
+    def _drop(self, rows, keep, path, start, message):
+        # ``start`` is the first row's line; exact for exports without embedded newlines.
+        kept = []
+        for offset, row in enumerate(rows):
+            if keep(row):
+                kept.append(row)
+                continue
+            self.skipped += 1
+            if len(self.errors) < MAX_ERRORS:
+                self.errors.append(RowError(path, start + offset, f'{message}: {",".join(row)}'))
+        return kept
+
+
+def read_exports(paths, chunk_rows=CHUNK_ROWS):
+    """An ``ExportSource`` over ``paths``; iterate it for ``Chunk`` s."""
+    return ExportSource(paths, chunk_rows)
+
+
+@dataclass
+class Pending:
+    order_id: str
+    timestamp: int
+    customer: str
+    amount: int
+    method: str
+    status: str
+
+
+@dataclass
+class Summary:
+    """
+    Aggregated transactions: the cube plus the rows to chase, kept as
+    columns until ``pending`` decodes them.
+    """
+
+    dictionaries: Dictionaries
+    cube: dict = field(default_factory=dict)
+    rows: int = 0
+    chased: list = field(default_factory=list)
+    first: int = None
+    last: int = None
+
+    @property
+    def pending_count(self):
+        return sum(map(len, self.chased))
+
+    def pending(self, limit=None):
+        """The first ``limit`` orders to chase (all by default), oldest first, as ``Pending`` rows."""
+        rows = [(ts, chunk, pos) for chunk in self.chased for pos, ts in enumerate(chunk.timestamps)]
+        rows.sort(key=itemgetter(0))
+        customers, methods, statuses = (self.dictionaries.customers.values, self.dictionaries.methods.values,
+                                        self.dictionaries.statuses.values)
+        return [Pending(chunk.order_ids[pos], ts, customers[chunk.customers[pos]], chunk.amounts[pos],
+                        methods[chunk.methods[pos]], statuses[chunk.statuses[pos]])
+                for ts, chunk, pos in rows[:limit]]
+
+    def totals(self, *dimensions):
+        """
+        ``{key: (count, centavos)}`` summed over the dimensions not named;
+        ``key`` is a tuple of the named ones (``'day'``, ``'method'``,
+        ``'status'``) with days as ISO dates and codes decoded.
+        """
+        picks = [DIMENSIONS.index(name) for name in dimensions]
+        out = {}
+        for key, (count, amount) in self.cube.items():
+            sub = tuple(key[i] for i in picks)
+            found = out.get(sub)
+            if found is None:
+                out[sub] = [count, amount]
+            else:
+                found[0] += count
+                found[1] += amount
+        decode = (day_label, self.dictionaries.methods.values.__getitem__,
+                  self.dictionaries.statuses.values.__getitem__)
+        return {tuple(decode[i](value) for i, value in zip(picks, sub)): tuple(found)
+                for sub, found in sorted(out.items())}
+
+    def by_day(self):
+        return {key[0]: value for key, value in self.totals('day').items()}
+
+    def by_method(self):
+        return {key[0]: value for key, value in self.totals('method').items()}
+
+    def by_status(self):
+        return {key[0]: value for key, value in self.totals('status').items()}
+
+    @property
+    def amount(self):
+        return sum(amount for _, amount in self.cube.values())
+
+
+def _between(timestamps, since, until):
+    mask = None
+    if since is not None:
+        mask = list(map(ge, timestamps, repeat(since)))
+    if until is not None:
+        below = map(lt, timestamps, repeat(until))
+        mask = list(below) if mask is None else list(map(min, mask, below))
+    return mask
+
+
+def _cells(chunk, lower, upper, codes):
+    """
+    ``(rows, first, last, cells, chased)`` of the rows of ``chunk`` in
+    ``[lower, upper)``: ``cells`` yields ``(packed day/method/status,
+    count, centavos)``, possibly several times per cell.
+    """
+    mask = _between(chunk.timestamps, lower, upper)
+    if mask is not None:
+        chunk = chunk.select(mask)
+    if not len(chunk):
+        return None
+    # Pack (day, method, status) into one int per row and count the
+    # distinct (cell, amount) pairs: prices repeat, so the histogram is
+    # far shorter than the chunk and the sums come from it.
+    days = map(floordiv, chunk.timestamps, repeat(DAY))
+    packed = map(or_, map(lshift, days, repeat(32)), map(or_, map(lshift, chunk.methods, repeat(16)), chunk.statuses))
+    cells = ((key, count, amount * count) for (key, amount), count in Counter(zip(packed, chunk.amounts)).items())
+    chased = None
+    if codes:
+        mask = list(map(codes.__contains__, chunk.statuses))
+        if any(mask):
+            chased = chunk.select(mask)
+    return len(chunk), min(chunk.timestamps), max(chunk.timestamps), cells, chased
+
+
+def _cells_numpy(chunk, lower, upper, codes):
+    """``_cells`` over numpy views of the columns: one sort and one ``reduceat`` per chunk."""
+    timestamps = numpy.asarray(memoryview(chunk.timestamps))
+    amounts = numpy.asarray(memoryview(chunk.amounts))
+    methods = numpy.asarray(memoryview(chunk.methods)).astype(numpy.int64)
+    statuses = numpy.asarray(memoryview(chunk.statuses))
+    keep = None
+    if lower is not None:
+        keep = timestamps >= lower
+    if upper is not None:
+        keep = timestamps < upper if keep is None else keep & (timestamps < upper)
+    if keep is not None:
+        timestamps, amounts, methods, statuses = (column[keep] for column in (timestamps, amounts, methods, statuses))
+    rows = len(timestamps)
+    if not rows:
+        return None
+    packed = (timestamps // DAY << 32) | (methods << 16) | statuses
+    order = numpy.argsort(packed, kind='stable')
+    packed = packed[order]
+    starts = numpy.flatnonzero(numpy.concatenate(([True], packed[1:] != packed[:-1])))
+    counts = numpy.diff(numpy.append(starts, rows))
+    # Integer sums, exact like the pure Python fold.
+    sums = numpy.add.reduceat(amounts[order], starts)
+    cells = zip(packed[starts].tolist(), counts.tolist(), sums.tolist())
+    chased = None
+    if codes:
+        mask = numpy.isin(statuses, sorted(codes))
+        if mask.any():
+            if keep is not None:
+                full = numpy.zeros(len(chunk), dtype=bool)
+                full[keep] = mask
+                mask = full
+            positions = numpy.flatnonzero(mask)
+            chased = Chunk(
+                _take_ids(chunk.order_ids, positions.tolist()),
+                *(array(_typecode(column), numpy.asarray(memoryview(column))[positions].tobytes())
+                  for column in (chunk.timestamps, chunk.customers, chunk.amounts, chunk.methods, chunk.statuses)))
+    return rows, int(timestamps.min()), int(timestamps.max()), cells, chased
+
+
+def summarize(source, since=None, until=None, chase=CHASE_STATUSES):
+    """
+    Fold every chunk of ``source`` into a ``Summary``.
+
+    ``since`` and ``until`` are ``datetime.date`` s bounding the period
+    (``until`` exclusive); ``chase`` names the statuses listed in
+    ``Summary.pending``. Chunks are aggregated with numpy when it is
+    installed, with ``map`` and ``Counter`` over the columns otherwise.
+    """
+    dictionaries = source.dictionaries
+    summary = Summary(dictionaries)
+    cube = summary.cube
+    lower = None if since is None else day_number(since) * DAY
+    upper = None if until is None else day_number(until) * DAY
+    fold = _cells_numpy if numpy is not None else _cells
+    for chunk in source:
+        codes = {dictionaries.statuses.find(status) for status in chase} - {None}
+        folded = fold(chunk, lower, upper, codes)
+        if folded is None:
+            continue
+        rows, first, last, cells, chased = folded
+        summary.rows += rows
+        summary.first = first if summary.first is None else min(summary.first, first)
+        summary.last = last if summary.last is None else max(summary.last, last)
+        for key, count, amount in cells:
+            cell = (key >> 32, (key >> 16) & 0xFFFF, key & 0xFFFF)
+            found = cube.get(cell)
+            if found is None:
+                cube[cell] = [count, amount]
+            else:
+                found[0] += count
+                found[1] += amount
+        if chased is not None:
+            summary.chased.append(chased)
+    return summary